@@ -1,11 +0,0 @@
-# resume_analyzer/utils/__init__.py
-
-# Core modules
-from .parser import parse_resume
-from .nlp_processing import clean_text, extract_keywords, extract_skills
-from .scoring import calculate_match_score, calculate_resume_strength
-from .validator import validate_resume_sections
-from .pdf_report import generate_pdf
-from .database import save_result
-from .llm_rewriter import llm_rewrite_skills
-from .rewrite_templates import generate_rewrite_suggestions
@@ -1,14 +1,18 @@
 # app.py
 import streamlit as st
-import json
+import hashlib
+import io
+import os
+from contextlib import nullcontext
 import plotly.express as px
 from typing import List
-from utils.analyzer import analyze_resume
-from utils.database import init_db, fetch_results
+from utils.analyzer import analyze_resume, prepare_job_description
+from utils.database import init_db, jd_hash, latest_result_id, query_results
 from utils.pdf_report import generate_pdf
-from utils.jd_library import JD_LIBRARY
+from utils.jd_library import JD_LIBRARY, JD_PROFILES
 from utils.nlp_processing import extract_skills
 from utils.parser import parse_resume
+from utils.ranking import rank_candidates
 
 
 # --------------------------------------------------
@@ -301,26 +305,69 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+# --------------------------------------------------
+# Cached Work
+# --------------------------------------------------
+# Streamlit reruns this whole script on every widget change; everything
+# expensive below runs once per process / per distinct input instead.
+@st.cache_resource
+def _init_app() -> bool:
+    init_db()
+    return True
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _parse_upload(digest: str, filename: str, _file_bytes: bytes):
+    """Parsed resume for one upload, keyed by its content hash."""
+    file = io.BytesIO(_file_bytes)
+    file.name = filename
+    return parse_resume(file)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _jd_profile(digest: str, _job_description: str):
+    """Custom JD profile, keyed by jd_hash."""
+    return prepare_job_description(_job_description)
+
+
+@st.cache_data(show_spinner=False, ttl=60, max_entries=64)
+def _history_page(cursor, version: int):
+    """One history page; `version` (newest result id) changes on any new save."""
+    return query_results(
+        columns=("score", "matched_skills", "missing_skills"),
+        limit=10,
+        after=cursor
+    )
+
+
 # --------------------------------------------------
 # Initialize
 # --------------------------------------------------
-init_db()
+_init_app()
 st.session_state.setdefault("parsed_resume", None)
 st.session_state.setdefault("result", None)
+st.session_state.setdefault("result_key", None)
 
 
 # --------------------------------------------------
 # Sidebar – Past Analysis
 # --------------------------------------------------
 with st.sidebar.expander("📊 Past Analysis"):
-    rows = fetch_results(limit=10)
+    st.session_state.setdefault("history_pages", [None])
+    rows: List[dict] = []
+    next_cursor = None
+    history_version = latest_result_id()  # one indexed MAX(id) per rerun
+    for cursor in st.session_state.history_pages:
+        page, next_cursor = _history_page(cursor, history_version)
+        rows.extend(page)
+
     if not rows:
         st.info("No past results.")
     else:
         for r in rows:
-            _, _, _, score, matched_json, missing_json, _ = r
-            matched = json.loads(matched_json or "[]")
-            missing = json.loads(missing_json or "[]")
+            score = r["score"] or 0
+            matched = r["matched_skills"]
+            missing = r["missing_skills"]
             badge = "🟢" if score >= 80 else "🟡" if score >= 60 else "🔴"
             st.markdown(f"""
 **{badge} {score}%**  
@@ -328,6 +375,9 @@ Matched: {", ".join(matched) or "None"}
 Missing: {", ".join(missing) or "None"}  
 ---
 """)
+        if next_cursor is not None and st.button("Show older results"):
+            st.session_state.history_pages.append(next_cursor)
+            st.rerun()
 
 # --------------------------------------------------
 # Resume Upload
@@ -338,10 +388,19 @@ uploaded_resume = st.file_uploader(
     type=["pdf", "docx"]
 )
 
+resume_digest = None
+candidate_name = "Candidate"
+
 if uploaded_resume is not None:
+    candidate_name = st.text_input(
+        "Candidate name",
+        value=os.path.splitext(uploaded_resume.name)[0]
+    ).strip() or "Candidate"
+    file_bytes = uploaded_resume.getvalue()
+    resume_digest = hashlib.sha256(file_bytes).hexdigest()
     with st.spinner("Parsing resume..."):
         try:
-            parsed = parse_resume(uploaded_resume)
+            parsed = _parse_upload(resume_digest, uploaded_resume.name, file_bytes)
         except Exception as e:
             parsed = None
 
@@ -397,16 +456,24 @@ jd_mode = st.radio(
 )
 
 job_description = ""
+jd_profile = None
 
 if jd_mode == "📋 Predefined Role":
     role = st.selectbox("Choose Role", list(JD_LIBRARY.keys()))
     job_description = JD_LIBRARY.get(role, "")
+    jd_profile = JD_PROFILES.get(role)
 
 elif jd_mode == "🌐 Universal Check":
     job_description = JD_LIBRARY.get("Universal Resume Check", "")
+    jd_profile = JD_PROFILES.get("Universal Resume Check")
 
 else:
     job_description = st.text_area("Paste Job Description", height=220)
+    if job_description.strip():
+        try:
+            jd_profile = _jd_profile(jd_hash(job_description), job_description)
+        except ValueError:
+            jd_profile = None  # analyze_resume reports the error
 
 st.text_area(
     "Active Job Description",
@@ -416,6 +483,25 @@ st.text_area(
 )
 
 
+# --------------------------------------------------
+# Sidebar – Top Candidates for this JD
+# --------------------------------------------------
+with st.sidebar.expander("🏆 Top Candidates for this JD"):
+    if not job_description.strip():
+        st.info("Choose or paste a job description first.")
+    elif st.button("Rank stored candidates"):
+        ranked = rank_candidates(job_description, k=10, jd_profile=jd_profile)
+        if not ranked:
+            st.info("No stored candidates yet.")
+        for i, c in enumerate(ranked, start=1):
+            st.markdown(f"""
+**{i}. {c["candidate"]} – {c["match_score"]}%**  
+Strength: {c["resume_strength"]} · Core coverage: {int(c["core_coverage"] * 100)}%  
+Missing: {", ".join(c["missing_skills"]) or "None"}  
+---
+""")
+
+
 # --------------------------------------------------
 # Skill Heatmap Function
 # --------------------------------------------------
@@ -452,17 +538,26 @@ def plot_skill_heatmap(matched: List[str], missing: List[str]):
 # --------------------------------------------------
 # Analyze Button
 # --------------------------------------------------
-analyze_disabled = not uploaded_resume or not job_description.strip()
+parsed_resume = st.session_state.get("parsed_resume")
+analyze_disabled = not uploaded_resume or not parsed_resume or not job_description.strip()
 
 if st.button("🔍 Analyze Resume", disabled=analyze_disabled):
-    with st.spinner("Running ATS analysis..."):
-        try:
-            st.session_state.result = analyze_resume(
-                resume_file=uploaded_resume,
-                job_description=job_description
-            )
-        except Exception as e:
-            st.error(f"❌ Analysis failed: {e}")
+    # Same resume + JD + name: keep the result already on screen
+    result_key = (resume_digest, jd_hash(job_description), candidate_name)
+    if result_key != st.session_state.result_key or not st.session_state.result:
+        with st.spinner("Running ATS analysis..."):
+            try:
+                st.session_state.result = analyze_resume(
+                    resume_file=uploaded_resume,
+                    job_description=job_description,
+                    candidate_name=candidate_name,
+                    jd_profile=jd_profile,
+                    async_rewrites=True,
+                    resume_data=parsed_resume
+                )
+                st.session_state.result_key = result_key
+            except Exception as e:
+                st.error(f"❌ Analysis failed: {e}")
 
 
 # --------------------------------------------------
@@ -533,16 +628,9 @@ if result:
     # ---------------------------
     # Rewrite Suggestions
     # ---------------------------
-    rewrite_suggestions = result.get("rewrite_suggestions", [])
-
-    if rewrite_suggestions:
-        st.markdown("## ✍️ Resume Rewrite Suggestions")
-        for suggestion in rewrite_suggestions:
-            st.markdown(
-                f"**{suggestion.get('skill')}** "
-                f"({suggestion.get('recommended_section', 'Experience / Projects')})"
-            )
-            st.markdown(f"- {suggestion.get('suggested_rewrite', '')}")
+    # Generated in the background; reserve the slot now and fill it in
+    # after everything else on the page has rendered.
+    rewrite_slot = st.container()
 
     # ---------------------------
     # PDF Export
@@ -566,3 +654,21 @@ if result:
 
     except Exception as e:
         st.error(f"❌ PDF generation failed: {e}")
+
+    # ---------------------------
+    # Rewrite Suggestions (streamed)
+    # ---------------------------
+    rewrite_stream = result.get("rewrite_stream")
+    rewrite_suggestions = rewrite_stream or result.get("rewrite_suggestions", [])
+
+    if missing_skills or result.get("rewrite_suggestions"):
+        with rewrite_slot:
+            st.markdown("## ✍️ Resume Rewrite Suggestions")
+            pending = rewrite_stream is not None and not rewrite_stream.done
+            with st.spinner("Generating rewrite suggestions...") if pending else nullcontext():
+                for suggestion in rewrite_suggestions:
+                    st.markdown(
+                        f"**{suggestion.get('skill')}** "
+                        f"({suggestion.get('recommended_section', 'Experience / Projects')})"
+                    )
+                    st.markdown(f"- {suggestion.get('suggested_rewrite', '')}")
@@ -0,0 +1,141 @@
+# benchmarks/bench_imports.py
+
+"""
+Cold-start import time of the utils modules, via python -X importtime.
+
+Each target is imported in a fresh interpreter (best of -n runs). The
+report shows the cumulative import time, the slowest dependencies pulled
+in, and fails if a module eagerly imports a heavy dependency it should
+only load on first use (see utils/lazy.py).
+
+Usage:
+    python benchmarks/bench_imports.py
+    python benchmarks/bench_imports.py utils.scoring utils.analyzer -n 10
+    python benchmarks/bench_imports.py --save benchmarks/imports_baseline.json
+    python benchmarks/bench_imports.py --compare benchmarks/imports_baseline.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+
+TARGETS = [
+    "utils.scoring",
+    "utils.nlp_processing",
+    "utils.database",
+    "utils.parser",
+    "utils.llm_rewriter",
+    "utils.analyzer",
+]
+
+# Must not be imported just by importing a utils module
+HEAVY = ("fitz", "pymupdf", "pdfplumber", "docx", "pytesseract", "pdf2image", "gpt4all")
+
+
+def import_times(module: str) -> Dict[str, float]:
+    """{module: cumulative microseconds} for one cold `import module`."""
+    env = dict(os.environ, PYTHONPATH=str(ROOT), PYTHONDONTWRITEBYTECODE="1")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, env=env, capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr.strip()[-2000:]}")
+
+    times: Dict[str, float] = {}
+    for line in proc.stderr.splitlines():
+        # "import time:  self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = float(cumulative)
+    return times
+
+
+def bench(module: str, repeat: int) -> Dict[str, object]:
+    runs = [import_times(module) for _ in range(repeat)]
+    best = min(runs, key=lambda t: t.get(module, 0.0))
+
+    dependencies = sorted(
+        ((name, us) for name, us in best.items() if name != module and "." not in name),
+        key=lambda e: e[1], reverse=True
+    )
+    return {
+        "total_ms": round(best.get(module, 0.0) / 1000, 2),
+        "heavy_loaded": sorted(name for name in HEAVY if name in best),
+        "top_dependencies": [(name, round(us / 1000, 2)) for name, us in dependencies[:5]],
+    }
+
+
+def print_report(report) -> None:
+    print(f"{'module':<24} {'import ms':>10}  slowest top-level dependencies")
+    for module, entry in report.items():
+        deps = ", ".join(f"{name} {ms}" for name, ms in entry["top_dependencies"][:3])
+        print(f"{module:<24} {entry['total_ms']:>10.2f}  {deps}")
+        if entry["heavy_loaded"]:
+            print(f"  << eagerly imports: {', '.join(entry['heavy_loaded'])}")
+
+
+def compare(report, baseline, threshold: float) -> int:
+    """Print deltas against a saved baseline; returns the regression count."""
+    regressions = 0
+    print(f"\nComparison with baseline ({baseline['meta'].get('created', '?')}), "
+          f"threshold +{threshold:.0%}:")
+    for module, entry in report.items():
+        old = baseline["results"].get(module, {}).get("total_ms")
+        if not old:
+            continue
+        change = (entry["total_ms"] - old) / old
+        flag = ""
+        # Ignore a few milliseconds of noise on tiny modules
+        if change > threshold and entry["total_ms"] - old > 5:
+            flag = "  << REGRESSION"
+            regressions += 1
+        print(f"  {module:<24} {old:>8.2f} -> {entry['total_ms']:>8.2f} ms ({change:+.0%}){flag}")
+    return regressions
+
+
+def main(argv: List[str] = None):
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("modules", nargs="*", default=TARGETS)
+    ap.add_argument("-n", "--repeat", type=int, default=5)
+    ap.add_argument("--save", type=Path, help="Write results as a JSON baseline")
+    ap.add_argument("--compare", type=Path, help="Compare against a JSON baseline")
+    ap.add_argument("--threshold", type=float, default=0.3,
+                    help="Relative slowdown counted as a regression (default 0.3)")
+    args = ap.parse_args(argv)
+
+    report = {module: bench(module, args.repeat) for module in args.modules}
+    print_report(report)
+
+    if args.save:
+        args.save.parent.mkdir(parents=True, exist_ok=True)
+        args.save.write_text(json.dumps({
+            "meta": {
+                "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+            },
+            "results": report,
+        }, indent=2))
+        print(f"\nBaseline written to {args.save}")
+
+    failed = any(entry["heavy_loaded"] for entry in report.values())
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        failed = compare(report, baseline, args.threshold) > 0 or failed
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# benchmarks/bench_pdf_engines.py
+
+"""
+Compare PDF extraction engines (PyMuPDF, pdfplumber, OCR).
+
+Usage:
+    python benchmarks/bench_pdf_engines.py                 # data/*.pdf, ./*.pdf
+    python benchmarks/bench_pdf_engines.py a.pdf b.pdf -n 10
+"""
+
+import argparse
+import io
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from utils.parser import PDF_ENGINES, PDF_EXTRACTORS  # noqa: E402
+
+
+def bench_file(path: Path, engines, repeat: int):
+    pdf_bytes = path.read_bytes()
+    rows = []
+
+    for engine in engines:
+        extractor = PDF_EXTRACTORS[engine]
+        times = []
+        chars = 0
+
+        for _ in range(repeat):
+            start = time.perf_counter()
+            try:
+                text = "\n".join(extractor(io.BytesIO(pdf_bytes))["pages"])
+            except Exception as e:
+                text = ""
+                print(f"[WARN] {engine} failed on {path.name}: {e}")
+            times.append(time.perf_counter() - start)
+            chars = len(text)
+
+        rows.append((engine, statistics.median(times), min(times), chars))
+
+    return rows
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("pdfs", nargs="*", type=Path)
+    ap.add_argument("-n", "--repeat", type=int, default=5)
+    ap.add_argument("-e", "--engines", nargs="+", default=list(PDF_ENGINES),
+                    choices=list(PDF_EXTRACTORS))
+    args = ap.parse_args()
+
+    pdfs = args.pdfs or sorted((ROOT / "data").glob("*.pdf")) + sorted(ROOT.glob("*.pdf"))
+    pdfs = [p for p in pdfs if p.is_file() and p.stat().st_size > 0]
+    if not pdfs:
+        print("No non-empty PDFs to benchmark.")
+        return
+
+    print(f"{'file':<32} {'engine':<11} {'median ms':>10} {'min ms':>9} {'chars':>7}")
+    for path in pdfs:
+        for engine, median, best, chars in bench_file(path, args.engines, args.repeat):
+            print(f"{path.name[:32]:<32} {engine:<11} {median * 1000:>10.2f} "
+                  f"{best * 1000:>9.2f} {chars:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,354 @@
+# benchmarks/bench_pipeline.py
+
+"""
+End-to-end benchmark for analyze_resume, broken down by pipeline stage.
+
+Generates synthetic resumes (text PDF, DOCX, scanned-image PDF) at several
+page counts plus a Required/Preferred JD, runs each through the full
+pipeline and reports per-stage p50/p95 latency, throughput and peak RSS.
+data/sample_resume.pdf is included when it is non-empty.
+
+Usage:
+    python benchmarks/bench_pipeline.py                       # defaults
+    python benchmarks/bench_pipeline.py -n 20 -p 1 3 --kinds pdf docx
+    python benchmarks/bench_pipeline.py --save benchmarks/baseline.json
+    python benchmarks/bench_pipeline.py --compare benchmarks/baseline.json
+
+Parse and rewrite caches are bypassed unless --cache is given. Caches and
+the results database live in a temporary directory that is removed at the
+end, so a run never touches the user's own cache or database.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import resource
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+# Must happen before utils is imported: both paths are read at import time
+_TMP = Path(tempfile.mkdtemp(prefix="bench_pipeline_"))
+os.environ["RESUME_ANALYZER_CACHE_DIR"] = str(_TMP / "cache")
+os.environ["RESUME_ANALYZER_DB"] = str(_TMP / "bench.db")
+
+from utils import analyzer, database  # noqa: E402
+from utils.taxonomy import get_taxonomy  # noqa: E402
+
+KINDS = ("pdf", "docx", "scan")
+
+# analyze_resume stage -> module-level function it calls in utils.analyzer
+STAGES = {
+    "parse": "parse_resume",
+    "clean": "clean_text",
+    "extract": "extract_skills",
+    "score": "calculate_match_score",
+    "strength": "calculate_resume_strength",
+    "validate": "validate_resume_sections",
+    "roadmap": "generate_skill_gap_roadmap",
+    "rewrite": "llm_rewrite_skills",
+    "db_save": "save_result",
+}
+
+FILLER = (
+    "Designed, built and operated production services, collaborating with product "
+    "and design to ship features on a weekly cadence while keeping reliability high. "
+)
+
+
+# --------------------------------------------------
+# Synthetic Inputs
+# --------------------------------------------------
+def synthetic_jd(rng: random.Random) -> str:
+    vocabulary = get_taxonomy().vocabulary
+    required = rng.sample(vocabulary, 8)
+    preferred = rng.sample([s for s in vocabulary if s not in required], 4)
+    return (
+        "Required Skills:\n- " + ", ".join(required) + "\n"
+        "Preferred:\n- " + ", ".join(preferred) + "\n"
+    )
+
+
+def synthetic_resume_lines(rng: random.Random, pages: int):
+    vocabulary = get_taxonomy().vocabulary
+    yield "Jordan Example - Software Engineer"
+    yield "Summary"
+    yield "Engineer with hands-on experience across backend, data and cloud work."
+    yield "Skills"
+    yield ", ".join(rng.sample(vocabulary, 15))
+    yield "Education"
+    yield "B.Sc. Computer Science, Example University"
+    yield "Projects"
+    yield "Resume analyzer built with " + ", ".join(rng.sample(vocabulary, 3)) + "."
+    yield "Experience"
+    # ~40 lines of body text per page
+    for i in range(pages * 40):
+        skill = vocabulary[i % len(vocabulary)]
+        yield f"- Used {skill} to deliver results. " + FILLER[: rng.randint(60, len(FILLER))]
+
+
+def make_pdf(path: Path, lines) -> Path:
+    from fpdf import FPDF
+
+    pdf = FPDF()
+    pdf.set_auto_page_break(True, margin=15)
+    pdf.add_page()
+    pdf.set_font("Helvetica", size=10)
+    for line in lines:
+        pdf.multi_cell(0, 5, line)
+    pdf.output(str(path))
+    return path
+
+
+def make_docx(path: Path, lines) -> Path:
+    from docx import Document
+
+    doc = Document()
+    for line in lines:
+        doc.add_paragraph(line)
+    doc.save(str(path))
+    return path
+
+
+def make_scanned_pdf(path: Path, lines, pages: int) -> Path:
+    """Text rendered to images, one image per page: no text layer at all."""
+    from fpdf import FPDF
+    from PIL import Image, ImageDraw
+
+    lines = list(lines)
+    per_page = max(1, -(-len(lines) // pages))
+    pdf = FPDF()
+    for page in range(pages):
+        image = Image.new("L", (1240, 1754), 255)  # A4 @ 150 dpi
+        draw = ImageDraw.Draw(image)
+        for row, line in enumerate(lines[page * per_page:(page + 1) * per_page]):
+            draw.text((60, 60 + row * 26), line[:110], fill=0)
+        image_path = path.with_suffix(f".{page}.png")
+        image.save(image_path)
+        pdf.add_page()
+        pdf.image(str(image_path), 0, 0, 210, 297)
+    pdf.output(str(path))
+    return path
+
+
+def build_corpus(kinds, page_counts, seed: int):
+    rng = random.Random(seed)
+    corpus = []
+    for kind in kinds:
+        for pages in page_counts:
+            lines = list(synthetic_resume_lines(rng, pages))
+            path = _TMP / f"{kind}_{pages}p.{'docx' if kind == 'docx' else 'pdf'}"
+            try:
+                if kind == "pdf":
+                    make_pdf(path, lines)
+                elif kind == "docx":
+                    make_docx(path, lines)
+                else:
+                    make_scanned_pdf(path, lines, pages)
+            except ImportError as e:
+                print(f"[WARN] skipping {kind}: {e}")
+                break
+            corpus.append((f"{kind}/{pages}p", path))
+
+    sample = ROOT / "data" / "sample_resume.pdf"
+    if sample.is_file() and sample.stat().st_size > 0:
+        corpus.append(("sample_resume.pdf", sample))
+
+    return corpus, synthetic_jd(rng)
+
+
+# --------------------------------------------------
+# Stage Timing
+# --------------------------------------------------
+@contextmanager
+def stage_timers(use_cache: bool):
+    """Wrap the analyzer's stage functions; collect per-call durations."""
+    originals = {name: getattr(analyzer, name) for name in STAGES.values()}
+    current = {}
+
+    def wrap(stage, fn):
+        def timed(*args, **kwargs):
+            if fn is originals["parse_resume"] and not use_cache:
+                kwargs.setdefault("use_cache", False)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                current[stage] = current.get(stage, 0.0) + time.perf_counter() - start
+        return timed
+
+    for stage, name in STAGES.items():
+        setattr(analyzer, name, wrap(stage, originals[name]))
+    try:
+        yield current
+    finally:
+        for name, fn in originals.items():
+            setattr(analyzer, name, fn)
+
+
+def percentile(values, q: float) -> float:
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[int(q) - 1]
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run(corpus, jd: str, repeat: int, warmup: int, use_cache: bool):
+    if not use_cache:
+        from utils import llm_rewriter
+        llm_rewriter.REWRITE_CACHE.clear()
+
+    database.init_db()
+    jd_profile = analyzer.prepare_job_description(jd)
+    report = {}
+
+    for label, path in corpus:
+        samples = defaultdict(list)
+        errors = 0
+        wall = 0.0
+
+        with stage_timers(use_cache) as current:
+            for i in range(warmup + repeat):
+                current.clear()
+                start = time.perf_counter()
+                try:
+                    analyzer.analyze_resume(str(path), jd, jd_profile=jd_profile)
+                except Exception as e:
+                    errors += 1
+                    if errors == 1:
+                        print(f"[WARN] {label}: {e}")
+                    continue
+                elapsed = time.perf_counter() - start
+                if i < warmup:
+                    continue
+                wall += elapsed
+                samples["total"].append(elapsed)
+                for stage, seconds in current.items():
+                    samples[stage].append(seconds)
+
+        flush_start = time.perf_counter()
+        database.flush()
+        runs = len(samples["total"])
+
+        report[label] = {
+            "runs": runs,
+            "errors": errors,
+            "throughput_per_s": round(runs / wall, 2) if wall else 0.0,
+            "db_flush_ms": round((time.perf_counter() - flush_start) * 1000, 3),
+            "peak_rss_mb": round(peak_rss_mb(), 1),
+            "stages": {
+                stage: {
+                    "p50_ms": round(percentile(values, 50) * 1000, 3),
+                    "p95_ms": round(percentile(values, 95) * 1000, 3),
+                }
+                for stage, values in samples.items() if values
+            },
+        }
+
+    return report
+
+
+# --------------------------------------------------
+# Output
+# --------------------------------------------------
+def print_report(report) -> None:
+    stages = ["total"] + list(STAGES)
+    for label, entry in report.items():
+        print(f"\n{label}: {entry['runs']} runs, {entry['errors']} errors, "
+              f"{entry['throughput_per_s']} resumes/s, peak RSS {entry['peak_rss_mb']} MB")
+        if not entry["stages"]:
+            continue
+        print(f"  {'stage':<10} {'p50 ms':>10} {'p95 ms':>10}")
+        for stage in stages:
+            if stage in entry["stages"]:
+                s = entry["stages"][stage]
+                print(f"  {stage:<10} {s['p50_ms']:>10.3f} {s['p95_ms']:>10.3f}")
+
+
+def compare(report, baseline, threshold: float) -> int:
+    """Print p50 deltas against a saved baseline; returns the regression count."""
+    regressions = 0
+    print(f"\nComparison with baseline ({baseline['meta'].get('created', '?')}), "
+          f"threshold +{threshold:.0%}:")
+    for label, entry in report.items():
+        base = baseline["results"].get(label)
+        if not base:
+            continue
+        for stage, s in entry["stages"].items():
+            old = base["stages"].get(stage, {}).get("p50_ms")
+            if not old:
+                continue
+            change = (s["p50_ms"] - old) / old
+            flag = ""
+            # Ignore sub-millisecond noise
+            if change > threshold and s["p50_ms"] - old > 0.5:
+                flag = "  << REGRESSION"
+                regressions += 1
+            print(f"  {label:<20} {stage:<10} {old:>10.3f} -> {s['p50_ms']:>10.3f} ms "
+                  f"({change:+.0%}){flag}")
+    return regressions
+
+
+def main():
+    try:
+        _main()
+    finally:
+        database.flush(10.0)
+        database.get_pool().close_all()
+        shutil.rmtree(_TMP, ignore_errors=True)
+
+
+def _main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("-n", "--repeat", type=int, default=10)
+    ap.add_argument("--warmup", type=int, default=1)
+    ap.add_argument("-p", "--pages", type=int, nargs="+", default=[1, 3, 10])
+    ap.add_argument("--kinds", nargs="+", default=list(KINDS), choices=KINDS)
+    ap.add_argument("--seed", type=int, default=42)
+    ap.add_argument("--cache", action="store_true", help="Keep parse/rewrite caches enabled")
+    ap.add_argument("--save", type=Path, help="Write results as a JSON baseline")
+    ap.add_argument("--compare", type=Path, help="Compare against a JSON baseline")
+    ap.add_argument("--threshold", type=float, default=0.2,
+                    help="Relative p50 slowdown counted as a regression (default 0.2)")
+    args = ap.parse_args()
+
+    corpus, jd = build_corpus(args.kinds, args.pages, args.seed)
+    report = run(corpus, jd, args.repeat, args.warmup, args.cache)
+    print_report(report)
+
+    if args.save:
+        args.save.parent.mkdir(parents=True, exist_ok=True)
+        args.save.write_text(json.dumps({
+            "meta": {
+                "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "args": {k: v for k, v in vars(args).items() if k not in ("save", "compare")},
+            },
+            "results": report,
+        }, indent=2, default=str))
+        print(f"\nBaseline written to {args.save}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        if compare(report, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
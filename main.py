@@ -1,102 +1,339 @@
-# resume_analyzer/main.py
+# main.py
 
 """
-CLI entry point for testing core Resume Analyzer logic
-(without Streamlit UI).
+CLI entry point for the Resume Analyzer (without Streamlit UI).
 
-Useful for:
-- Debugging
-- Unit testing
-- Validating core logic
+Analyzes one resume, or a whole batch, against a job description:
+
+    python main.py resume.pdf --role "Software Engineer"
+    python main.py resumes/ --jd-file jd.txt -o results.jsonl
+    python main.py "inbox/*.pdf" batch.zip --role "Data Scientist" -o results.csv
+
+Inputs may be files, directories (searched recursively), glob patterns
+or ZIP archives (members are extracted one at a time, as workers need
+them). Files are parsed in parallel worker processes and analyzed as
+they finish; every result is appended to the output file (JSONL or CSV,
+by extension) straight away, and each success recorded in a checkpoint
+file. Re-running the same command after an interruption skips everything
+already in the checkpoint and retries files that failed.
 """
 
+import argparse
+import csv
+import glob
+import json
+import shutil
+import sys
+import tempfile
+import zipfile
 from pathlib import Path
-from resume_analyzer.utils import analyze_resume
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
+from utils.analyzer import analyze_resume, prepare_job_description
+from utils.batch_parser import DEFAULT_TIMEOUT, SUPPORTED_EXTENSIONS, collect_resume_files, parse_resumes_parallel
+from utils.jd_library import JD_LIBRARY, JD_PROFILES
 
-def main():
-    resume_file_path = Path("examples/sample_resume.pdf")
-    job_description_path = Path("examples/sample_jd.txt")
+CSV_FIELDS = [
+    "source", "candidate", "match_score", "weighted_score", "resume_strength",
+    "matched_skills", "missing_skills", "core_missing", "error"
+]
 
-    print("📄 Running Resume Analyzer (CLI mode)\n")
 
-    if not resume_file_path.exists():
-        print("❌ Resume file not found:", resume_file_path)
-        return
+# --------------------------------------------------
+# Input Collection
+# --------------------------------------------------
+# (source id, file path or ZIP archive path, ZIP member name or None)
+Source = Tuple[str, str, Optional[str]]
+
+
+def _zip_members(archive: Path) -> Iterator[Source]:
+    """Supported members of an archive; reads the directory only, extracts nothing."""
+    with zipfile.ZipFile(archive) as zf:
+        for member in zf.infolist():
+            name = member.filename
+            if member.is_dir() or Path(name).suffix.lower() not in SUPPORTED_EXTENSIONS:
+                continue
+            yield f"{archive}::{name}", str(archive), name
 
-    if not job_description_path.exists():
-        print("❌ Job description file not found:", job_description_path)
-        return
 
+def collect_inputs(inputs: List[str]) -> List[Source]:
+    """Expand files, directories, globs and ZIPs into sources (nothing is extracted yet)."""
+    sources: List[Source] = []
+
+    for item in inputs:
+        matches = sorted(glob.glob(item, recursive=True)) if glob.has_magic(item) else [item]
+        for match in matches:
+            path = Path(match)
+            if path.suffix.lower() == ".zip" and path.is_file():
+                sources.extend(_zip_members(path))
+            elif path.is_dir():
+                sources.extend((p, p, None) for p in collect_resume_files(path))
+            elif path.suffix.lower() in SUPPORTED_EXTENSIONS and path.is_file():
+                sources.append((str(path), str(path), None))
+            else:
+                print(f"⚠️ Skipping unsupported input: {match}", file=sys.stderr)
+
+    # Same file named twice (e.g. dir + glob) is analyzed once
+    return list(dict.fromkeys(sources))
+
+
+def materialize(sources: List[Source], workdir: Path, source_of: Dict[str, str]) -> Iterator[str]:
+    """
+    Yield a readable path per source, extracting ZIP members only when
+    the consumer asks for them; records path -> source id in source_of.
+    """
+    archives: Dict[str, zipfile.ZipFile] = {}
     try:
-        # Read Job Description
-        job_description = job_description_path.read_text(encoding="utf-8")
+        for i, (source, path, member) in enumerate(sources):
+            if member is not None:
+                zf = archives.get(path)
+                if zf is None:
+                    zf = archives[path] = zipfile.ZipFile(path)
+                # Never trust archive paths: flatten into the work dir
+                dest = workdir / f"{i}_{Path(member).name}"
+                with zf.open(member) as src, open(dest, "wb") as out:
+                    shutil.copyfileobj(src, out)
+                path = str(dest)
+            source_of[path] = source
+            yield path
+    finally:
+        for zf in archives.values():
+            zf.close()
 
-        # Open resume as binary (same as Streamlit uploader)
-        with resume_file_path.open("rb") as resume_file:
-            result = analyze_resume(
-                resume_file=resume_file,
-                job_description=job_description,
-                candidate_name="CLI Candidate"
-            )
 
-        if not result:
-            print("❌ Analysis failed. No result returned.")
-            return
-
-        # ---------------------------
-        # Output Results
-        # ---------------------------
-        print(f"\n✅ Match Score: {result.get('match_score', 0)}%")
-        print(f"💪 Resume Strength: {result.get('resume_strength', 0)}%\n")
-
-        # Matched Skills
-        matched_skills = result.get("matched_skills", [])
-        print("🧠 Matched Skills:")
-        if matched_skills:
-            for skill in matched_skills:
-                print(f"  ✔ {skill}")
-        else:
-            print("  None")
-
-        # Missing Skills
-        missing_skills = result.get("missing_skills", [])
-        print("\n❌ Missing Skills:")
-        if missing_skills:
-            for skill in missing_skills:
-                print(f"  ✖ {skill}")
-        else:
-            print("  None")
-
-        # Resume Sections
-        sections = result.get("sections", {})
-        print("\n📌 Resume Sections:")
-        if sections:
-            for section, present in sections.items():
-                status = "✔" if present else "✖"
-                print(f"  {status} {section.title()}")
-        else:
-            print("  No sections detected")
-
-        # Feedback
-        feedback = result.get("feedback", [])
-        print("\n🛠 Feedback:")
-        if feedback:
-            for tip in feedback:
-                print(f"  • {tip}")
-        else:
-            print("  No feedback generated")
+# --------------------------------------------------
+# Checkpointed Output
+# --------------------------------------------------
+def load_checkpoint(path: Path) -> Set[str]:
+    if not path.exists():
+        return set()
+    return {line.rstrip("\n") for line in path.open(encoding="utf-8") if line.strip()}
+
+
+class ResultWriter:
+    """
+    Appends one row per resume; successes are checkpointed once on disk.
+    Failures are not, so the next run retries them (and appends a new row).
+    """
+
+    def __init__(self, output: Path, checkpoint: Path):
+        self.csv = output.suffix.lower() == ".csv"
+        is_new = not output.exists() or output.stat().st_size == 0
+
+        self._out = output.open("a", encoding="utf-8", newline="")
+        self._checkpoint = checkpoint.open("a", encoding="utf-8")
 
-        # PDF report
-        pdf_path = result.get("pdf_path")
-        if pdf_path:
-            print(f"\n📄 PDF Report Generated: {pdf_path}")
+        if self.csv:
+            self._csv = csv.DictWriter(self._out, fieldnames=CSV_FIELDS, extrasaction="ignore")
+            if is_new:
+                self._csv.writeheader()
+
+    def write(self, source: str, row: Dict[str, Any]) -> None:
+        if self.csv:
+            self._csv.writerow({
+                k: ";".join(v) if isinstance(v, list) else v
+                for k, v in row.items()
+            })
         else:
-            print("\n❌ PDF report not generated")
+            self._out.write(json.dumps(row, ensure_ascii=False) + "\n")
+        self._out.flush()
+
+        # Checkpoint only after the row itself is written
+        if not row.get("error"):
+            self._checkpoint.write(source + "\n")
+            self._checkpoint.flush()
+
+    def close(self) -> None:
+        self._out.close()
+        self._checkpoint.close()
+
+
+def _row(source: str, candidate: str, result: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "source": source,
+        "candidate": candidate,
+        "match_score": result.get("match_score"),
+        "weighted_score": result.get("weighted_score"),
+        "resume_strength": result.get("resume_strength"),
+        "matched_skills": result.get("matched_skills", []),
+        "missing_skills": result.get("missing_skills", []),
+        "core_missing": result.get("core_missing", []),
+        "error": result.get("error")
+    }
+
+
+# --------------------------------------------------
+# Batch Run
+# --------------------------------------------------
+def run_batch(args, jd_profile: Dict[str, Any], sources: List[Source], workdir: Path) -> None:
+    output = Path(args.output)
+    checkpoint = Path(args.checkpoint or f"{args.output}.checkpoint")
+
+    if args.restart:
+        for path in (output, checkpoint):
+            if path.exists():
+                path.unlink()
+
+    done = load_checkpoint(checkpoint)
+    todo = [entry for entry in sources if entry[0] not in done]
+    print(f"📄 {len(sources)} resume(s), {len(sources) - len(todo)} already done, "
+          f"{len(todo)} to analyze → {output}")
+    if not todo:
+        return
+
+    source_of: Dict[str, str] = {}
+    writer = ResultWriter(output, checkpoint)
+    ok = failed = 0
+
+    try:
+        records = parse_resumes_parallel(
+            materialize(todo, workdir, source_of),
+            max_workers=args.workers,
+            timeout=args.timeout,
+            ordered=False
+        )
+        for record in records:
+            source = source_of[record["path"]]
+            candidate = Path(source.split("::")[-1]).stem
+
+            if record["error"]:
+                result = {"error": record["error"]}
+            else:
+                try:
+                    result = analyze_resume(
+                        resume_file=record["path"],
+                        job_description=jd_profile["text"],
+                        candidate_name=candidate,
+                        jd_profile=jd_profile,
+                        resume_data=record["resume"]
+                    )
+                except Exception as e:
+                    result = {"error": str(e)}
+
+            writer.write(source, _row(source, candidate, result))
+            if Path(record["path"]).parent == workdir:
+                Path(record["path"]).unlink(missing_ok=True)  # extracted ZIP member
+            if result.get("error"):
+                failed += 1
+                print(f"  ✖ {source}: {result['error']}")
+            else:
+                ok += 1
+                print(f"  ✔ {source}: {result.get('match_score', 0)}%")
+    finally:
+        writer.close()
+
+    print(f"\n✅ {ok} analyzed, {failed} failed")
+
+
+# --------------------------------------------------
+# Single Resume Report
+# --------------------------------------------------
+def print_report(result: Dict[str, Any]) -> None:
+    print(f"\n✅ Match Score: {result.get('match_score', 0)}%")
+    print(f"💪 Resume Strength: {result.get('resume_strength', 0)}%\n")
+
+    # Matched Skills
+    matched_skills = result.get("matched_skills", [])
+    print("🧠 Matched Skills:")
+    if matched_skills:
+        for skill in matched_skills:
+            print(f"  ✔ {skill}")
+    else:
+        print("  None")
+
+    # Missing Skills
+    missing_skills = result.get("missing_skills", [])
+    print("\n❌ Missing Skills:")
+    if missing_skills:
+        for skill in missing_skills:
+            print(f"  ✖ {skill}")
+    else:
+        print("  None")
+
+    # Resume Sections
+    sections = result.get("sections", {})
+    print("\n📌 Resume Sections:")
+    if sections:
+        for section, present in sections.items():
+            status = "✔" if present else "✖"
+            print(f"  {status} {section.title()}")
+    else:
+        print("  No sections detected")
+
+    # Feedback
+    feedback = result.get("feedback", [])
+    print("\n🛠 Feedback:")
+    if feedback:
+        for tip in feedback:
+            print(f"  • {tip}")
+    else:
+        print("  No feedback generated")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Resume Analyzer (CLI mode)")
+    ap.add_argument("inputs", nargs="+",
+                    help="Resume files, directories, glob patterns or ZIP archives")
+    jd = ap.add_mutually_exclusive_group(required=True)
+    jd.add_argument("--jd-file", type=Path, help="Job description text file")
+    jd.add_argument("--role", choices=list(JD_LIBRARY), help="Predefined JD_LIBRARY role")
+    ap.add_argument("-o", "--output",
+                    help="Results file (.jsonl or .csv); required for more than one resume")
+    ap.add_argument("--checkpoint", help="Checkpoint file (default: <output>.checkpoint)")
+    ap.add_argument("--restart", action="store_true",
+                    help="Ignore and overwrite existing output/checkpoint")
+    ap.add_argument("-w", "--workers", type=int, default=None,
+                    help="Parser worker processes (default: CPU count)")
+    ap.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT,
+                    help="Per-file parse timeout in seconds")
+    args = ap.parse_args()
+
+    print("📄 Running Resume Analyzer (CLI mode)\n")
+
+    if args.role:
+        jd_profile = JD_PROFILES[args.role]
+    else:
+        if not args.jd_file.exists():
+            print("❌ Job description file not found:", args.jd_file)
+            return 1
+        try:
+            jd_profile = prepare_job_description(args.jd_file.read_text(encoding="utf-8"))
+        except ValueError as e:
+            print(f"❌ {e}")
+            return 1
+
+    workdir = Path(tempfile.mkdtemp(prefix="resume_analyzer_"))
+    try:
+        sources = collect_inputs(args.inputs)
+        if not sources:
+            print("❌ No PDF/DOCX resumes found.")
+            return 1
+
+        if args.output:
+            run_batch(args, jd_profile, sources, workdir)
+            return 0
+
+        if len(sources) > 1:
+            print("❌ Several resumes found: pass -o results.jsonl (or .csv).")
+            return 1
+
+        path = next(materialize(sources, workdir, {}))
+        try:
+            result = analyze_resume(
+                resume_file=path,
+                job_description=jd_profile["text"],
+                candidate_name="CLI Candidate",
+                jd_profile=jd_profile
+            )
+        except Exception as e:
+            print(f"\n❌ Error running analyzer: {e}")
+            return 1
 
-    except Exception as e:
-        print(f"\n❌ Error running analyzer: {e}")
+        print_report(result)
+        return 0
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
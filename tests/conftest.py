@@ -0,0 +1,25 @@
+# tests/conftest.py
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+# Before any utils import: keep caches and the results DB out of the repo
+_TMP = Path(tempfile.mkdtemp(prefix="resume_analyzer_tests_"))
+os.environ.setdefault("RESUME_ANALYZER_CACHE_DIR", str(_TMP / "cache"))
+os.environ.setdefault("RESUME_ANALYZER_DB", str(_TMP / "results.db"))
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """Fresh results database for one test; returns a connection to it."""
+    from utils import database
+
+    monkeypatch.setattr(database, "DB_PATH", tmp_path / "results.db")
+    database.init_db()
+    return database.get_connection()
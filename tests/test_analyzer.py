@@ -0,0 +1,79 @@
+# tests/test_analyzer.py
+from utils import analyzer
+from utils.analyzer import analyze_resume
+
+JD = "Required Skills:\n- python, sql, docker\nPreferred:\n- kubernetes"
+RESUME = {
+    "raw_text": (
+        "Jordan Example\nSkills\nPython, SQL\nEducation\nB.Sc. Computer Science\n"
+        "Experience\nBuilt data pipelines in Python and SQL.\nProjects\nResume analyzer"
+    ),
+    "experience": []
+}
+
+
+def _analyze(**kwargs):
+    return analyze_resume(None, JD, candidate_name="Test", resume_data=dict(RESUME), **kwargs)
+
+
+def test_sync_result_has_rewrites_for_missing_skills():
+    result = _analyze()
+
+    assert result["matched_skills"] == ["python", "sql"]
+    assert result["missing_skills"] == ["docker", "kubernetes"]
+    assert [s["skill"] for s in result["rewrite_suggestions"]] == result["missing_skills"]
+
+
+def test_async_rewrites_land_in_result():
+    result = _analyze(async_rewrites=True)
+    stream = result["rewrite_stream"]
+
+    items = stream.result(timeout=30)
+
+    assert items
+    assert result["rewrite_suggestions"] == items
+    assert [s["skill"] for s in stream] == [s["skill"] for s in items]
+
+
+def test_prepare_job_description_on_fresh_db(tmp_path, monkeypatch, capsys):
+    from utils import analyzer, database
+
+    monkeypatch.setattr(database, "DB_PATH", tmp_path / "fresh.db")
+    profile = analyzer.prepare_job_description("Required: python, sql\nBonus: docker")
+
+    assert profile["required"] == ["python", "sql"]
+    assert "[ERROR]" not in capsys.readouterr().out
+
+
+def test_repeat_jd_is_served_from_memory(monkeypatch):
+    jd = "Must have: python, terraform"
+    first = analyzer.prepare_job_description(jd)
+
+    calls = []
+    monkeypatch.setattr(analyzer, "load_job_description", lambda *a: calls.append(a))
+    second = analyzer.prepare_job_description(jd)
+
+    assert calls == []
+    assert second == first and second is not first
+
+
+def test_analyze_resumes_prepares_jd_once_and_isolates_failures(monkeypatch):
+    prepared = []
+    real_prepare = analyzer.prepare_job_description
+    monkeypatch.setattr(
+        analyzer, "prepare_job_description",
+        lambda jd: prepared.append(jd) or real_prepare(jd)
+    )
+    monkeypatch.setattr(
+        analyzer, "parse_resume",
+        lambda f: None if f == "broken.pdf" else dict(RESUME)
+    )
+
+    results = list(analyzer.analyze_resumes(
+        ["a.pdf", ("Named", "b.pdf"), "broken.pdf"], JD, candidate_name="Default"
+    ))
+
+    assert prepared == [JD]
+    assert [r["candidate"] for r in results] == ["Default", "Named", "Default"]
+    assert results[0]["matched_skills"] == ["python", "sql"]
+    assert "error" in results[2] and "error" not in results[1]
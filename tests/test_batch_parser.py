@@ -0,0 +1,100 @@
+# tests/test_batch_parser.py
+import multiprocessing
+import os
+import threading
+import time
+
+import pytest
+
+from utils import batch_parser, parser
+
+
+def _worker_ocr_threads(_):
+    return parser.OCR_THREADS
+
+
+def test_pool_workers_ocr_single_threaded():
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=2, initializer=batch_parser._init_worker) as pool:
+        assert set(pool.map(_worker_ocr_threads, range(4))) == {1}
+
+
+def test_ocr_pages_respect_thread_count(monkeypatch):
+    seen = set()
+
+    def fake_ocr_page(pdf_bytes, page_number):
+        seen.add(threading.get_ident())
+        return f"page {page_number}"
+
+    monkeypatch.setattr(parser, "_ocr_page", fake_ocr_page)
+
+    assert parser._ocr_pdf_pages(b"", [1, 2, 3], threads=1) == ["page 1", "page 2", "page 3"]
+    assert seen == {threading.get_ident()}
+
+
+def test_unparseable_files_are_reported(tmp_path):
+    bad = tmp_path / "bad.pdf"
+    bad.write_bytes(b"not a pdf")
+
+    records = list(batch_parser.parse_resumes_parallel([bad], max_workers=1, timeout=30))
+
+    assert len(records) == 1
+    assert records[0]["resume"] is None and records[0]["error"]
+
+
+def _fake_parse(path):
+    """Behaviour picked by file name: slow*, crash*, or <seconds>_<name>."""
+    name = os.path.basename(path)
+    if name.startswith("slow"):
+        time.sleep(30)
+    if name.startswith("crash"):
+        os._exit(1)
+    time.sleep(float(name.split("_")[0]) if name[0].isdigit() else 0)
+    return {"raw_text": name}
+
+
+@pytest.fixture
+def fake_parse(monkeypatch):
+    if multiprocessing.get_start_method() != "fork":
+        pytest.skip("the mock reaches pool workers only through fork")
+    monkeypatch.setattr(batch_parser, "parse_resume", _fake_parse)
+
+
+def _names(records):
+    return [os.path.basename(r["path"]) for r in records]
+
+
+def test_file_over_budget_times_out(fake_parse):
+    records = list(batch_parser.parse_resumes_parallel(
+        ["slow.pdf", "ok.pdf"], max_workers=2, timeout=0.5
+    ))
+
+    assert _names(records) == ["slow.pdf", "ok.pdf"]
+    assert records[0]["resume"] is None
+    assert records[0]["error"] == "timed out after 0.5s"
+    assert records[0]["elapsed"] < 5
+    assert records[1]["resume"] == {"raw_text": "ok.pdf"}
+
+
+def test_crashing_worker_is_isolated(fake_parse):
+    paths = ["a.pdf", "crash.pdf", "b.pdf", "c.pdf"]
+
+    records = list(batch_parser.parse_resumes_parallel(paths, max_workers=2, timeout=30))
+
+    assert _names(records) == paths
+    by_name = dict(zip(_names(records), records))
+    assert by_name["crash.pdf"]["error"] == "worker crashed"
+    for name in ("a.pdf", "b.pdf", "c.pdf"):
+        assert by_name[name]["resume"] == {"raw_text": name}
+
+
+def test_ordered_yields_input_order(fake_parse):
+    # Later files finish first
+    paths = ["0.6_a.pdf", "0.4_b.pdf", "0.2_c.pdf", "0_d.pdf"]
+
+    ordered = list(batch_parser.parse_resumes_parallel(paths, max_workers=4, ordered=True))
+    completed = list(batch_parser.parse_resumes_parallel(paths, max_workers=4, ordered=False))
+
+    assert _names(ordered) == paths
+    assert _names(completed) == paths[::-1]
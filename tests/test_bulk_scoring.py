@@ -0,0 +1,52 @@
+# tests/test_bulk_scoring.py
+import random
+
+import pytest
+
+from utils.bulk_scoring import NUMPY_AVAILABLE, SkillSpace, bulk_match_scores, bulk_resume_strength
+from utils.scoring import calculate_match_score, calculate_resume_strength
+from utils.taxonomy import get_taxonomy
+
+
+def _random_skills(rng, vocabulary, n):
+    return [rng.sample(vocabulary, rng.randint(0, 12)) for _ in range(n)]
+
+
+def test_bulk_scores_match_scalar_scoring():
+    rng = random.Random(7)
+    vocabulary = get_taxonomy().vocabulary[:60] + ["made-up skill"]
+    resumes = _random_skills(rng, vocabulary, 40)
+    jds = _random_skills(rng, vocabulary, 6) + [[]]
+
+    scores = bulk_match_scores(resumes, jds)
+
+    for i, resume in enumerate(resumes):
+        for j, jd in enumerate(jds):
+            assert scores.result(i, j) == tuple(calculate_match_score(resume, jd))
+
+
+def test_bulk_resume_strength_matches_scalar():
+    texts = ["", "word " * 100, "word " * 300, "word " * 900]
+    skills = [[], ["python"], ["python", "sql"] * 5, list(range(30))]
+
+    assert bulk_resume_strength(texts, skills) == [
+        calculate_resume_strength(t, s) for t, s in zip(texts, skills)
+    ]
+
+
+@pytest.mark.skipif(not NUMPY_AVAILABLE, reason="needs NumPy")
+def test_matrix_width_is_skills_in_use():
+    scores = bulk_match_scores([["python", "sql"], ["java"]], [["python", "docker"]])
+
+    assert scores.space.skills == ["docker", "java", "python", "sql"]
+    assert scores.resumes.shape == (2, 4)
+
+
+def test_top_resumes_orders_by_score():
+    scores = bulk_match_scores([["python"], ["python", "sql"], []], [["python", "sql"]])
+    assert [e["resume"] for e in scores.top_resumes(0, k=2)] == [1, 0]
+
+
+def test_skill_space_lowercases():
+    space = SkillSpace([["Python", "SQL"]])
+    assert space.skills == ["python", "sql"]
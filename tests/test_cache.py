@@ -0,0 +1,92 @@
+# tests/test_cache.py
+import io
+
+from utils import cache, parser
+from utils.cache import LRUCache, SQLiteCache, TieredCache
+
+
+def test_lru_evicts_least_recently_used():
+    lru = LRUCache(max_items=2)
+    lru.set("a", 1)
+    lru.set("b", 2)
+    assert lru.get("a") == 1
+    lru.set("c", 3)
+    assert lru.get("b") is None
+    assert (lru.get("a"), lru.get("c"), len(lru)) == (1, 3, 2)
+
+
+def test_lru_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "time", lambda: now[0])
+    lru = LRUCache(ttl=10)
+    lru.set("a", 1)
+    now[0] += 11
+    assert lru.get("a") is None and len(lru) == 0
+
+
+def test_sqlite_cache_persists_and_evicts_by_size(tmp_path):
+    path = tmp_path / "cache.db"
+    disk = SQLiteCache(path, max_bytes=30)
+    disk.set("old", "x" * 10)
+    disk.set("new", "y" * 10)
+    assert disk.get("new") == "y" * 10
+
+    disk.set("big", "z" * 10)  # 3 x 12 JSON bytes > 30: "old" is least recent
+    assert disk.get("old") is None
+    assert disk.get("new") == "y" * 10
+    assert SQLiteCache(path).get("big") == "z" * 10
+
+
+def test_sqlite_cache_ttl_and_unserializable_values(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "time", lambda: now[0])
+    disk = SQLiteCache(tmp_path / "cache.db", ttl=10)
+    disk.set("a", {"k": [1, 2]})
+    assert disk.get("a") == {"k": [1, 2]}
+    now[0] += 11
+    assert disk.get("a") is None
+
+    disk.set("bad", object())  # logged and skipped
+    assert disk.get("bad") is None
+
+
+def test_tiered_cache_promotes_disk_hits(tmp_path):
+    disk = SQLiteCache(tmp_path / "cache.db")
+    disk.set("k", "v")
+    tiered = TieredCache(LRUCache(), disk)
+
+    assert tiered.get("k") == "v"
+    assert tiered.get("k") == "v"
+    assert tiered.get("missing") is None
+    assert tiered.stats == {"memory_hits": 1, "disk_hits": 1, "misses": 1}
+
+    tiered.clear()
+    assert tiered.get("k") is None and disk.get("k") is None
+
+
+def test_parse_resume_caches_by_content(monkeypatch):
+    monkeypatch.setattr(parser, "PARSE_CACHE", TieredCache(LRUCache()))
+    calls = []
+
+    def fake_docx(stream):
+        calls.append(1)
+        return "Experienced engineer. " * 20
+
+    monkeypatch.setattr(parser, "_parse_docx", fake_docx)
+
+    def upload(data):
+        f = io.BytesIO(data)
+        f.name = "resume.docx"
+        return f
+
+    first = parser.parse_resume(upload(b"same bytes"))
+    first["raw_text"] = "mutated"
+    second = parser.parse_resume(upload(b"same bytes"))
+    assert len(calls) == 1
+    assert second["raw_text"].startswith("Experienced")
+    assert first["cached"] is False and "python-docx" in first["timings_ms"]
+    assert second["cached"] is True and list(second["timings_ms"]) == ["cache"]
+
+    parser.parse_resume(upload(b"other bytes"))
+    parser.parse_resume(upload(b"same bytes"), use_cache=False)
+    assert len(calls) == 3
@@ -0,0 +1,194 @@
+# tests/test_database.py
+import sqlite3
+
+import pytest
+
+from utils import database
+
+
+def _user_version(conn):
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def _legacy_db(path):
+    """A pre-migration (user_version 0) results table with one row."""
+    conn = sqlite3.connect(path)
+    conn.execute(database.SCHEMA_SQL)
+    conn.execute(
+        "INSERT INTO results (candidate_name, job_description, score, matched_skills, missing_skills) "
+        "VALUES ('Ann', 'python sql', 50, '[\"python\"]', '[\"sql\"]')"
+    )
+    conn.commit()
+    conn.close()
+
+
+def test_init_db_migrates_to_current_version(db):
+    assert _user_version(db) == database.SCHEMA_VERSION
+    assert database._has_column(db, "results", "resume_strength")
+
+
+def test_legacy_rows_are_backfilled(tmp_path, monkeypatch):
+    path = tmp_path / "legacy.db"
+    _legacy_db(path)
+    monkeypatch.setattr(database, "DB_PATH", path)
+
+    database.init_db()
+    conn = database.get_connection()
+
+    assert _user_version(conn) == database.SCHEMA_VERSION
+    rows, _ = database.query_results(columns=("candidate_name", "job_description", "matched_skills"))
+    assert rows == [{"candidate_name": "Ann", "job_description": "python sql", "matched_skills": ["python"]}]
+    kinds = {k for (k,) in conn.execute("SELECT kind FROM result_skills")}
+    assert kinds == {"matched", "missing", "resume"}
+
+
+def test_failed_migration_rolls_back_completely(tmp_path, monkeypatch):
+    path = tmp_path / "legacy.db"
+    _legacy_db(path)
+    monkeypatch.setattr(database, "DB_PATH", path)
+
+    def broken_v3(conn):
+        conn.execute("ALTER TABLE results ADD COLUMN resume_strength INTEGER")
+        raise sqlite3.OperationalError("boom")
+
+    original = list(database.MIGRATIONS)
+    monkeypatch.setattr(database, "MIGRATIONS", original[:2] + [(3, broken_v3)])
+    database.init_db()
+    conn = database.get_connection()
+
+    assert _user_version(conn) == 2
+    assert not database._has_column(conn, "results", "resume_strength")
+
+    # The real migration then applies cleanly
+    monkeypatch.setattr(database, "MIGRATIONS", original)
+    database.init_db()
+    assert _user_version(conn) == database.SCHEMA_VERSION
+
+
+def test_migration_steps_are_idempotent(db):
+    # e.g. a column added by a half-applied migration on an older release
+    db.execute("PRAGMA user_version = 1")
+    database.init_db()
+
+    assert _user_version(db) == database.SCHEMA_VERSION
+
+
+def test_save_and_query_round_trip(db):
+    database.save_result("Ann", "", "python sql", 50, ["python"], ["sql"], ["python"], 70)
+    rows, cursor = database.query_results(columns=("candidate_name", "score", "missing_skills"))
+
+    assert rows == [{"candidate_name": "Ann", "score": 50, "missing_skills": ["sql"]}]
+    assert cursor is None
+
+
+def test_keyset_pagination_visits_every_row_once(db):
+    for i in range(25):
+        database.save_result(f"C{i}", "", "python", i, [], ["python"])
+
+    seen, cursor = [], None
+    while True:
+        rows, cursor = database.query_results(columns=("candidate_name",), limit=10, after=cursor)
+        seen.extend(r["candidate_name"] for r in rows)
+        if cursor is None:
+            break
+
+    assert sorted(seen) == sorted(f"C{i}" for i in range(25))
+    assert len(seen) == 25
+
+
+def test_skill_filters_use_normalized_skills(db):
+    database.save_result("Ann", "", "python sql", 50, ["python"], ["sql"])
+    database.save_result("Bob", "", "python sql", 100, ["python", "sql"], [])
+
+    rows, _ = database.query_results(columns=("candidate_name",), missing_skill="SQL")
+    assert rows == [{"candidate_name": "Ann"}]
+    rows, _ = database.query_results(columns=("candidate_name",), min_score=60)
+    assert rows == [{"candidate_name": "Bob"}]
+
+
+def test_job_descriptions_are_stored_once(db):
+    for _ in range(3):
+        database.save_result("Ann", "", "same jd", 50, [], [])
+    database.flush()
+
+    assert db.execute("SELECT COUNT(*) FROM job_descriptions").fetchone()[0] == 1
+
+
+def test_connections_close_when_their_thread_exits(db):
+    import gc
+    import threading
+
+    pool = database.get_pool()
+    before = pool.open_connections
+
+    def work():
+        database.get_connection().execute("SELECT 1").fetchone()
+
+    for _ in range(50):
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()
+    gc.collect()
+
+    assert pool.open_connections <= before + 1
+
+
+def test_flush_reuses_the_writer_thread(db):
+    import threading
+
+    database.save_result("Ann", "", "python", 10, [], [])
+    database.flush()
+    before = threading.active_count()
+
+    for i in range(20):
+        database.save_result(f"C{i}", "", "python", i, [], [])
+        assert database.flush(5)
+
+    assert threading.active_count() == before
+    rows, _ = database.query_results(columns=("id",), limit=100)
+    assert len(rows) == 21
+
+
+def test_latest_result_id_tracks_saves(db):
+    assert database.latest_result_id() == 0
+    database.save_result("Ann", "", "python", 10, [], [])
+    first = database.latest_result_id()
+    database.save_result("Bob", "", "python", 10, [], [])
+
+    assert database.latest_result_id() > first > 0
+
+
+def test_skill_frequency_counts_every_kind(db):
+    database.save_result("Ann", "a", "python sql", 50, ["python"], ["sql"], ["python", "git"])
+    database.save_result("Bob", "b", "python sql", 0, [], ["python", "sql"], ["git"])
+
+    assert database.skill_frequency("Python") == {"matched": 1, "missing": 1, "resume": 1}
+    assert database.skill_frequency("git") == {"matched": 0, "missing": 0, "resume": 2}
+
+
+def test_bad_row_does_not_stop_the_writer(db, monkeypatch):
+    def broken(conn, rows):
+        raise TypeError("bad row")
+
+    # One batch: the bad write fails alone, its neighbours are kept
+    batch = []
+    with monkeypatch.context() as m:
+        m.setattr(database.WRITER, "submit", lambda handler, row: batch.append((handler, row)))
+        database.save_result("Ann", "a", "python", 10, ["python"], [])
+        batch.append((broken, None))
+        database.save_result("Bob", "b", "python", 20, [], ["python"])
+    database.WRITER._write(batch)
+
+    # Through the thread: a failing write is logged and later saves still land
+    database.WRITER.submit(broken, None)
+    database.save_result("Cat", "c", "python", 30, [], [])
+
+    rows, _ = database.query_results(limit=10, columns=("candidate_name",))
+    assert sorted(r["candidate_name"] for r in rows) == ["Ann", "Bob", "Cat"]
+    assert database.skill_frequency("python") == {"matched": 1, "missing": 1, "resume": 1}
+    assert database.WRITER._thread.is_alive()
+
+
+def test_unserializable_result_raises_in_caller(db):
+    with pytest.raises(TypeError):
+        database.save_result("Ann", "a", "python", 10, [object()], [])
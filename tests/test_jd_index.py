@@ -0,0 +1,49 @@
+# tests/test_jd_index.py
+from utils import database
+from utils.jd_index import JDIndex, build_jd_index
+from utils.jd_library import JD_LIBRARY
+from utils.scoring import calculate_match_score
+
+
+def test_top_k_scores_match_scalar_scoring():
+    jds = {
+        "a": ["python", "sql", "docker"],
+        "b": ["java", "spring"],
+        "c": ["python", "aws"],
+    }
+    index = JDIndex()
+    for key, skills in jds.items():
+        index.add(key, skills)
+
+    resume = ["python", "sql"]
+    ranked = index.top_k(resume, k=10)
+
+    assert [e["key"] for e in ranked] == ["a", "c"]  # "b" shares no skill
+    for entry in ranked:
+        score, matched, missing = calculate_match_score(resume, jds[entry["key"]])
+        assert entry["score"] == score
+        assert entry["matched"] == matched
+        assert entry["missing"] == missing
+
+
+def test_add_replaces_existing_key():
+    index = JDIndex()
+    index.add("a", ["python"])
+    index.add("a", ["java"])
+
+    assert len(index) == 1
+    assert index.top_k(["python"]) == []
+    assert index.top_k(["java"])[0]["key"] == "a"
+
+
+def test_library_roles_are_indexed_once(db):
+    role, text = next(iter(JD_LIBRARY.items()))
+    database.save_result("Ann", "", text, 50, [], [])
+    database.save_result("Bob", "", "Required: python, rust", 50, [], [])
+
+    index = build_jd_index()
+
+    assert len(index) == len(JD_LIBRARY) + 1
+    keys = [e["key"] for e in index.top_k(["python", "sql", "rust"], k=50)]
+    assert len(keys) == len(set(keys))
+    assert f"role:{role}" in index.keys
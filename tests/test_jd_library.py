@@ -0,0 +1,31 @@
+# tests/test_jd_library.py
+import subprocess
+import sys
+
+from conftest import ROOT
+from utils.hashing import jd_hash
+from utils.jd_library import JD_LIBRARY, JD_PROFILES, get_library_profile
+
+
+def test_library_profile_is_a_copy():
+    role = "Software Engineer"
+    profile = get_library_profile(JD_LIBRARY[role])
+    assert profile == JD_PROFILES[role]
+
+    profile["skills"].append("cobol")
+    profile["weights"].clear()
+    profile["hash"] = "changed"
+
+    fresh = get_library_profile(JD_LIBRARY[role])
+    assert "cobol" not in fresh["skills"] and fresh["weights"]
+    assert fresh["hash"] == jd_hash(JD_LIBRARY[role])
+
+
+def test_unknown_jd_has_no_library_profile():
+    assert get_library_profile("Some other posting") is None
+
+
+def test_jd_library_does_not_import_database():
+    code = "import sys, utils.jd_library; print('utils.database' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True)
+    assert out.stdout.strip() == "False", out.stderr
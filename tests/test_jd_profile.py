@@ -0,0 +1,49 @@
+# tests/test_jd_profile.py
+from utils.jd_profile import build_jd_profile, extract_requirements, split_requirements
+from utils.nlp_processing import clean_text, extract_skills
+
+PROSE_JD = (
+    "Requirements include strong Python and SQL\n"
+    "Bonus points for Docker and Kubernetes experience\n"
+    "Preferred candidates know AWS"
+)
+
+
+def test_prose_lines_starting_with_keywords_are_not_headers():
+    requirements = extract_requirements(PROSE_JD)
+    found = set(extract_skills(clean_text(PROSE_JD)))
+
+    assert found
+    assert set(requirements["required"]) | set(requirements["preferred"]) == found
+
+
+def test_prose_jd_scores_above_zero():
+    profile = build_jd_profile(PROSE_JD)
+    assert profile["skills"]
+    assert "python" in profile["required"]
+
+
+def test_headers_switch_sections():
+    jd = "Required Skills:\n- python, sql\nNice to have:\n- docker\nPreferred Qualifications\n- aws"
+    requirements = extract_requirements(jd)
+
+    assert requirements["required"] == ["python", "sql"]
+    assert requirements["preferred"] == ["aws", "docker"]
+
+
+def test_text_after_header_colon_is_kept():
+    requirements = extract_requirements("Must have: python, sql\nBonus: docker")
+
+    assert requirements["required"] == ["python", "sql"]
+    assert requirements["preferred"] == ["docker"]
+
+
+def test_skill_in_both_sections_counts_as_required():
+    requirements = extract_requirements("Required: python\nPreferred: python, docker")
+    assert requirements["preferred"] == ["docker"]
+
+
+def test_split_without_headers_is_all_required():
+    required, preferred = split_requirements("python and sql\ndocker")
+    assert preferred == ""
+    assert "docker" in required
@@ -0,0 +1,74 @@
+# tests/test_lazy_imports.py
+import ast
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import utils
+from utils.lazy import lazy_import, module_available
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _run(code):
+    return subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+def test_package_exports_map_to_definitions():
+    # Checked from source, so optional dependencies are never imported
+    for name, module in utils._EXPORTS.items():
+        tree = ast.parse((ROOT / "utils" / f"{module}.py").read_text(encoding="utf-8"))
+        defined = {
+            node.name for node in tree.body
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
+        }
+        assert name in defined, f"{name} not defined in utils/{module}.py"
+
+
+@pytest.mark.parametrize("name", utils.__all__)
+def test_package_exports_resolve(name):
+    try:
+        value = getattr(utils, name)
+    except ModuleNotFoundError as e:
+        if (e.name or "").split(".")[0] == "utils":
+            raise
+        pytest.skip(f"optional dependency {e.name} not installed")
+    assert callable(value)
+
+
+def test_unknown_export_raises_attribute_error():
+    with pytest.raises(AttributeError):
+        utils.not_a_real_name
+
+
+def test_importing_analyzer_skips_heavy_dependencies():
+    loaded = _run(
+        "import sys, utils.analyzer; "
+        "print(sorted(m for m in ('fitz', 'pdfplumber', 'docx', 'pytesseract', 'pdf2image', 'gpt4all') "
+        "if m in sys.modules))"
+    )
+    assert loaded == "[]"
+
+
+def test_package_attribute_loads_only_its_module():
+    loaded = _run(
+        "import sys, utils; utils.calculate_match_score; "
+        "print('utils.parser' in sys.modules, 'utils.scoring' in sys.modules)"
+    )
+    assert loaded == "False True"
+
+
+def test_lazy_module_imports_on_first_use():
+    json_module = lazy_import("json")
+    assert "not loaded" in repr(json_module)
+    assert json_module.loads("[1]") == [1]
+    assert "not loaded" not in repr(json_module)
+
+
+def test_module_available():
+    assert module_available("json")
+    assert not module_available("definitely_not_installed_module")
@@ -0,0 +1,126 @@
+# tests/test_llm_rewriter.py
+import sys
+import threading
+import types
+
+import pytest
+
+from utils import llm_rewriter
+from utils.llm_rewriter import ModelManager, _parse_batch_response
+
+
+def test_parse_batch_plain_and_numbered_lines():
+    response = "- Python: Built ETL pipelines\n2. SQL: Tuned slow queries\nnoise"
+    assert _parse_batch_response(response, ["Python", "SQL"]) == {
+        "Python": "Built ETL pipelines",
+        "SQL": "Tuned slow queries",
+    }
+
+
+def test_parse_batch_strips_markdown_emphasis():
+    response = (
+        "* **Python:** Built **ETL** pipelines\n"
+        "- **SQL**: Tuned _slow_ queries\n"
+        "__Docker__: Shipped images with `docker_compose`\n"
+    )
+    assert _parse_batch_response(response, ["python", "sql", "docker"]) == {
+        "python": "Built ETL pipelines",
+        "sql": "Tuned slow queries",
+        "docker": "Shipped images with `docker_compose`",
+    }
+
+
+def test_parse_batch_keeps_first_answer_and_ignores_unknown_skills():
+    response = "Python: first\nPython: second\nRust: not requested"
+    assert _parse_batch_response(response, ["Python"]) == {"Python": "first"}
+
+
+def test_model_manager_loads_once_and_remembers_failures(tmp_path, monkeypatch):
+    loads = []
+
+    class FakeGPT4All:
+        def __init__(self, model_name):
+            loads.append(model_name)
+
+        def generate(self, prompt, **kwargs):
+            return prompt.upper()
+
+    monkeypatch.setitem(sys.modules, "gpt4all", types.SimpleNamespace(GPT4All=FakeGPT4All))
+    manager = ModelManager(str(tmp_path / "model.bin"))
+
+    threads = [threading.Thread(target=manager.generate, args=("hi",)) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert loads == [manager.model_path]
+    assert manager.metrics["loaded"] and manager.metrics["generations"] == 4
+
+    broken = ModelManager("missing.bin")
+    monkeypatch.setitem(sys.modules, "gpt4all", types.SimpleNamespace(GPT4All=None))
+    with pytest.raises(TypeError):
+        broken.get()
+    with pytest.raises(RuntimeError):  # cached failure, no second load attempt
+        broken.get()
+
+
+class FakeModel:
+    """Answers batch prompts for every skill except the last one."""
+
+    def __init__(self):
+        self.prompts = []
+
+    def available(self):
+        return True
+
+    def generate(self, prompt, max_tokens=0):
+        self.prompts.append(prompt)
+        if "Skills:\n" in prompt:
+            skills = [l[2:] for l in prompt.split("Skills:\n")[1].splitlines()]
+            return "\n".join(f"{s}: used {s}" for s in skills[:-1])
+        return " single answer "
+
+
+@pytest.fixture
+def fake_model(monkeypatch):
+    model = FakeModel()
+    monkeypatch.setattr(llm_rewriter, "MODEL_MANAGER", model)
+    monkeypatch.setattr(llm_rewriter, "REWRITE_CACHE",
+                        llm_rewriter.TieredCache(llm_rewriter.LRUCache()))
+    monkeypatch.setattr(llm_rewriter, "_model_identity", lambda: "fake-model")
+    return model
+
+
+def test_rewrites_are_batched_with_single_retries(fake_model, monkeypatch):
+    monkeypatch.setattr(llm_rewriter, "BATCH_SIZE", 3)
+    skills = ["python", "sql", "docker", "aws"]
+
+    suggestions = llm_rewriter.llm_rewrite_skills(skills, "Backend role")
+
+    # one batch of 3 (docker unanswered), then single prompts for docker and aws
+    assert len(fake_model.prompts) == 3
+    assert [s["skill"] for s in suggestions] == skills
+    by_skill = {s["skill"]: s["suggested_rewrite"] for s in suggestions}
+    assert by_skill == {
+        "python": "used python", "sql": "used sql",
+        "docker": "single answer", "aws": "single answer",
+    }
+    assert {s["source"] for s in suggestions} == {"gpt4all"}
+
+
+def test_rewrites_are_cached_per_skill_jd_and_model(fake_model, monkeypatch):
+    llm_rewriter.llm_rewrite_skills(["python", "sql"], "Backend role")
+    generated = len(fake_model.prompts)
+
+    # same JD up to case/whitespace: served from cache
+    again = llm_rewriter.llm_rewrite_skills(["sql", "python"], "  backend   ROLE ")
+    assert len(fake_model.prompts) == generated
+    assert [s["skill"] for s in again] == ["sql", "python"]
+    assert llm_rewriter.get_rewrite_cache_stats()["memory_hits"] == 2
+
+    llm_rewriter.llm_rewrite_skills(["python"], "Data role")
+    assert len(fake_model.prompts) == generated + 1
+
+    monkeypatch.setattr(llm_rewriter, "_model_identity", lambda: "other-model")
+    llm_rewriter.llm_rewrite_skills(["python"], "Backend role")
+    assert len(fake_model.prompts) == generated + 2
@@ -0,0 +1,82 @@
+# tests/test_main.py
+import zipfile
+from types import SimpleNamespace
+
+import pytest
+
+import main
+from utils.jd_library import JD_PROFILES
+
+docx = pytest.importorskip("docx")
+
+
+def _resume(path, skills="Python and SQL"):
+    document = docx.Document()
+    for section in ("Summary", "Skills", "Education", "Experience", "Projects"):
+        document.add_paragraph(section)
+        document.add_paragraph(f"Built production services with {skills}, shipped weekly.")
+    document.save(str(path))
+    return path
+
+
+def _args(tmp_path, inputs):
+    return SimpleNamespace(
+        inputs=[str(p) for p in inputs], output=str(tmp_path / "out.jsonl"),
+        checkpoint=None, restart=False, workers=1, timeout=60
+    )
+
+
+def _run(tmp_path, inputs):
+    args = _args(tmp_path, inputs)
+    workdir = tmp_path / "work"
+    workdir.mkdir(exist_ok=True)
+    main.run_batch(args, JD_PROFILES["Software Engineer"], main.collect_inputs(args.inputs), workdir)
+    return args
+
+
+def test_zip_members_are_listed_without_extracting(tmp_path):
+    archive = tmp_path / "batch.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.write(_resume(tmp_path / "a.docx"), "nested/a.docx")
+        zf.writestr("notes.txt", "skip me")
+
+    sources = main.collect_inputs([str(archive)])
+
+    assert sources == [(f"{archive}::nested/a.docx", str(archive), "nested/a.docx")]
+
+
+def test_only_successes_are_checkpointed(tmp_path):
+    good = _resume(tmp_path / "good.docx")
+    bad = tmp_path / "bad.pdf"
+    bad.write_bytes(b"not a pdf")
+
+    args = _run(tmp_path, [good, bad])
+
+    checkpoint = main.load_checkpoint(main.Path(f"{args.output}.checkpoint"))
+    assert checkpoint == {str(good)}
+
+
+def test_resume_retries_failures_and_skips_successes(tmp_path, capsys):
+    good = _resume(tmp_path / "good.docx")
+    bad = tmp_path / "bad.pdf"
+    bad.write_bytes(b"not a pdf")
+    _run(tmp_path, [good, bad])
+    capsys.readouterr()
+
+    _run(tmp_path, [good, bad])
+
+    out = capsys.readouterr().out
+    assert "1 already done, 1 to analyze" in out
+
+
+def test_zip_members_are_analyzed_and_cleaned_up(tmp_path):
+    archive = tmp_path / "batch.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        for name in ("a", "b"):
+            zf.write(_resume(tmp_path / f"{name}.docx"), f"{name}.docx")
+
+    args = _run(tmp_path, [archive])
+
+    lines = main.Path(args.output).read_text().splitlines()
+    assert len(lines) == 2
+    assert not list((tmp_path / "work").iterdir())
@@ -0,0 +1,70 @@
+# tests/test_parser.py
+import io
+
+import pytest
+
+from utils import parser
+
+LONG = " ".join(["Experienced backend engineer with Python and SQL."] * 3)
+
+
+def _engine(pages, ocr_pages=(), needs_fallback=False, calls=None):
+    def extract(file):
+        if calls is not None:
+            calls.append(pages)
+        return {"pages": list(pages), "ocr_pages": list(ocr_pages),
+                "needs_fallback": needs_fallback}
+    return extract
+
+
+@pytest.fixture
+def ocr_calls(monkeypatch):
+    calls = []
+
+    def fake_ocr(pdf_bytes, page_numbers, threads=None):
+        calls.append(list(page_numbers))
+        return [f"ocr page {n}" for n in page_numbers]
+
+    monkeypatch.setattr(parser, "_ocr_pdf_pages", fake_ocr)
+    return calls
+
+
+def test_route_page_only_flags_image_only_pages():
+    assert parser._route_page("", 0.9)
+    assert not parser._route_page("", 0.05)  # blank page, not a scan
+    assert not parser._route_page(LONG, 0.9)  # scan with a text layer
+
+
+def test_only_scanned_pages_are_ocrd_in_page_order(monkeypatch, ocr_calls):
+    monkeypatch.setitem(parser.PDF_EXTRACTORS, "pymupdf",
+                        _engine([LONG, "", LONG], ocr_pages=[2]))
+
+    text, engine, timings = parser._parse_pdf(io.BytesIO(b"%PDF"), ("pymupdf", "ocr"))
+
+    assert ocr_calls == [[2]]
+    assert engine == "pymupdf+ocr"
+    assert text.split("\n") == [LONG, "ocr page 2", LONG]
+    assert set(timings) == {"pymupdf", "ocr"}
+
+
+def test_layout_fallback_skips_whole_document_ocr(monkeypatch, ocr_calls):
+    tried = []
+    monkeypatch.setitem(parser.PDF_EXTRACTORS, "pymupdf",
+                        _engine([LONG], needs_fallback=True, calls=tried))
+    monkeypatch.setitem(parser.PDF_EXTRACTORS, "pdfplumber", _engine([""], calls=tried))
+    monkeypatch.setitem(parser.PDF_EXTRACTORS, "ocr", _engine(["whole doc"], calls=tried))
+
+    text, engine, _ = parser._parse_pdf(io.BytesIO(b"%PDF"), parser.PDF_ENGINES)
+
+    assert (text, engine) == (LONG, "pymupdf")
+    assert len(tried) == 2 and ocr_calls == []
+
+
+def test_engine_selection(monkeypatch, ocr_calls):
+    monkeypatch.setitem(parser.PDF_EXTRACTORS, "pdfplumber", _engine([LONG]))
+    text, engine, _ = parser._parse_pdf(io.BytesIO(b"%PDF"), ("pdfplumber",))
+    assert engine == "pdfplumber"
+
+    upload = io.BytesIO(b"%PDF")
+    upload.name = "resume.pdf"
+    assert parser.parse_resume(upload, use_cache=False, engines=("nope",)) is None
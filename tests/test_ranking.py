@@ -0,0 +1,53 @@
+# tests/test_ranking.py
+from utils import database
+from utils.jd_profile import build_jd_profile
+from utils.ranking import rank_candidates
+
+JD = "Required: python, sql, docker"
+
+
+def _store(name, skills, strength=50, resume_text=None):
+    database.save_result(
+        name, f"resume of {name}" if resume_text is None else resume_text, JD, 0, [], [],
+        resume_skills=skills, resume_strength=strength
+    )
+
+
+def test_k_zero_returns_nothing(db):
+    _store("Ann", ["python"])
+    assert rank_candidates(JD, k=0) == []
+    assert rank_candidates(JD, k=-1) == []
+
+
+def test_ranks_by_score_then_strength(db):
+    _store("Ann", ["python"], strength=90)
+    _store("Bob", ["python", "sql"], strength=10)
+    _store("Cat", ["python"], strength=40)
+
+    ranked = rank_candidates(JD, k=2, jd_profile=build_jd_profile(JD))
+
+    assert [c["candidate"] for c in ranked] == ["Bob", "Ann"]
+    assert ranked[0]["match_score"] == 67
+    assert ranked[0]["missing_skills"] == ["docker"]
+
+
+def test_reanalyzed_resume_appears_once_using_latest_result(db):
+    _store("Ann", ["python", "sql", "docker"])
+    _store("Ann", ["python"])
+    _store("Bob", ["python", "sql"])
+
+    ranked = rank_candidates(JD, k=10)
+
+    assert [c["candidate"] for c in ranked] == ["Bob", "Ann"]
+    assert ranked[1]["matched_skills"] == ["python"]
+
+
+def test_different_resumes_sharing_a_name_are_all_ranked(db):
+    _store("a", ["python", "sql"], resume_text="a.docx from a folder")
+    _store("a", ["python"], resume_text="x/a.docx from a zip")
+    _store("Candidate", ["docker"], resume_text="")  # no text: never merged
+    _store("Candidate", ["sql"], resume_text="")
+
+    ranked = rank_candidates(JD, k=10)
+
+    assert sorted(c["candidate"] for c in ranked) == ["Candidate", "Candidate", "a", "a"]
@@ -0,0 +1,54 @@
+# tests/test_skill_matcher.py
+import re
+
+from utils.nlp_processing import extract_skills
+from utils.skill_matcher import SkillMatcher
+
+SKILL_MAP = {
+    "java": ["java"],
+    "javascript": ["javascript", "js"],
+    "machine learning": ["machine learning", "ml"],
+    "node.js": ["node.js", "nodejs", "node"],
+    "c++": ["c++"],
+    "shared": ["ml"],
+}
+
+
+def _regex_extract(skill_map, text):
+    return sorted(
+        skill for skill, variants in skill_map.items()
+        if any(re.search(r"\b" + re.escape(v) + r"\b", text) for v in variants)
+    )
+
+
+def test_matches_regex_semantics():
+    matcher = SkillMatcher(SKILL_MAP)
+    texts = [
+        "senior javascript developer, some java and ml",
+        "built node.js services; nodejs and node tooling",
+        "c++ and c# work, machine learning pipelines",
+        "javascripting mljava machinelearning",
+        "",
+    ]
+    for text in texts:
+        assert matcher.extract(text) == _regex_extract(SKILL_MAP, text), text
+
+
+def test_word_boundaries_and_shared_variants():
+    matcher = SkillMatcher(SKILL_MAP)
+    assert matcher.extract("javascript only") == ["javascript"]
+    assert matcher.extract("applied ml daily") == ["machine learning", "shared"]
+
+
+def test_from_state_round_trip():
+    matcher = SkillMatcher(SKILL_MAP)
+    clone = SkillMatcher.from_state(matcher.variants, matcher.prefixes, matcher.max_len)
+    text = "java, node and machine learning"
+    assert clone.extract(text) == matcher.extract(text)
+
+
+def test_extract_skills_uses_taxonomy_synonyms():
+    skills = extract_skills("Experienced in Python, SQL and Docker.")
+    assert {"python", "sql", "docker"} <= set(skills)
+    assert skills == sorted(skills)
+    assert extract_skills("") == []
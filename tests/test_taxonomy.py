@@ -0,0 +1,64 @@
+# tests/test_taxonomy.py
+import json
+import pickle
+
+import pytest
+
+from utils import taxonomy
+
+
+def _write(path, skills):
+    path.write_text(json.dumps({"version": 1, "skills": skills}))
+
+
+@pytest.fixture
+def index_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(taxonomy, "INDEX_DIR", tmp_path / "index")
+    return tmp_path / "index"
+
+
+def test_compile_rejects_unknown_tier():
+    with pytest.raises(ValueError):
+        taxonomy.compile_taxonomy({"skills": {"python": {"tier": "gold"}}})
+
+
+def test_index_is_reused_until_file_changes(tmp_path, index_dir, monkeypatch):
+    path = tmp_path / "skills.json"
+    _write(path, {"Python": {"tier": "core", "synonyms": ["py"]}})
+
+    first = taxonomy.load_taxonomy(path)
+    assert first.core_skills == {"python"}
+    assert len(list(index_dir.glob("*.pkl"))) == 1
+
+    compiled = []
+    real_compile = taxonomy.compile_taxonomy
+    monkeypatch.setattr(
+        taxonomy, "compile_taxonomy",
+        lambda data, digest="": compiled.append(digest) or real_compile(data, digest)
+    )
+
+    again = taxonomy.load_taxonomy(path)
+    assert compiled == []
+    assert again.digest == first.digest
+    assert again.matcher.extract("py and python") == ["python"]
+
+    _write(path, {"python": {"tier": "core"}, "sql": {"tier": "secondary"}})
+    edited = taxonomy.load_taxonomy(path)
+    assert compiled == [edited.digest] and edited.digest != first.digest
+    assert edited.secondary_skills == {"sql"}
+
+
+def test_stale_or_corrupt_index_is_rebuilt(tmp_path, index_dir, monkeypatch):
+    path = tmp_path / "skills.json"
+    _write(path, {"python": {"tier": "core"}})
+    loaded = taxonomy.load_taxonomy(path)
+    index_path = taxonomy._index_path(path, loaded.digest)
+
+    payload = pickle.loads(index_path.read_bytes())
+    payload["format"] = taxonomy.INDEX_FORMAT + 1
+    index_path.write_bytes(pickle.dumps(payload))
+    assert taxonomy._read_index(index_path, loaded.digest) is None
+
+    index_path.write_bytes(b"not a pickle")
+    assert taxonomy.load_taxonomy(path).vocabulary == ["python"]
+    assert taxonomy._read_index(index_path, loaded.digest) is not None
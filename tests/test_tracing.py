@@ -0,0 +1,79 @@
+# tests/test_tracing.py
+import pytest
+
+from utils import tracing
+from utils.analyzer import analyze_resume
+from utils.parser import parse_resume
+
+RESUME = {"raw_text": "Skills\nPython, SQL\nExperience\nBuilt things", "experience": []}
+JD = "Required: python, sql, docker"
+
+
+@pytest.fixture
+def records():
+    captured = []
+    tracing.configure(True, [captured.append])
+    yield captured
+    tracing.configure(False, [])
+
+
+def test_disabled_tracing_adds_nothing():
+    result = analyze_resume(None, JD, resume_data=dict(RESUME))
+    assert "timings_ms" not in result
+    assert tracing.start_trace("x") is tracing.NULL_TRACE
+    assert tracing.span("x") is tracing.NULL_SPAN
+
+
+def test_analyze_resume_reports_stage_milliseconds(records):
+    result = analyze_resume(None, JD, resume_data=dict(RESUME))
+
+    timings = result["timings_ms"]
+    for stage in ("parse", "jd_profile", "extract", "score", "rewrite", "db_save", "total"):
+        assert stage in timings
+    assert timings["total"] >= max(v for k, v in timings.items() if k != "total")
+    assert [r["name"] for r in records] == ["analyze_resume"]
+
+
+def test_nested_spans_land_in_outer_trace(records):
+    trace = tracing.start_trace("outer")
+    assert tracing.start_trace("inner") is tracing.NULL_TRACE
+    with tracing.span("work"):
+        pass
+    trace.lap("stage")
+    record = trace.finish()
+
+    assert set(record["spans"]) == {"work", "stage"}
+    assert records == [record]
+
+
+def test_failing_sink_does_not_break_tracing(records):
+    def broken(record):
+        raise RuntimeError("sink down")
+
+    tracing.add_sink(broken)
+    record = tracing.start_trace("t").finish()
+    assert records == [record]
+
+
+def test_prometheus_sink_accumulates(tmp_path):
+    sink = tracing.PrometheusTextfileSink(tmp_path / "ra.prom", interval=0)
+    for _ in range(2):
+        sink({"name": "analyze_resume", "total_ms": 10.0, "spans": {"parse": 4.0}})
+
+    text = (tmp_path / "ra.prom").read_text()
+    assert 'resume_analyzer_stage_seconds_count{trace="analyze_resume",stage="parse"} 2' in text
+    assert 'resume_analyzer_stage_seconds_sum{trace="analyze_resume",stage="total"} 0.020000' in text
+
+
+def test_parse_resume_timings_are_milliseconds(tmp_path):
+    docx = pytest.importorskip("docx")
+    path = tmp_path / "r.docx"
+    document = docx.Document()
+    for _ in range(20):
+        document.add_paragraph("Experienced engineer using Python and SQL in production.")
+    document.save(str(path))
+
+    result = parse_resume(str(path), use_cache=False)
+
+    assert set(result["timings_ms"]) == {"python-docx"}
+    assert "timings" not in result
@@ -0,0 +1,36 @@
+# resume_analyzer/utils/__init__.py
+
+import importlib
+
+# Public name -> submodule that defines it. Submodules are imported on
+# first attribute access, so `import utils` alone stays cheap and e.g.
+# scoring never drags in the PDF/OCR/LLM stacks.
+_EXPORTS = {
+    # Core modules
+    "parse_resume": "parser",
+    "clean_text": "nlp_processing",
+    "extract_keywords": "nlp_processing",
+    "extract_skills": "nlp_processing",
+    "calculate_match_score": "scoring",
+    "calculate_resume_strength": "scoring",
+    "validate_resume_sections": "validator",
+    "generate_pdf": "pdf_report",
+    "save_result": "database",
+    "llm_rewrite_skills": "llm_rewriter",
+    "generate_rewrite_suggestions": "rewrite_templates",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
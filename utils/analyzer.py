@@ -5,33 +5,32 @@ Central module for ATS-style resume analysis.
 Rule-based, stable, recruiter-accurate.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, Iterator, List, Optional
 import logging
 
 from .parser import parse_resume
 from .nlp_processing import clean_text, extract_skills
-from .scoring import calculate_match_score, calculate_resume_strength
+from .scoring import calculate_match_score, calculate_resume_strength, calculate_weighted_score
 from .validator import validate_resume_sections
-from .database import save_result
-from .llm_rewriter import llm_rewrite_skills
+from .database import jd_hash, load_job_description, save_job_description, save_result
+from .llm_rewriter import llm_rewrite_skills, start_rewrite_stream
 from .rewrite_templates import generate_rewrite_suggestions
 from .skill_gap import generate_skill_gap_roadmap
+from .taxonomy import get_taxonomy
+from .tracing import start_trace
+from .cache import LRUCache
+from .jd_profile import PROFILE_FORMAT, build_jd_profile, extract_requirements
+from .jd_library import get_library_profile
 
 # --------------------------------------------------
 # ATS Skill Buckets (Recruiter-style)
 # --------------------------------------------------
-CORE_SKILLS = {
-    "python", "java", "javascript", "sql",
-    "data structures", "algorithms",
-    "oop", "git", "rest api"
-}
+CORE_SKILLS = get_taxonomy().core_skills
+SECONDARY_SKILLS = get_taxonomy().secondary_skills
 
-SECONDARY_SKILLS = {
-    "flask", "django", "streamlit",
-    "machine learning", "nlp",
-    "pandas", "numpy", "docker",
-    "aws", "ci/cd", "react"
-}
+# "<taxonomy key>:<jd hash>" -> extract_requirements() output, so repeat
+# JDs skip both extraction and the job_descriptions lookup
+_JD_REQUIREMENTS = LRUCache(max_items=256)
 
 
 # --------------------------------------------------
@@ -47,40 +46,127 @@ def generate_resume_bullet(skill: str, job_description: str) -> str:
     return templates[hash(skill) % len(templates)].format(skill=skill)
 
 
+# --------------------------------------------------
+# Job Description Preprocessing (shared across resumes)
+# --------------------------------------------------
+def prepare_job_description(job_description: str) -> Dict[str, Any]:
+    """
+    Clean a job description and extract its skills once.
+
+    The returned profile can be passed to analyze_resume(jd_profile=...)
+    so screening many resumes against one posting skips JD work.
+    JD_LIBRARY roles return their precompiled profile. Other JDs have
+    their required/preferred skills cached in memory and in the
+    job_descriptions table by content hash, so a JD seen before (under
+    the same taxonomy) skips extraction.
+    """
+    if not job_description or not job_description.strip():
+        raise ValueError("Invalid job description.")
+
+    library_profile = get_library_profile(job_description)
+    if library_profile is not None:
+        return library_profile
+
+    digest = jd_hash(job_description)
+    taxonomy = f"{get_taxonomy().digest}:{PROFILE_FORMAT}"
+
+    cache_key = f"{taxonomy}:{digest}"
+    requirements = _JD_REQUIREMENTS.get(cache_key)
+
+    if requirements is None:
+        stored = load_job_description(digest, taxonomy)
+        if stored is not None and isinstance(stored["skills"], dict):
+            requirements = stored["skills"]
+        else:
+            requirements = extract_requirements(job_description)
+            save_job_description(job_description, requirements, taxonomy)
+        _JD_REQUIREMENTS.set(cache_key, requirements)
+
+    profile = build_jd_profile(job_description, requirements)
+    profile["hash"] = digest
+    return profile
+
+
 # --------------------------------------------------
 # Main ATS Resume Analyzer
 # --------------------------------------------------
 def analyze_resume(
     resume_file,
     job_description: str,
-    candidate_name: str = "Candidate"
+    candidate_name: str = "Candidate",
+    jd_profile: Optional[Dict[str, Any]] = None,
+    async_rewrites: bool = False,
+    resume_data: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
+    """
+    Run the full ATS pipeline for one resume.
+
+    With async_rewrites=True, step 10 runs in the background: the result
+    returns as soon as scoring is done, "rewrite_suggestions" starts empty
+    (and is filled in when generation finishes) and "rewrite_stream"
+    yields suggestions as they arrive.
+
+    Pass resume_data (a parse_resume() result, e.g. from a batch parser
+    worker) to skip step 1.
+
+    When tracing is enabled (utils.tracing), per-stage milliseconds are
+    returned under "timings_ms" and sent to the configured sinks.
+    """
+    trace = start_trace("analyze_resume", candidate=candidate_name)
+    try:
+        result = _run_pipeline(
+            trace, resume_file, job_description, candidate_name,
+            jd_profile, async_rewrites, resume_data
+        )
+    finally:
+        record = trace.finish()
+
+    if record:
+        result["timings_ms"] = dict(record["spans"], total=record["total_ms"])
+    return result
+
+
+def _run_pipeline(
+    trace,
+    resume_file,
+    job_description: str,
+    candidate_name: str,
+    jd_profile: Optional[Dict[str, Any]],
+    async_rewrites: bool,
+    resume_data: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """The 12 analysis stages; trace.lap() closes each one."""
 
     result: Dict[str, Any] = {}
 
     # ---------------------------
     # 1. Parse Resume
     # ---------------------------
-    resume_data = parse_resume(resume_file)
+    if resume_data is None:
+        resume_data = parse_resume(resume_file)
     if not resume_data or not resume_data.get("raw_text"):
         raise ValueError("Resume parsing failed or empty.")
 
     resume_text = resume_data["raw_text"]
+    trace.lap("parse")
 
-    if not job_description or not job_description.strip():
-        raise ValueError("Invalid job description.")
+    if jd_profile is None:
+        jd_profile = prepare_job_description(job_description)
+    job_description = jd_profile["text"]
+    trace.lap("jd_profile")
 
     # ---------------------------
     # 2. Clean Text
     # ---------------------------
     resume_text_clean = clean_text(resume_text)
-    jd_text_clean = clean_text(job_description)
+    trace.lap("clean")
 
     # ---------------------------
     # 3. Extract Skills
     # ---------------------------
     resume_skills = sorted(set(extract_skills(resume_text_clean)))
-    jd_skills = sorted(set(extract_skills(jd_text_clean)))
+    jd_skills = jd_profile["skills"]
+    trace.lap("extract")
 
     # ---------------------------
     # 4. ATS Skill Match Score
@@ -90,14 +176,15 @@ def analyze_resume(
         jd_skills=jd_skills
     )
 
+    weighted_score = calculate_weighted_score(resume_skills, jd_profile["weights"])
+    trace.lap("score")
+
     # ---------------------------
     # 5. Core Skill Risk Analysis
     # ---------------------------
     resume_set = set(resume_skills)
-    jd_set = set(jd_skills)
-
-    core_required = jd_set & CORE_SKILLS
-    core_missing = sorted(core_required - resume_set)
+    core_missing = sorted(set(jd_profile["core_required"]) - resume_set)
+    trace.lap("core_risk")
 
     # ---------------------------
     # 6. Resume Strength
@@ -106,11 +193,13 @@ def analyze_resume(
         resume_text=resume_text_clean,
         resume_skills=resume_skills
     )
+    trace.lap("strength")
 
     # ---------------------------
     # 7. Section Validation
     # ---------------------------
     sections_status = validate_resume_sections(resume_text_clean)
+    trace.lap("validate")
 
     # ---------------------------
     # 8. ATS Feedback
@@ -139,6 +228,7 @@ def analyze_resume(
         feedback.append(
             f"📄 Missing resume sections: {', '.join(missing_sections)}."
         )
+    trace.lap("feedback")
 
     # ---------------------------
     # 9. Skill Gap Roadmap
@@ -147,24 +237,17 @@ def analyze_resume(
         jd_skills=jd_skills,
         resume_skills=resume_skills
     )
+    trace.lap("roadmap")
 
     # ---------------------------
-    # 10. Rewrite Suggestions
-    # ---------------------------
-    try:
-        rewrite_suggestions = llm_rewrite_skills(
-            skills=missing_skills,
-            job_description=job_description
-        )
-    except Exception:
-        rewrite_suggestions = generate_rewrite_suggestions(missing_skills)
-
-    # ---------------------------
-    # 11. Final Result
+    # 10. Final Result
     # ---------------------------
+    # Complete before the rewrite stream starts: its callback fills in
+    # rewrite_suggestions and nothing may overwrite that afterwards.
     result.update({
         "candidate": candidate_name,
         "match_score": ats_score,
+        "weighted_score": weighted_score,
         "resume_strength": resume_strength,
         "matched_skills": matched_skills,
         "missing_skills": missing_skills,
@@ -172,8 +255,34 @@ def analyze_resume(
         "sections": sections_status,
         "feedback": feedback,
         "skill_gap_roadmap": skill_gap_roadmap,
-        "rewrite_suggestions": rewrite_suggestions
+        "rewrite_suggestions": []
     })
+    trace.lap("result")
+
+    # ---------------------------
+    # 11. Rewrite Suggestions
+    # ---------------------------
+    if async_rewrites:
+        # The rewrite thread only replaces this one existing key with a
+        # finished list (a single atomic store), so readers never see a
+        # partial value and no lock is needed
+        def _store_suggestions(items: List[Dict[str, str]]) -> None:
+            result["rewrite_suggestions"] = items
+
+        result["rewrite_stream"] = start_rewrite_stream(
+            missing_skills,
+            job_description,
+            on_complete=_store_suggestions
+        )
+    else:
+        try:
+            result["rewrite_suggestions"] = llm_rewrite_skills(
+                skills=missing_skills,
+                job_description=job_description
+            )
+        except Exception:
+            result["rewrite_suggestions"] = generate_rewrite_suggestions(missing_skills)
+    trace.lap("rewrite")
 
     # ---------------------------
     # 12. Save to Database
@@ -185,9 +294,63 @@ def analyze_resume(
             job_description=job_description,
             score=ats_score,
             matched_skills=matched_skills,
-            missing_skills=missing_skills
+            missing_skills=missing_skills,
+            resume_skills=resume_skills,
+            resume_strength=resume_strength
         )
     except Exception as e:
         logging.warning(f"Database save failed: {e}")
+    trace.lap("db_save")
 
     return result
+
+
+# --------------------------------------------------
+# Batch ATS Analyzer
+# --------------------------------------------------
+def analyze_resumes(
+    resumes: Iterable,
+    job_description: str,
+    candidate_name: str = "Candidate"
+) -> Iterator[Dict[str, Any]]:
+    """
+    Analyze many resumes against one job description.
+
+    The JD is cleaned and skill-extracted once up front; resumes are then
+    streamed through the pipeline one at a time, so memory stays flat.
+
+    Args:
+        resumes: Resume files/paths, or (candidate_name, resume_file) pairs.
+        job_description (str): Shared job description.
+        candidate_name (str): Default name for items without one.
+
+    Yields:
+        One result dict per resume, in input order. Resumes that fail
+        yield {"candidate": ..., "error": ...} instead of stopping the batch.
+    """
+    # Validate eagerly so a bad JD fails at call time, not on first next()
+    jd_profile = prepare_job_description(job_description)
+    return _iter_analyses(resumes, jd_profile, candidate_name)
+
+
+def _iter_analyses(
+    resumes: Iterable,
+    jd_profile: Dict[str, Any],
+    default_name: str
+) -> Iterator[Dict[str, Any]]:
+    for item in resumes:
+        if isinstance(item, tuple):
+            name, resume_file = item
+        else:
+            name, resume_file = default_name, item
+
+        try:
+            yield analyze_resume(
+                resume_file=resume_file,
+                job_description=jd_profile["text"],
+                candidate_name=name,
+                jd_profile=jd_profile
+            )
+        except Exception as e:
+            logging.warning(f"Batch analysis failed for {name}: {e}")
+            yield {"candidate": name, "error": str(e)}
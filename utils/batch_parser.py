@@ -0,0 +1,221 @@
+# utils/batch_parser.py
+"""
+Parallel resume ingestion for bulk screening.
+
+Fans resume files out across a ProcessPoolExecutor so pdfplumber layout
+analysis and Tesseract OCR use every core (one OCR thread per worker):
+- Configurable worker count and bounded in-flight submissions
+- Per-file timeout, enforced inside the worker
+- Crash isolation: if a malformed PDF kills a worker, the affected files
+  are retried one by one in a fresh single-worker pool
+- Ordered or as-completed delivery
+"""
+
+import logging
+import os
+import signal
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from . import parser
+from .parser import parse_resume
+
+SUPPORTED_EXTENSIONS = (".pdf", ".docx")
+
+DEFAULT_TIMEOUT = 120.0
+
+
+class ParseTimeout(BaseException):
+    """
+    Raised inside a worker when a file exceeds its time budget.
+
+    BaseException on purpose: parse_resume swallows Exception.
+    """
+
+
+# --------------------------------------------------
+# Input Collection
+# --------------------------------------------------
+def collect_resume_files(
+    source: Union[str, os.PathLike, Iterable[Union[str, os.PathLike]]]
+) -> List[str]:
+    """
+    Expand a directory (recursively) or an iterable of paths into
+    a list of supported resume files.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        root = Path(source)
+        if root.is_dir():
+            return sorted(
+                str(p) for p in root.rglob("*")
+                if p.is_file() and p.suffix.lower() in SUPPORTED_EXTENSIONS
+            )
+        return [str(root)]
+
+    return [str(p) for p in source]
+
+
+# --------------------------------------------------
+# Worker
+# --------------------------------------------------
+def _raise_timeout(signum, frame):
+    raise ParseTimeout()
+
+
+def _init_worker() -> None:
+    # Every core already has its own worker process: OCR pages serially
+    # instead of cpu_count() Tesseract threads per worker
+    parser.OCR_THREADS = 1
+
+
+def _record(
+    path: str,
+    resume: Optional[Dict[str, Any]] = None,
+    error: Optional[str] = None,
+    elapsed: float = 0.0
+) -> Dict[str, Any]:
+    return {
+        "path": path,
+        "resume": resume,
+        "error": error,
+        "elapsed": round(elapsed, 4)
+    }
+
+
+def _parse_worker(path: str, timeout: Optional[float]) -> Dict[str, Any]:
+    """Parse one file in a worker process under a wall-clock budget."""
+    use_alarm = bool(timeout) and hasattr(signal, "setitimer")
+    start = time.perf_counter()
+
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+
+    try:
+        resume = parse_resume(path)
+    except ParseTimeout:
+        return _record(path, error=f"timed out after {timeout}s",
+                       elapsed=time.perf_counter() - start)
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+    elapsed = time.perf_counter() - start
+    if not resume:
+        return _record(path, error="parsing failed or empty", elapsed=elapsed)
+    return _record(path, resume=resume, elapsed=elapsed)
+
+
+def _parse_isolated(path: str, timeout: Optional[float]) -> Dict[str, Any]:
+    """Re-run a suspect file alone so a crash only takes itself down."""
+    with ProcessPoolExecutor(max_workers=1, initializer=_init_worker) as executor:
+        try:
+            return executor.submit(_parse_worker, path, timeout).result()
+        except BrokenProcessPool:
+            logging.warning(f"Resume parser worker crashed on {path}")
+            return _record(path, error="worker crashed")
+        except Exception as e:
+            return _record(path, error=str(e))
+
+
+# --------------------------------------------------
+# Parallel Ingestion
+# --------------------------------------------------
+def parse_resumes_parallel(
+    resumes: Union[str, os.PathLike, Iterable[Union[str, os.PathLike]]],
+    max_workers: Optional[int] = None,
+    timeout: Optional[float] = DEFAULT_TIMEOUT,
+    ordered: bool = True
+) -> Iterator[Dict[str, Any]]:
+    """
+    Parse many resumes in parallel.
+
+    Args:
+        resumes: Directory, single path, or iterable of paths. An
+            iterable is consumed lazily, as workers free up.
+        max_workers (int): Worker processes (default: CPU count).
+        timeout (float): Per-file budget in seconds (None disables it;
+            not enforced on platforms without SIGALRM).
+        ordered (bool): Yield in input order instead of as completed.
+
+    Yields:
+        {"path", "resume", "error", "elapsed"} per file; "resume" is the
+        parse_resume() dict, or None with "error" set.
+    """
+    if isinstance(resumes, (str, os.PathLike)):
+        paths: Iterable[str] = collect_resume_files(resumes)
+    else:
+        paths = (str(p) for p in resumes)
+    workers = max_workers or os.cpu_count() or 1
+    return _iter_parallel(paths, workers, timeout, ordered)
+
+
+def _iter_parallel(
+    paths: Iterable[str],
+    workers: int,
+    timeout: Optional[float],
+    ordered: bool
+) -> Iterator[Dict[str, Any]]:
+    # Pulled lazily: at most max_in_flight paths are taken ahead of workers
+    pending: Iterator[Tuple[int, str]] = iter(enumerate(paths))
+    exhausted = False
+    in_flight: Dict[Any, Tuple[int, str]] = {}
+    finished: Dict[int, Dict[str, Any]] = {}
+    next_index = 0
+    max_in_flight = workers * 2
+    # Ordered mode buffers results behind a slow head; cap that too
+    max_buffered = workers * 8
+
+    executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+    try:
+        while not exhausted or in_flight:
+            while (
+                not exhausted
+                and len(in_flight) < max_in_flight
+                and len(finished) < max_buffered
+            ):
+                item = next(pending, None)
+                if item is None:
+                    exhausted = True
+                    break
+                index, path = item
+                future = executor.submit(_parse_worker, path, timeout)
+                in_flight[future] = (index, path)
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            completed: List[Tuple[int, Dict[str, Any]]] = []
+            suspects: List[Tuple[int, str]] = []
+
+            for future in done:
+                index, path = in_flight.pop(future)
+                try:
+                    completed.append((index, future.result()))
+                except BrokenProcessPool:
+                    suspects.append((index, path))
+                except Exception as e:
+                    completed.append((index, _record(path, error=str(e))))
+
+            if suspects:
+                # A dead worker poisons the whole pool: recycle it and
+                # retry every unfinished file in isolation.
+                suspects.extend(in_flight.values())
+                in_flight.clear()
+                executor.shutdown(wait=False, cancel_futures=True)
+                for index, path in sorted(suspects):
+                    completed.append((index, _parse_isolated(path, timeout)))
+                executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+
+            if not ordered:
+                for _, record in completed:
+                    yield record
+                continue
+
+            finished.update(completed)
+            while next_index in finished:
+                yield finished.pop(next_index)
+                next_index += 1
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
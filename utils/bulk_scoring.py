@@ -0,0 +1,171 @@
+# utils/bulk_scoring.py
+"""
+Bulk scoring: many resumes x many job descriptions at once.
+
+Skill lists are encoded as binary matrices over a shared, sorted skill
+vocabulary (only the skills present in the inputs). One matrix
+product gives every resume/JD matched-skill count; scores, matched and
+missing lists are derived from it and are identical to
+calculate_match_score / calculate_resume_strength.
+
+NumPy is optional: without it the same API falls back to the scalar
+functions.
+"""
+
+import logging
+from typing import Any, Dict, List, Sequence, Tuple
+
+from .scoring import calculate_match_score, calculate_resume_strength
+
+# ---------------------------
+# Check NumPy availability
+# ---------------------------
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    logging.warning("NumPy not installed. Bulk scoring falls back to scalar loops.")
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+class SkillSpace:
+    """
+    Sorted vocabulary of the skills that occur in the inputs; column i of
+    every matrix is skills[i]. Matrices stay N x (skills in use), not
+    N x (whole taxonomy).
+    """
+
+    def __init__(self, *skill_lists: Sequence[Sequence[str]]):
+        vocabulary = set()
+        for lists in skill_lists:
+            for skills in lists:
+                vocabulary.update(map(str.lower, skills or []))
+
+        # Sorted columns => np.nonzero yields skills in sorted order
+        self.skills: List[str] = sorted(vocabulary)
+        self.index: Dict[str, int] = {s: i for i, s in enumerate(self.skills)}
+
+    def encode(self, skill_lists: Sequence[Sequence[str]]) -> "np.ndarray":
+        """Binary (len(skill_lists) x vocabulary) matrix."""
+        matrix = np.zeros((len(skill_lists), len(self.skills)), dtype=np.float32)
+        for row, skills in enumerate(skill_lists):
+            columns = [self.index[s] for s in set(map(str.lower, skills or []))]
+            matrix[row, columns] = 1.0
+        return matrix
+
+    def decode(self, row: "np.ndarray") -> List[str]:
+        return [self.skills[i] for i in np.flatnonzero(row)]
+
+
+class BulkScores:
+    """Resume x JD score matrix with on-demand matched/missing lists."""
+
+    def __init__(
+        self,
+        resume_skills: Sequence[Sequence[str]],
+        jd_skills: Sequence[Sequence[str]]
+    ):
+        self.resume_skills = resume_skills
+        self.jd_skills = jd_skills
+
+        if not NUMPY_AVAILABLE:
+            self.space = None
+            self.scores = [
+                [calculate_match_score(r, j)[0] for j in jd_skills]
+                for r in resume_skills
+            ]
+            return
+
+        self.space = SkillSpace(resume_skills, jd_skills)
+        resumes = self.space.encode(resume_skills)
+        jds = self.space.encode(jd_skills)
+        self.resumes = resumes.astype(bool)
+        self.jds = jds.astype(bool)
+
+        # float32 products of 0/1 vectors are exact for < 2**24 skills
+        self.matched_counts = (resumes @ jds.T).astype(np.int32)
+        self.jd_sizes = self.jds.sum(axis=1)
+
+        # float64 division then *100, rounded half-to-even: the same
+        # operations, in the same order, as the scalar score
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = self.matched_counts / self.jd_sizes.astype(np.float64)
+        self.scores = np.where(
+            self.jd_sizes > 0, np.rint(ratio * 100), 0
+        ).astype(np.int32)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return len(self.resume_skills), len(self.jd_skills)
+
+    def matched(self, resume: int, jd: int) -> List[str]:
+        if self.space is None:
+            return calculate_match_score(self.resume_skills[resume], self.jd_skills[jd])[1]
+        return self.space.decode(self.resumes[resume] & self.jds[jd])
+
+    def missing(self, resume: int, jd: int) -> List[str]:
+        if self.space is None:
+            return calculate_match_score(self.resume_skills[resume], self.jd_skills[jd])[2]
+        return self.space.decode(self.jds[jd] & ~self.resumes[resume])
+
+    def result(self, resume: int, jd: int) -> Tuple[int, List[str], List[str]]:
+        """Same tuple calculate_match_score would return for this pair."""
+        return (
+            int(self.scores[resume][jd]),
+            self.matched(resume, jd),
+            self.missing(resume, jd)
+        )
+
+    def top_resumes(self, jd: int, k: int = 10) -> List[Dict[str, Any]]:
+        """Best k resumes for one JD (ties keep input order)."""
+        column = [int(s) for s in (
+            self.scores[:, jd] if self.space is not None
+            else [row[jd] for row in self.scores]
+        )]
+        order = sorted(range(len(column)), key=lambda i: -column[i])[:k]
+        return [{"resume": i, "score": column[i]} for i in order]
+
+
+# --------------------------------------------------
+# Public API
+# --------------------------------------------------
+def bulk_match_scores(
+    resume_skills: Sequence[Sequence[str]],
+    jd_skills: Sequence[Sequence[str]]
+) -> BulkScores:
+    """
+    Score every resume against every JD.
+
+    Args:
+        resume_skills: One skill list per resume.
+        jd_skills: One skill list per job description.
+
+    Returns:
+        BulkScores: .scores[i][j] is calculate_match_score(resume i, JD j)[0];
+        .matched(i, j) / .missing(i, j) give the skill lists.
+    """
+    return BulkScores(resume_skills, jd_skills)
+
+
+def bulk_resume_strength(
+    resume_texts: Sequence[str],
+    resume_skills: Sequence[Sequence[str]]
+) -> List[int]:
+    """calculate_resume_strength for many resumes."""
+    if not NUMPY_AVAILABLE:
+        return [
+            calculate_resume_strength(text, skills)
+            for text, skills in zip(resume_texts, resume_skills)
+        ]
+
+    word_count = np.array([len(t.split()) if t else 0 for t in resume_texts], dtype=np.float64)
+    skill_count = np.array([len(s or []) for s in resume_skills], dtype=np.float64)
+    has_text = np.array([bool(t) for t in resume_texts])
+
+    length_score = np.minimum(word_count / 600, 1.0)
+    skill_score = np.minimum(skill_count / 20, 1.0)
+    length_score = np.where(word_count < 250, length_score * 0.6, length_score)
+
+    strength = (0.6 * length_score) + (0.4 * skill_score)
+    return np.where(has_text, np.rint(strength * 100), 0).astype(int).tolist()
@@ -0,0 +1,192 @@
+# utils/cache.py
+"""
+Small two-tier cache used by the parser and the LLM rewriter.
+
+- LRUCache: in-process, bounded by item count, optional TTL
+- SQLiteCache: persistent, bounded by total payload bytes
+  (least-recently-used rows are evicted first), optional TTL
+- TieredCache: memory in front of disk, with hit/miss counters
+
+Values must be JSON-serializable.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+CACHE_DIR = Path(os.environ.get("RESUME_ANALYZER_CACHE_DIR", ".cache"))
+
+
+class LRUCache:
+    """Thread-safe in-memory LRU cache with optional TTL."""
+
+    def __init__(self, max_items: int = 128, ttl: Optional[float] = None):
+        self.max_items = max_items
+        self.ttl = ttl
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if self.ttl is not None and time.time() - entry[0] > self.ttl:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.time(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_items:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SQLiteCache:
+    """Persistent key/value cache with size-based LRU eviction."""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_bytes: int = 256 * 1024 * 1024,
+        ttl: Optional[float] = None
+    ):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        # Never reuse a connection inherited across fork (process pools)
+        if self._conn is None or self._pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created REAL NOT NULL,
+                    accessed REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_accessed ON cache(accessed)")
+            conn.commit()
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            with self._lock:
+                conn = self._connect()
+                row = conn.execute(
+                    "SELECT value, created FROM cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+
+                now = time.time()
+                if self.ttl is not None and now - row[1] > self.ttl:
+                    conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                    conn.commit()
+                    return None
+
+                conn.execute("UPDATE cache SET accessed = ? WHERE key = ?", (now, key))
+                conn.commit()
+            return json.loads(row[0])
+        except (sqlite3.Error, ValueError) as e:
+            logging.warning(f"Cache read failed ({self.path}): {e}")
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        try:
+            payload = json.dumps(value)
+            now = time.time()
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, value, size, created, accessed) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, payload, len(payload), now, now)
+                )
+                self._evict(conn)
+                conn.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logging.warning(f"Cache write failed ({self.path}): {e}")
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        excess = total - self.max_bytes
+        freed = 0
+        stale = []
+        for key, size in conn.execute("SELECT key, size FROM cache ORDER BY accessed"):
+            stale.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        conn.executemany("DELETE FROM cache WHERE key = ?", stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM cache")
+            conn.commit()
+
+
+class TieredCache:
+    """Memory tier in front of an optional disk tier."""
+
+    def __init__(self, memory: LRUCache, disk: Optional[SQLiteCache] = None):
+        self.memory = memory
+        self.disk = disk
+        self.stats: Dict[str, int] = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self.memory.get(key)
+        if value is not None:
+            self.stats["memory_hits"] += 1
+            return value
+
+        if self.disk is not None:
+            value = self.disk.get(key)
+            if value is not None:
+                self.stats["disk_hits"] += 1
+                self.memory.set(key, value)
+                return value
+
+        self.stats["misses"] += 1
+        return None
+
+    def set(self, key: str, value: Any) -> None:
+        self.memory.set(key, value)
+        if self.disk is not None:
+            self.disk.set(key, value)
+
+    def clear(self) -> None:
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
@@ -1,75 +1,844 @@
 # utils/database.py
+"""
+SQLite results store.
 
-import sqlite3
+- ConnectionPool: one connection per thread (and per process, so forked
+  workers never share a handle), opened in WAL mode with tuned pragmas
+  and closed when its thread exits.
+  Statements are reused through sqlite3's per-connection statement cache.
+- Skills are normalized into skills / result_skills (kind = matched or
+  missing); the schema is versioned with PRAGMA user_version and
+  migrated (with backfill) by init_db(). Each migration and its version
+  bump commit together, and every step is safe to re-run.
+- Job descriptions are stored once in job_descriptions, keyed by the
+  SHA-256 of their text, together with their extracted skill set;
+  results reference them by jd_hash.
+- Reads are served from indexes on timestamp, score and candidate, with
+  column projection and keyset pagination (query_results).
+- Writes go through a background writer that batches queued save_result()
+  calls into a single transaction; flush() waits for the queue to drain
+  and runs automatically at interpreter exit.
+"""
+
+import atexit
+from contextlib import contextmanager
 import json
+import os
+import queue
+import sqlite3
+import threading
+import weakref
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .hashing import jd_hash, resume_hash
+
+DB_PATH = Path(os.environ.get("RESUME_ANALYZER_DB", "resume_analyzer.db"))
+
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-16000",     # ~16 MB page cache per connection
+    "PRAGMA mmap_size=134217728",   # 128 MB
+)
+
+# Max rows committed per writer transaction
+WRITE_BATCH_SIZE = 64
+
+SCHEMA_SQL = """
+    CREATE TABLE IF NOT EXISTS results (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        candidate_name TEXT,
+        job_description TEXT,
+        score INTEGER,
+        matched_skills TEXT,
+        missing_skills TEXT,
+        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+INDEX_SQL = """
+    CREATE INDEX IF NOT EXISTS idx_results_timestamp ON results(timestamp, id);
+    CREATE INDEX IF NOT EXISTS idx_results_score ON results(score, timestamp, id);
+    CREATE INDEX IF NOT EXISTS idx_results_candidate ON results(candidate_name, timestamp, id);
+"""
+
+RESULT_COLUMNS = (
+    "id", "candidate_name", "job_description", "score",
+    "matched_skills", "missing_skills", "timestamp", "jd_hash", "resume_strength",
+    "resume_hash"
+)
+# Columns that are not stored on results itself
+COLUMN_SQL = {
+    "job_description": (
+        "COALESCE(results.job_description, "
+        "(SELECT text FROM job_descriptions WHERE hash = results.jd_hash))"
+    ),
+}
+# Everything except the job description blob
+SUMMARY_COLUMNS = (
+    "id", "candidate_name", "score", "matched_skills", "missing_skills", "timestamp"
+)
+JSON_COLUMNS = ("matched_skills", "missing_skills")
+
+# Bump together with a new entry in MIGRATIONS
+SCHEMA_VERSION = 4
+
+# "resume" = every skill found on the resume (used for re-ranking)
+SKILL_KINDS = ("matched", "missing", "resume")
+
+INSERT_RESULT_SQL = """
+    INSERT INTO results (
+        candidate_name, jd_hash, score, matched_skills, missing_skills,
+        resume_strength, resume_hash
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+INSERT_JD_SQL = "INSERT OR IGNORE INTO job_descriptions (hash, text) VALUES (?, ?)"
+
+UPSERT_JD_SKILLS_SQL = """
+    INSERT INTO job_descriptions (hash, text, skills, taxonomy) VALUES (?, ?, ?, ?)
+    ON CONFLICT(hash) DO UPDATE SET skills = excluded.skills, taxonomy = excluded.taxonomy
+"""
+
+INSERT_SKILL_SQL = "INSERT OR IGNORE INTO skills (name) VALUES (?)"
+
+INSERT_RESULT_SKILL_SQL = """
+    INSERT OR IGNORE INTO result_skills (result_id, kind, skill_id)
+    SELECT ?, ?, id FROM skills WHERE name = ?
+"""
+
+FETCH_RESULTS_SQL = f"""
+    SELECT id, candidate_name, {COLUMN_SQL["job_description"]}, score,
+           matched_skills, missing_skills, timestamp
+    FROM results ORDER BY timestamp DESC LIMIT ?
+"""
+
+
+# --------------------------------------------------
+# Transactions
+# --------------------------------------------------
+@contextmanager
+def _transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """
+    Explicit write transaction (connections run in autocommit mode, so
+    DDL is covered too). Commits on success, rolls back on any error.
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+def _has_column(conn: sqlite3.Connection, table: str, column: str) -> bool:
+    return any(row[1] == column for row in conn.execute(f"PRAGMA table_info({table})"))
+
+
+# --------------------------------------------------
+# Migrations
+# --------------------------------------------------
+def _migrate_v1(conn: sqlite3.Connection) -> None:
+    """Normalized skill tables, backfilled from the JSON columns."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS skills (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS result_skills (
+            result_id INTEGER NOT NULL REFERENCES results(id) ON DELETE CASCADE,
+            kind TEXT NOT NULL CHECK (kind IN ('matched', 'missing')),
+            skill_id INTEGER NOT NULL REFERENCES skills(id),
+            PRIMARY KEY (result_id, kind, skill_id)
+        ) WITHOUT ROWID
+    """)
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_result_skills_kind "
+        "ON result_skills(kind, skill_id, result_id)"
+    )
+
+    for kind in ("matched", "missing"):
+        column = f"{kind}_skills"
+        conn.execute(f"""
+            INSERT OR IGNORE INTO skills (name)
+            SELECT DISTINCT j.value FROM results r, json_each(r.{column}) j
+            WHERE json_valid(r.{column}) AND j.type = 'text'
+        """)
+        conn.execute(f"""
+            INSERT OR IGNORE INTO result_skills (result_id, kind, skill_id)
+            SELECT r.id, '{kind}', s.id
+            FROM results r, json_each(r.{column}) j
+            JOIN skills s ON s.name = j.value
+            WHERE json_valid(r.{column})
+        """)
+
+
+def _migrate_v2(conn: sqlite3.Connection) -> None:
+    """Move job description text out of results into job_descriptions."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS job_descriptions (
+            hash TEXT PRIMARY KEY,
+            text TEXT NOT NULL,
+            skills TEXT,
+            taxonomy TEXT,
+            created DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    if not _has_column(conn, "results", "jd_hash"):
+        conn.execute("ALTER TABLE results ADD COLUMN jd_hash TEXT REFERENCES job_descriptions(hash)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_results_jd_hash ON results(jd_hash)")
+
+    conn.create_function("jd_hash", 1, jd_hash, deterministic=True)
+    conn.execute("""
+        INSERT OR IGNORE INTO job_descriptions (hash, text)
+        SELECT jd_hash(job_description), job_description FROM results
+        WHERE job_description IS NOT NULL
+        GROUP BY job_description
+    """)
+    conn.execute("""
+        UPDATE results SET jd_hash = jd_hash(job_description), job_description = NULL
+        WHERE job_description IS NOT NULL
+    """)
+
+
+def _migrate_v3(conn: sqlite3.Connection) -> None:
+    """Store resume strength and the full resume skill set per result."""
+    if not _has_column(conn, "results", "resume_strength"):
+        conn.execute("ALTER TABLE results ADD COLUMN resume_strength INTEGER")
+
+    # SQLite can't alter a CHECK constraint: rebuild result_skills
+    table_sql = conn.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'result_skills'"
+    ).fetchone()[0]
+    if "'resume'" not in table_sql:
+        conn.execute("DROP TABLE IF EXISTS result_skills_v3")
+        conn.execute("""
+            CREATE TABLE result_skills_v3 (
+                result_id INTEGER NOT NULL REFERENCES results(id) ON DELETE CASCADE,
+                kind TEXT NOT NULL CHECK (kind IN ('matched', 'missing', 'resume')),
+                skill_id INTEGER NOT NULL REFERENCES skills(id),
+                PRIMARY KEY (result_id, kind, skill_id)
+            ) WITHOUT ROWID
+        """)
+        conn.execute("INSERT INTO result_skills_v3 SELECT result_id, kind, skill_id FROM result_skills")
+        conn.execute("DROP TABLE result_skills")
+        conn.execute("ALTER TABLE result_skills_v3 RENAME TO result_skills")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_result_skills_kind "
+        "ON result_skills(kind, skill_id, result_id)"
+    )
+
+    # Older results only recorded JD-relevant skills: matched is the best
+    # available lower bound for what the resume contained
+    conn.execute("""
+        INSERT OR IGNORE INTO result_skills (result_id, kind, skill_id)
+        SELECT result_id, 'resume', skill_id FROM result_skills WHERE kind = 'matched'
+    """)
+
+
+def _migrate_v4(conn: sqlite3.Connection) -> None:
+    """Identify resumes by content hash (older rows stay NULL: one entry each)."""
+    if not _has_column(conn, "results", "resume_hash"):
+        conn.execute("ALTER TABLE results ADD COLUMN resume_hash TEXT")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_results_resume ON results(resume_hash, id)")
+
+
+MIGRATIONS: List[Tuple[int, Callable[[sqlite3.Connection], None]]] = [
+    (1, _migrate_v1),
+    (2, _migrate_v2),
+    (3, _migrate_v3),
+    (4, _migrate_v4),
+]
+
+
+def _migrate(conn: sqlite3.Connection) -> None:
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+        return
+    for version, migration in MIGRATIONS:
+        with _transaction(conn):
+            # Re-read under the write lock: another process may have migrated
+            if conn.execute("PRAGMA user_version").fetchone()[0] >= version:
+                continue
+            migration(conn)
+            conn.execute(f"PRAGMA user_version = {version}")
+
+
+# --------------------------------------------------
+# Connection Pool
+# --------------------------------------------------
+class _ThreadConnection:
+    """Per-thread holder; its finalizer closes the connection when the thread exits."""
+
+    __slots__ = ("conn", "pid", "__weakref__")
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self.pid = os.getpid()
+
+
+class ConnectionPool:
+    """
+    Thread-local SQLite connections for a single database file.
+
+    A connection lives as long as the thread that opened it: thread-local
+    storage is dropped at thread exit, which closes the connection, so
+    short-lived threads (e.g. one per Streamlit rerun) don't leak handles.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: Dict[int, sqlite3.Connection] = {}
+
+    def connection(self) -> sqlite3.Connection:
+        holder = getattr(self._local, "holder", None)
+        if holder is not None and holder.pid == os.getpid():
+            return holder.conn
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(
+            self.path,
+            timeout=30,
+            check_same_thread=False,
+            cached_statements=256,
+            isolation_level=None  # autocommit; writes use _transaction()
+        )
+        for pragma in PRAGMAS:
+            conn.execute(pragma)
+
+        holder = self._local.holder = _ThreadConnection(conn)
+        # Not at interpreter exit: the atexit flush() still needs the writer's connection
+        weakref.finalize(holder, self._release, conn, os.getpid()).atexit = False
+        with self._lock:
+            self._connections[id(conn)] = conn
+        return conn
+
+    def _release(self, conn: sqlite3.Connection, pid: int) -> None:
+        with self._lock:
+            self._connections.pop(id(conn), None)
+        if pid != os.getpid():
+            return  # inherited across fork: the parent still owns it
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+    @property
+    def open_connections(self) -> int:
+        with self._lock:
+            return len(self._connections)
+
+    def close_all(self) -> None:
+        with self._lock:
+            connections = list(self._connections.values())
+        for conn in connections:
+            self._release(conn, os.getpid())
+        self._local = threading.local()
+
+
+_POOLS: dict = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def get_pool(path: Optional[Path] = None) -> ConnectionPool:
+    """Process-wide pool for a database path (DB_PATH by default)."""
+    path = Path(path or DB_PATH)
+    with _POOLS_LOCK:
+        pool = _POOLS.get(path)
+        if pool is None:
+            pool = _POOLS[path] = ConnectionPool(path)
+        return pool
+
+
+def get_connection() -> sqlite3.Connection:
+    """This thread's pooled connection to DB_PATH."""
+    return get_pool().connection()
+
+
+# (pid, path) pairs whose schema init_db() has brought up to date
+_READY: set = set()
+
+
+def _reader_connection() -> sqlite3.Connection:
+    """Like get_connection(), but runs init_db() first, once per process and path."""
+    if (os.getpid(), get_pool().path) not in _READY:
+        init_db()
+    return get_connection()
+
+
+# --------------------------------------------------
+# Batched Writer
+# --------------------------------------------------
+WriteHandler = Callable[[sqlite3.Connection, List[Any]], None]
+
+
+class BatchWriter:
+    """
+    Single background thread that drains queued writes and commits them
+    in groups of up to WRITE_BATCH_SIZE rows. Whatever queues up while a
+    transaction is committing goes out together in the next one.
+
+    A write is (handler, row); consecutive rows with the same handler are
+    passed to handler(conn, rows) together. If a batch fails, its rows are
+    retried one transaction each, so a bad row only loses itself; errors
+    are logged and never stop the thread.
+    """
+
+    def __init__(self, batch_size: int = WRITE_BATCH_SIZE):
+        self.batch_size = batch_size
+        self._queue: "queue.Queue[Tuple[WriteHandler, Any]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+        # Rows queued or being written; flush() waits for it to reach 0
+        self._pending = 0
+        self._idle = threading.Condition()
+
+    def _ensure_started(self) -> None:
+        # Threads don't survive fork: restart in each process that writes
+        if self._thread is not None and self._thread.is_alive() and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive() and self._pid == os.getpid():
+                return
+            if self._pid != os.getpid():
+                self._queue = queue.Queue()
+                self._pending = 0
+                self._idle = threading.Condition()
+            self._pid = os.getpid()
+            self._thread = threading.Thread(
+                target=self._run, name="db-writer", daemon=True
+            )
+            self._thread.start()
+
+    def submit(self, handler: "WriteHandler", row: Any) -> None:
+        self._ensure_started()
+        with self._idle:
+            self._pending += 1
+        self._queue.put((handler, row))
 
-DB_PATH = Path("resume_analyzer.db")
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every queued write is committed. False on timeout."""
+        if self._thread is None or self._pid != os.getpid():
+            return True
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
 
+    def _run(self) -> None:
+        init_db()
+        while True:
+            batch = [self._queue.get()]
+            try:
+                while len(batch) < self.batch_size:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
 
+            try:
+                self._write(batch)
+            finally:
+                with self._idle:
+                    self._pending -= len(batch)
+                    if self._pending == 0:
+                        self._idle.notify_all()
+
+    def _write(self, batch: List[Tuple["WriteHandler", Any]]) -> None:
+        try:
+            self._commit(batch)
+            return
+        except Exception as e:
+            if len(batch) == 1:
+                print(f"[ERROR] Failed to save 1 result: {e}")
+                return
+
+        for write in batch:
+            try:
+                self._commit([write])
+            except Exception as e:
+                print(f"[ERROR] Failed to save 1 result: {e}")
+
+    def _commit(self, batch: List[Tuple["WriteHandler", Any]]) -> None:
+        conn = get_connection()
+        with _transaction(conn):
+            start = 0
+            while start < len(batch):
+                handler = batch[start][0]
+                end = start
+                while end < len(batch) and batch[end][0] is handler:
+                    end += 1
+                handler(conn, [row for _, row in batch[start:end]])
+                start = end
+
+
+WRITER = BatchWriter()
+
+
+def flush(timeout: Optional[float] = None) -> bool:
+    """Wait for queued save_result() calls to reach the database."""
+    return WRITER.flush(timeout)
+
+
+atexit.register(flush, 10.0)
+
+
+# --------------------------------------------------
+# Public API
+# --------------------------------------------------
 def init_db() -> None:
-    """Initialize SQLite database with the results table."""
+    """Create the results table and indexes, then apply pending migrations."""
     try:
-        with sqlite3.connect(DB_PATH) as conn:
-            c = conn.cursor()
-            c.execute("""
-                CREATE TABLE IF NOT EXISTS results (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    candidate_name TEXT,
-                    job_description TEXT,
-                    score INTEGER,
-                    matched_skills TEXT,
-                    missing_skills TEXT,
-                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            conn.commit()
+        conn = get_connection()
+        with _transaction(conn):
+            conn.execute(SCHEMA_SQL)
+            for statement in filter(str.strip, INDEX_SQL.split(";")):
+                conn.execute(statement)
+        _migrate(conn)
+        conn.execute("PRAGMA optimize")
+        _READY.add((os.getpid(), get_pool().path))
     except sqlite3.Error as e:
         print(f"[ERROR] Failed to initialize database: {e}")
 
 
+def load_job_description(digest: str, taxonomy: str = "") -> Optional[Dict[str, Any]]:
+    """
+    Stored JD with its cached skill set, or None if unknown.
+
+    "skills" is None when nothing was cached yet or the cached set was
+    extracted with a different taxonomy (key mismatch).
+
+    Doesn't flush(): a JD still queued is simply extracted again, which is
+    cheaper than waiting on the writer in the analysis hot path.
+    """
+    try:
+        conn = _reader_connection()
+        row = conn.execute(
+            "SELECT text, skills, taxonomy FROM job_descriptions WHERE hash = ?",
+            (digest,)
+        ).fetchone()
+    except sqlite3.Error as e:
+        print(f"[ERROR] Failed to load job description: {e}")
+        return None
+
+    if row is None:
+        return None
+
+    text, skills, stored_taxonomy = row
+    if skills is not None and stored_taxonomy == taxonomy:
+        skills = json.loads(skills)
+    else:
+        skills = None
+    return {"hash": digest, "text": text, "skills": skills}
+
+
+def iter_job_descriptions(batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+    """All stored JDs as {"hash", "text", "skills", "taxonomy"} (skills decoded)."""
+    flush()
+    try:
+        cursor = _reader_connection().execute(
+            "SELECT hash, text, skills, taxonomy FROM job_descriptions ORDER BY created, hash"
+        )
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            for digest, text, skills, taxonomy in rows:
+                yield {
+                    "hash": digest,
+                    "text": text,
+                    "skills": json.loads(skills) if skills is not None else None,
+                    "taxonomy": taxonomy
+                }
+    except sqlite3.Error as e:
+        print(f"[ERROR] Failed to read job descriptions: {e}")
+
+
+def save_job_description(job_description: str, skills: Any, taxonomy: str = "") -> str:
+    """Queue a JD and its extracted skills (any JSON value) for storage; returns its hash."""
+    digest = jd_hash(job_description)
+    WRITER.submit(_upsert_job_descriptions, (digest, job_description, json.dumps(skills), taxonomy))
+    return digest
+
+
+def _upsert_job_descriptions(conn: sqlite3.Connection, rows: List[Tuple]) -> None:
+    conn.executemany(UPSERT_JD_SKILLS_SQL, rows)
+
+
 def save_result(
     candidate_name: str = "Candidate",
     resume_text: str = "",
     job_description: str = "",
     score: int = 0,
     matched_skills: Optional[List[str]] = None,
-    missing_skills: Optional[List[str]] = None
+    missing_skills: Optional[List[str]] = None,
+    resume_skills: Optional[List[str]] = None,
+    resume_strength: Optional[int] = None
 ) -> None:
-    """Save ATS analysis result to the database."""
+    """
+    Queue an ATS analysis result for the background writer.
+
+    The row is encoded here, so bad input (e.g. skills that aren't JSON
+    serializable) raises in the caller instead of inside the writer.
+    """
     matched_skills = matched_skills or []
     missing_skills = missing_skills or []
+    resume_skills = sorted(set(resume_skills or matched_skills))
+
+    WRITER.submit(_insert_results, (
+        candidate_name,
+        jd_hash(job_description),
+        job_description,
+        score,
+        json.dumps(matched_skills),
+        json.dumps(missing_skills),
+        resume_strength,
+        resume_hash(resume_text),
+        tuple(
+            (kind, skill)
+            for kind, skills in (
+                ("matched", matched_skills),
+                ("missing", missing_skills),
+                ("resume", resume_skills)
+            )
+            for skill in skills
+        )
+    ))
 
-    try:
-        with sqlite3.connect(DB_PATH) as conn:
-            c = conn.cursor()
-            c.execute("""
-                INSERT INTO results (candidate_name, job_description, score, matched_skills, missing_skills)
-                VALUES (?, ?, ?, ?, ?)
-            """, (
-                candidate_name,
-                job_description,
-                score,
-                json.dumps(matched_skills),
-                json.dumps(missing_skills)
-            ))
-            conn.commit()
-    except sqlite3.Error as e:
-        print(f"[ERROR] Failed to save result: {e}")
+
+def _insert_results(conn: sqlite3.Connection, rows: List[Tuple]) -> None:
+    """Writer handler: results rows plus their normalized skills."""
+    conn.executemany(INSERT_JD_SQL, {(row[1], row[2]) for row in rows})
+
+    for (candidate_name, digest, _, score, matched, missing,
+         strength, resume_digest, skill_kinds) in rows:
+        cursor = conn.execute(INSERT_RESULT_SQL, (
+            candidate_name, digest, score, matched, missing, strength, resume_digest
+        ))
+        result_id = cursor.lastrowid
+
+        conn.executemany(INSERT_SKILL_SQL, {(skill,) for _, skill in skill_kinds})
+        conn.executemany(INSERT_RESULT_SKILL_SQL, [
+            (result_id, kind, skill) for kind, skill in skill_kinds
+        ])
 
 
 def fetch_results(limit: int = 10) -> List[Tuple]:
     """Fetch past analysis results from the database."""
+    # Read-your-writes: include results still sitting in the queue
+    flush()
     try:
-        with sqlite3.connect(DB_PATH) as conn:
-            c = conn.cursor()
-            c.execute(
-                "SELECT * FROM results ORDER BY timestamp DESC LIMIT ?",
-                (limit,)
-            )
-            rows = c.fetchall()
-        return rows
+        conn = _reader_connection()
+        return conn.execute(FETCH_RESULTS_SQL, (limit,)).fetchall()
     except sqlite3.Error as e:
         print(f"[ERROR] Failed to fetch results: {e}")
         return []
+
+
+def query_results(
+    columns: Sequence[str] = SUMMARY_COLUMNS,
+    limit: int = 20,
+    after: Optional[Tuple[str, int]] = None,
+    min_score: Optional[int] = None,
+    max_score: Optional[int] = None,
+    candidate: Optional[str] = None,
+    missing_skill: Optional[str] = None,
+    matched_skill: Optional[str] = None
+) -> Tuple[List[Dict[str, Any]], Optional[Tuple[str, int]]]:
+    """
+    Newest-first page of results.
+
+    Args:
+        columns: Columns to return (subset of RESULT_COLUMNS); skill lists
+            are decoded from JSON.
+        limit (int): Page size.
+        after: Cursor returned by the previous call; continues after it.
+            Keyset pagination, so deep pages cost the same as the first.
+        min_score / max_score (int): Inclusive score range.
+        candidate (str): Exact candidate name.
+        missing_skill / matched_skill (str): Keep results whose skill
+            list contains this skill.
+
+    Returns:
+        (rows, next_cursor) where next_cursor is None on the last page.
+    """
+    unknown = set(columns) - set(RESULT_COLUMNS)
+    if unknown:
+        raise ValueError(f"Unknown result column(s): {', '.join(sorted(unknown))}")
+
+    where: List[str] = []
+    params: List[Any] = []
+
+    if after is not None:
+        where.append("(timestamp, id) < (?, ?)")
+        params.extend(after)
+    if min_score is not None:
+        where.append("score >= ?")
+        params.append(min_score)
+    if max_score is not None:
+        where.append("score <= ?")
+        params.append(max_score)
+    if candidate is not None:
+        where.append("candidate_name = ?")
+        params.append(candidate)
+    for kind, skill in (("missing", missing_skill), ("matched", matched_skill)):
+        if skill is not None:
+            # Primary-key probe per scanned row; keeps the newest-first index scan
+            where.append(
+                "EXISTS (SELECT 1 FROM result_skills WHERE result_id = results.id "
+                "AND kind = ? AND skill_id = (SELECT id FROM skills WHERE name = ?))"
+            )
+            params.extend((kind, skill.strip().lower()))
+
+    # The cursor columns always ride along, even if not requested
+    selected = list(dict.fromkeys(list(columns) + ["timestamp", "id"]))
+    sql = (
+        f"SELECT {', '.join(COLUMN_SQL.get(c, c) for c in selected)} FROM results"
+        + (f" WHERE {' AND '.join(where)}" if where else "")
+        + " ORDER BY timestamp DESC, id DESC LIMIT ?"
+    )
+    params.append(limit + 1)
+
+    flush()
+    try:
+        conn = _reader_connection()
+        fetched = conn.execute(sql, params).fetchall()
+    except sqlite3.Error as e:
+        print(f"[ERROR] Failed to query results: {e}")
+        return [], None
+
+    rows = []
+    for values in fetched[:limit]:
+        record = dict(zip(selected, values))
+        row = {}
+        for column in columns:
+            value = record[column]
+            if column in JSON_COLUMNS:
+                value = json.loads(value or "[]")
+            row[column] = value
+        rows.append(row)
+
+    next_cursor = None
+    if len(fetched) > limit:
+        last = dict(zip(selected, fetched[limit - 1]))
+        next_cursor = (last["timestamp"], last["id"])
+
+    return rows, next_cursor
+
+
+def latest_result_id() -> int:
+    """Id of the newest stored result (0 if none); changes whenever a result is saved."""
+    flush()
+    try:
+        row = _reader_connection().execute("SELECT MAX(id) FROM results").fetchone()
+    except sqlite3.Error as e:
+        print(f"[ERROR] Failed to read latest result: {e}")
+        return 0
+    return row[0] or 0
+
+
+def iter_candidates(
+    batch_size: int = 1000,
+    latest_per_resume: bool = False
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Stream stored results as batches of
+    {"id", "candidate", "resume_strength", "timestamp", "skills"}.
+    Only one batch is held in memory at a time.
+
+    latest_per_resume: only the most recent result per resume content
+    hash, so a re-analyzed resume appears once while different resumes
+    sharing a display name are all kept. Each row is checked with an
+    index lookup on (resume_hash, id); nothing is grouped up front.
+    Results saved without resume text have no hash and are all kept.
+    """
+    latest = (
+        " WHERE NOT EXISTS (SELECT 1 FROM results n"
+        " WHERE n.resume_hash = r.resume_hash AND n.id > r.id)"
+        if latest_per_resume else ""
+    )
+    flush()
+    try:
+        cursor = _reader_connection().execute(f"""
+            SELECT r.id, r.candidate_name, r.resume_strength, r.timestamp,
+                   (SELECT group_concat(s.name, char(31))
+                    FROM result_skills rs JOIN skills s ON s.id = rs.skill_id
+                    WHERE rs.result_id = r.id AND rs.kind = 'resume')
+            FROM results r{latest} ORDER BY r.id
+        """)
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            yield [
+                {
+                    "id": result_id,
+                    "candidate": candidate,
+                    "resume_strength": strength or 0,
+                    "timestamp": timestamp,
+                    "skills": skills.split("\x1f") if skills else []
+                }
+                for result_id, candidate, strength, timestamp, skills in rows
+            ]
+    except sqlite3.Error as e:
+        print(f"[ERROR] Failed to read candidates: {e}")
+
+
+# --------------------------------------------------
+# Skill Analytics
+# --------------------------------------------------
+def skill_gap_stats(kind: str = "missing", limit: int = 20) -> List[Dict[str, Any]]:
+    """
+    Most frequent skills of one kind across all results.
+
+    Returns:
+        List[Dict]: {"skill", "count", "share"} sorted by count, where
+        share is the fraction of all results that list the skill.
+    """
+    if kind not in SKILL_KINDS:
+        raise ValueError(f"kind must be one of {SKILL_KINDS}")
+
+    flush()
+    try:
+        conn = _reader_connection()
+        total = conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        rows = conn.execute("""
+            SELECT s.name, c.n FROM (
+                SELECT skill_id, COUNT(*) AS n FROM result_skills
+                WHERE kind = ? GROUP BY skill_id
+            ) c JOIN skills s ON s.id = c.skill_id
+            ORDER BY c.n DESC, s.name LIMIT ?
+        """, (kind, limit)).fetchall()
+    except sqlite3.Error as e:
+        print(f"[ERROR] Failed to compute skill stats: {e}")
+        return []
+
+    return [
+        {"skill": name, "count": n, "share": round(n / total, 4) if total else 0.0}
+        for name, n in rows
+    ]
+
+
+def skill_frequency(skill: str) -> Dict[str, int]:
+    """
+    How many results list a skill under each SKILL_KINDS kind: matched,
+    missing, and resume (found on the resume, whatever the JD asked for).
+    """
+    flush()
+    counts = {kind: 0 for kind in SKILL_KINDS}
+    try:
+        conn = _reader_connection()
+        for kind in SKILL_KINDS:
+            counts[kind] = conn.execute("""
+                SELECT COUNT(*) FROM result_skills
+                WHERE kind = ? AND skill_id = (SELECT id FROM skills WHERE name = ?)
+            """, (kind, skill.strip().lower())).fetchone()[0]
+    except sqlite3.Error as e:
+        print(f"[ERROR] Failed to count skill {skill}: {e}")
+    return counts
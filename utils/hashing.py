@@ -0,0 +1,20 @@
+# utils/hashing.py
+"""
+Content hashes shared by the store and the JD library (stdlib only, so
+importing it never pulls in the database layer).
+"""
+
+import hashlib
+from typing import Optional
+
+
+def jd_hash(job_description: str) -> str:
+    """Content hash identifying a job description."""
+    return hashlib.sha256((job_description or "").encode("utf-8")).hexdigest()
+
+
+def resume_hash(resume_text: str) -> Optional[str]:
+    """Content hash identifying a resume across runs and file names (None if empty)."""
+    if not resume_text or not resume_text.strip():
+        return None
+    return hashlib.sha256(resume_text.encode("utf-8")).hexdigest()
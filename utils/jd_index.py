@@ -0,0 +1,201 @@
+# utils/jd_index.py
+"""
+Inverted index for matching one resume against many job descriptions.
+
+Every JD gets a dense integer id. The index keeps
+- postings: skill -> int bitset of JD ids that ask for the skill
+- vectors:  JD id -> int bitset of its skills (bit = skill id)
+
+Ranking a resume ORs the postings of its skills to find candidate JDs,
+then scores each candidate with a single AND + popcount. Scores are the
+same as calculate_match_score (share of JD skills present in the resume).
+"""
+
+import heapq
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+from .database import iter_job_descriptions, save_job_description
+from .jd_library import JD_PROFILES
+from .jd_profile import PROFILE_FORMAT, extract_requirements
+from .taxonomy import get_taxonomy
+
+try:
+    _popcount = int.bit_count
+except AttributeError:  # Python < 3.10
+    def _popcount(x: int) -> int:
+        return bin(x).count("1")
+
+
+class JDIndex:
+    """Skill -> JD inverted index with bitset skill vectors."""
+
+    def __init__(self):
+        self.skill_ids: Dict[str, int] = {}
+        self.skills: List[str] = []
+        self.postings: Dict[str, int] = {}
+        self.vectors: List[int] = []
+        self.sizes: List[int] = []
+        self.keys: List[str] = []
+        self.titles: List[str] = []
+        self._ids: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def add(self, key: str, skills: Iterable[str], title: str = "") -> int:
+        """Add (or replace) a JD; returns its id."""
+        jd_id = self._ids.get(key)
+        if jd_id is not None:
+            self._unlink(jd_id)
+        else:
+            jd_id = len(self.keys)
+            self._ids[key] = jd_id
+            self.keys.append(key)
+            self.titles.append(title)
+            self.vectors.append(0)
+            self.sizes.append(0)
+
+        vector = 0
+        jd_bit = 1 << jd_id
+        for skill in {s.lower() for s in skills}:
+            skill_id = self.skill_ids.get(skill)
+            if skill_id is None:
+                skill_id = self.skill_ids[skill] = len(self.skills)
+                self.skills.append(skill)
+            vector |= 1 << skill_id
+            self.postings[skill] = self.postings.get(skill, 0) | jd_bit
+
+        self.titles[jd_id] = title or self.titles[jd_id]
+        self.vectors[jd_id] = vector
+        self.sizes[jd_id] = _popcount(vector)
+        return jd_id
+
+    def _unlink(self, jd_id: int) -> None:
+        mask = ~(1 << jd_id)
+        for skill in self._decode(self.vectors[jd_id]):
+            self.postings[skill] &= mask
+
+    def _decode(self, vector: int) -> List[str]:
+        skills = []
+        while vector:
+            low = vector & -vector
+            skills.append(self.skills[low.bit_length() - 1])
+            vector ^= low
+        return skills
+
+    def resume_vector(self, resume_skills: Iterable[str]) -> int:
+        vector = 0
+        for skill in resume_skills or []:
+            skill_id = self.skill_ids.get(skill.lower())
+            if skill_id is not None:
+                vector |= 1 << skill_id
+        return vector
+
+    def top_k(
+        self,
+        resume_skills: Iterable[str],
+        k: int = 10,
+        details: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Best-matching JDs for a resume.
+
+        Ranked by match ratio, then by number of matched skills. JDs sharing
+        no skill with the resume are never scored.
+
+        Returns:
+            List[Dict]: {"key", "title", "score", "matched_count", "jd_size"}
+            plus "matched"/"missing" skill lists when details=True.
+        """
+        resume_skills = list(resume_skills or [])
+        resume = self.resume_vector(resume_skills)
+
+        candidates = 0
+        for skill in {s.lower() for s in resume_skills}:
+            candidates |= self.postings.get(skill, 0)
+
+        vectors, sizes = self.vectors, self.sizes
+        scored = []
+        while candidates:
+            low = candidates & -candidates
+            jd_id = low.bit_length() - 1
+            candidates ^= low
+            hits = _popcount(vectors[jd_id] & resume)
+            scored.append((hits / sizes[jd_id], hits, -jd_id))
+
+        ranked = []
+        for ratio, hits, neg_id in heapq.nlargest(k, scored):
+            jd_id = -neg_id
+            entry = {
+                "key": self.keys[jd_id],
+                "title": self.titles[jd_id],
+                "score": int(round(ratio * 100)),
+                "matched_count": hits,
+                "jd_size": sizes[jd_id]
+            }
+            if details:
+                vector = vectors[jd_id]
+                entry["matched"] = sorted(self._decode(vector & resume))
+                entry["missing"] = sorted(self._decode(vector & ~resume))
+            ranked.append(entry)
+
+        return ranked
+
+
+# --------------------------------------------------
+# Build
+# --------------------------------------------------
+def build_jd_index(include_stored: bool = True) -> JDIndex:
+    """
+    Index every JD_LIBRARY role ("role:<name>") and, optionally, every JD
+    stored in the database (keyed by content hash). Stored JDs without a
+    current skill profile are extracted once and written back; stored
+    copies of library roles are skipped (already indexed by role).
+    """
+    index = JDIndex()
+    library_hashes = set()
+
+    for role, profile in JD_PROFILES.items():
+        index.add(f"role:{role}", profile["skills"], title=role)
+        library_hashes.add(profile["hash"])
+
+    if include_stored:
+        taxonomy = f"{get_taxonomy().digest}:{PROFILE_FORMAT}"
+        for row in iter_job_descriptions():
+            if row["hash"] in library_hashes:
+                continue
+            requirements = row["skills"]
+            if row["taxonomy"] != taxonomy or not isinstance(requirements, dict):
+                requirements = extract_requirements(row["text"])
+                save_job_description(row["text"], requirements, taxonomy)
+            index.add(
+                row["hash"],
+                requirements["required"] + requirements["preferred"],
+                title=_title(row["text"])
+            )
+
+    return index
+
+
+def _title(job_description: str) -> str:
+    first_line = next((l.strip() for l in job_description.splitlines() if l.strip()), "")
+    return first_line[:80]
+
+
+_INDEX: Optional[JDIndex] = None
+_INDEX_LOCK = threading.Lock()
+
+
+def get_jd_index(refresh: bool = False) -> JDIndex:
+    """Process-wide index (built on first use, rebuilt with refresh=True)."""
+    global _INDEX
+    with _INDEX_LOCK:
+        if _INDEX is None or refresh:
+            _INDEX = build_jd_index()
+        return _INDEX
+
+
+def match_resume_to_jds(resume_skills: List[str], k: int = 10) -> List[Dict[str, Any]]:
+    """Top-k library roles and stored JDs for a resume's skills."""
+    return get_jd_index().top_k(resume_skills, k=k)
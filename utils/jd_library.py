@@ -1,5 +1,10 @@
 # utils/jd_library.py
 
+import copy
+
+from .hashing import jd_hash
+from .jd_profile import build_jd_profile
+
 JD_LIBRARY = {
     "Software Engineer": (
         "Required Skills:\n"
@@ -30,3 +35,23 @@ JD_LIBRARY = {
         "- Basic project experience and structured resume format"
     )
 }
+
+
+# --------------------------------------------------
+# Precompiled Profiles (built once at import)
+# --------------------------------------------------
+JD_PROFILES = {
+    role: dict(build_jd_profile(text), role=role, hash=jd_hash(text))
+    for role, text in JD_LIBRARY.items()
+}
+
+_PROFILES_BY_TEXT = {profile["text"]: profile for profile in JD_PROFILES.values()}
+
+
+def get_library_profile(job_description: str):
+    """
+    Precompiled profile if the JD is a JD_LIBRARY entry, else None.
+    Returns a copy, so callers may modify it without touching JD_PROFILES.
+    """
+    profile = _PROFILES_BY_TEXT.get(job_description)
+    return copy.deepcopy(profile) if profile is not None else None
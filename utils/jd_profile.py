@@ -0,0 +1,102 @@
+# utils/jd_profile.py
+"""
+Job description profiles.
+
+A profile is everything the analyzer needs from a JD, computed once:
+canonical skill set, required vs preferred split, the core skills the
+role requires and per-skill scoring weights.
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+from .nlp_processing import clean_text, extract_skills
+from .taxonomy import get_taxonomy
+
+# Bump when the profile layout or weighting changes (invalidates stored profiles)
+PROFILE_FORMAT = 2
+
+# Scoring weights
+REQUIRED_WEIGHT = 1.0
+CORE_REQUIRED_WEIGHT = 1.5
+PREFERRED_WEIGHT = 0.5
+
+# Section headers: "Required Skills:", "Must have: python, sql", "Preferred Qualifications",
+# "Nice to have", "Bonus:". Prose that merely starts with a keyword ("Requirements
+# include strong Python", "Bonus points for Docker") is not a header.
+_SECTION_HEADER = re.compile(
+    r"^\s*[-*#\u2022]*\s*"
+    r"(?:(?P<required>required|requirements|must[\s-]have)"
+    r"|(?P<preferred>preferred|nice[\s-]to[\s-]have|bonus|good[\s-]to[\s-]have))\b"
+    r"(?:"
+    r"(?:\s+[\w/&-]+){0,3}\s*:(?P<rest>.*)"
+    r"|(?:\s+(?:skills?|qualifications?|requirements?|experience|technologies|tools))?\s*"
+    r")$",
+    re.I
+)
+
+
+def split_requirements(job_description: str) -> Tuple[str, str]:
+    """
+    Split a JD into (required_text, preferred_text) on section headers.
+    Text before any header, or in a JD without headers, counts as required;
+    anything after a header's colon belongs to that header's section.
+    """
+    required: List[str] = []
+    preferred: List[str] = []
+    current = required
+
+    for line in (job_description or "").splitlines():
+        header = _SECTION_HEADER.match(line)
+        if header:
+            current = preferred if header.group("preferred") else required
+            line = header.group("rest") or ""
+        current.append(line)
+
+    return "\n".join(required), "\n".join(preferred)
+
+
+def extract_requirements(job_description: str) -> Dict[str, List[str]]:
+    """Canonical skills per section; a skill listed in both counts as required."""
+    required_text, preferred_text = split_requirements(job_description)
+    required = sorted(set(extract_skills(clean_text(required_text))))
+    preferred = sorted(set(extract_skills(clean_text(preferred_text))) - set(required))
+    return {"required": required, "preferred": preferred}
+
+
+def build_jd_profile(
+    job_description: str,
+    requirements: Optional[Dict[str, List[str]]] = None
+) -> Dict:
+    """
+    Build the analyzer profile for a JD.
+
+    Args:
+        job_description (str): Raw JD text.
+        requirements (dict): Precomputed extract_requirements() output,
+            e.g. from the job_descriptions table; extracted when omitted.
+
+    Returns:
+        Dict with text, skills, required, preferred, core_required, weights.
+    """
+    if requirements is None:
+        requirements = extract_requirements(job_description)
+
+    core_skills = get_taxonomy().core_skills
+    required = list(requirements["required"])
+    preferred = list(requirements["preferred"])
+
+    weights: Dict[str, float] = {}
+    for skill in required:
+        weights[skill] = CORE_REQUIRED_WEIGHT if skill in core_skills else REQUIRED_WEIGHT
+    for skill in preferred:
+        weights[skill] = PREFERRED_WEIGHT
+
+    return {
+        "text": job_description,
+        "skills": sorted(weights),
+        "required": required,
+        "preferred": preferred,
+        "core_required": sorted(set(required) & core_skills),
+        "weights": weights
+    }
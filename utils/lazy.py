@@ -0,0 +1,61 @@
+# utils/lazy.py
+"""
+Deferred imports for heavy optional dependencies.
+
+    pdfplumber = lazy_import("pdfplumber")   # nothing imported yet
+    pdfplumber.open(...)                     # imported here, once
+
+Parsing, OCR and LLM libraries cost hundreds of milliseconds to import;
+code paths that only score or query the database never touch them.
+module_available() answers "is it installed?" without importing it.
+"""
+
+import importlib
+import importlib.util
+import threading
+from types import ModuleType
+
+
+class LazyModule:
+    """Module stand-in that imports the real module on first attribute access."""
+
+    def __init__(self, name: str):
+        self.__dict__["_name"] = name
+        self.__dict__["_module"] = None
+        self.__dict__["_lock"] = threading.Lock()
+
+    def _load(self) -> ModuleType:
+        module = self.__dict__["_module"]
+        if module is None:
+            with self.__dict__["_lock"]:
+                module = self.__dict__["_module"]
+                if module is None:
+                    module = importlib.import_module(self.__dict__["_name"])
+                    self.__dict__["_module"] = module
+        return module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr: str, value) -> None:
+        setattr(self._load(), attr, value)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_module"] is not None else "not loaded"
+        return f"<lazy module {self.__dict__['_name']!r} ({state})>"
+
+
+def lazy_import(name: str) -> LazyModule:
+    return LazyModule(name)
+
+
+def module_available(name: str) -> bool:
+    """True if `name` can be imported (checked without importing it)."""
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        return False
+    return spec is not None
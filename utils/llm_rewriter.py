@@ -1,20 +1,26 @@
 # utils/llm_rewriter.py
 
-from typing import List, Dict
+from typing import Any, Callable, Iterator, List, Dict, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+import hashlib
 import logging
 import os
+import re
+import threading
+import time
 
+from .cache import CACHE_DIR, LRUCache, SQLiteCache, TieredCache
+from .lazy import module_available
+from .nlp_processing import clean_text
 from .rewrite_templates import generate_rewrite_suggestions
 
 # ---------------------------
 # Check GPT4All availability
 # ---------------------------
-try:
-    from gpt4all import GPT4All
-    GPT4ALL_AVAILABLE = True
-except ImportError:
+# Checked without importing: gpt4all is only imported when the model loads
+GPT4ALL_AVAILABLE = module_available("gpt4all")
+if not GPT4ALL_AVAILABLE:
     logging.warning("GPT4All not installed. Falling back to static templates.")
-    GPT4ALL_AVAILABLE = False
 
 MODEL_PATH = os.path.join("models", "ggml-gpt4all-j.bin")
 
@@ -28,7 +34,301 @@ Rewrite resume bullet points to:
 Return ONE bullet point per skill.
 """
 
-def llm_rewrite_skills(skills: List[str], job_description: str) -> List[Dict[str, str]]:
+
+def _rss_mb() -> Optional[float]:
+    """Current resident set size in MB (Linux /proc; None elsewhere)."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+# ---------------------------
+# Process-wide model manager
+# ---------------------------
+class ModelManager:
+    """
+    Loads the GPT4All model once per process and keeps it resident.
+
+    Generation is serialized with a lock so concurrent analyses
+    (e.g. several Streamlit sessions) can share one instance safely.
+    """
+
+    def __init__(self, model_path: str = MODEL_PATH):
+        self.model_path = model_path
+        self._model = None
+        self._load_error: Optional[Exception] = None
+        self._load_lock = threading.Lock()
+        self._generate_lock = threading.Lock()
+        self.metrics: Dict[str, Any] = {
+            "loaded": False,
+            "load_seconds": None,
+            "rss_delta_mb": None,
+            "generations": 0,
+            "generate_seconds": 0.0,
+        }
+
+    def available(self) -> bool:
+        return GPT4ALL_AVAILABLE and os.path.exists(self.model_path)
+
+    def get(self):
+        """Return the resident model, loading it on first use."""
+        if self._model is not None:
+            return self._model
+
+        with self._load_lock:
+            if self._model is not None:
+                return self._model
+            if self._load_error is not None:
+                raise RuntimeError(f"GPT4All model failed to load: {self._load_error}")
+
+            rss_before = _rss_mb()
+            start = time.perf_counter()
+            try:
+                from gpt4all import GPT4All
+                model = GPT4All(model_name=self.model_path)
+            except Exception as e:
+                self._load_error = e  # don't retry a multi-GB load on every call
+                raise
+
+            rss_after = _rss_mb()
+            self.metrics["load_seconds"] = round(time.perf_counter() - start, 3)
+            if rss_before is not None and rss_after is not None:
+                self.metrics["rss_delta_mb"] = round(rss_after - rss_before, 1)
+            self.metrics["loaded"] = True
+            self._model = model
+            logging.info(f"GPT4All model loaded in {self.metrics['load_seconds']}s")
+
+        return self._model
+
+    def generate(self, prompt: str, **kwargs) -> str:
+        model = self.get()
+        with self._generate_lock:
+            start = time.perf_counter()
+            response = model.generate(prompt, **kwargs)
+            self.metrics["generations"] += 1
+            self.metrics["generate_seconds"] += time.perf_counter() - start
+        return response
+
+    def warmup(self, background: bool = False) -> Optional[threading.Thread]:
+        """Load the model and run a 1-token generation ahead of real traffic."""
+        if not self.available():
+            return None
+
+        def _run():
+            try:
+                self.generate("Hello", max_tokens=1)
+            except Exception as e:
+                logging.warning(f"GPT4All warmup failed: {e}")
+
+        if not background:
+            _run()
+            return None
+
+        thread = threading.Thread(target=_run, name="gpt4all-warmup", daemon=True)
+        thread.start()
+        return thread
+
+
+MODEL_MANAGER = ModelManager()
+
+
+def get_model_metrics() -> Dict[str, Any]:
+    """Load time, memory delta and generation counters for the shared model."""
+    return dict(MODEL_MANAGER.metrics)
+
+
+# Optional warm start, e.g. RESUME_ANALYZER_LLM_WARMUP=1 streamlit run app.py
+if os.environ.get("RESUME_ANALYZER_LLM_WARMUP") == "1":
+    MODEL_MANAGER.warmup(background=True)
+
+
+# ---------------------------
+# Rewrite cache: (model, JD fingerprint, skill) -> bullet
+# ---------------------------
+REWRITE_CACHE_TTL = 30 * 24 * 3600  # seconds
+
+REWRITE_CACHE = TieredCache(
+    memory=LRUCache(max_items=2048, ttl=REWRITE_CACHE_TTL),
+    disk=SQLiteCache(
+        CACHE_DIR / "rewrite_cache.db",
+        max_bytes=64 * 1024 * 1024,
+        ttl=REWRITE_CACHE_TTL
+    )
+)
+
+
+def jd_fingerprint(job_description: str) -> str:
+    """Hash of the normalized JD, so whitespace/case edits still hit the cache."""
+    return hashlib.sha256(clean_text(job_description).encode("utf-8")).hexdigest()[:32]
+
+
+def _model_identity() -> str:
+    """Model file name + size + mtime: a swapped model never reuses old rewrites."""
+    path = MODEL_MANAGER.model_path
+    try:
+        st = os.stat(path)
+        return f"{os.path.basename(path)}:{st.st_size}:{int(st.st_mtime)}"
+    except OSError:
+        return os.path.basename(path)
+
+
+def _rewrite_cache_key(model_id: str, jd_fp: str, skill: str) -> str:
+    return f"{model_id}|{jd_fp}|{skill.strip().lower()}"
+
+
+def get_rewrite_cache_stats() -> Dict[str, int]:
+    """Memory/disk hit and miss counters for cached rewrites."""
+    return dict(REWRITE_CACHE.stats)
+
+
+# ---------------------------
+# Prompting
+# ---------------------------
+# Skills per batched generation; keeps each structured answer short enough to parse
+BATCH_SIZE = 8
+MAX_TOKENS_PER_SKILL = 100
+
+# "<skill>: <bullet>" (optionally bulleted / numbered)
+_BATCH_LINE = re.compile(r"^\s*(?:[-*\u2022]|\d+[.)])?\s*([^:]+?)\s*:\s*(.+?)\s*$")
+# Markdown emphasis the model likes to add ("**Python:** ..."); intra-word _ is kept
+_EMPHASIS = re.compile(r"\*\*|__|(?<!\w)[*_]|[*_](?!\w)")
+
+
+def _single_prompt(skill: str, job_description: str) -> str:
+    return f"{SYSTEM_PROMPT}\nSkill: {skill}\nJob Description Context: {job_description}\n"
+
+
+def _batch_prompt(skills: List[str], job_description: str) -> str:
+    skill_lines = "\n".join(f"- {skill}" for skill in skills)
+    return (
+        f"{SYSTEM_PROMPT}\nJob Description Context: {job_description}\n"
+        "Write one bullet point for EACH skill below.\n"
+        "Answer with exactly one line per skill, formatted as\n"
+        "<skill>: <bullet point>\n"
+        f"Skills:\n{skill_lines}\n"
+    )
+
+
+def _parse_batch_response(response: str, skills: List[str]) -> Dict[str, str]:
+    """Map each requested skill to its bullet; unknown or empty lines are ignored."""
+    wanted = {skill.lower(): skill for skill in skills}
+    bullets: Dict[str, str] = {}
+
+    for line in response.splitlines():
+        match = _BATCH_LINE.match(_EMPHASIS.sub("", line))
+        if not match:
+            continue
+        skill = wanted.get(match.group(1).lower())
+        if skill and skill not in bullets:
+            bullets[skill] = match.group(2)
+
+    return bullets
+
+
+def _generate_rewrites(
+    skills: List[str],
+    job_description: str,
+    batched: bool = True
+) -> Iterator[Dict[str, str]]:
+    """
+    Yield skill -> bullet dicts, one per generation, via the shared model.
+    Batched mode sends the JD once per BATCH_SIZE skills; skills missing
+    from a parsed batch answer are retried one at a time.
+    """
+    done = set()
+
+    if batched:
+        for i in range(0, len(skills), BATCH_SIZE):
+            chunk = skills[i:i + BATCH_SIZE]
+            if len(chunk) == 1:
+                continue  # single skill: the per-skill prompt is the batch
+            response = MODEL_MANAGER.generate(
+                _batch_prompt(chunk, job_description),
+                max_tokens=MAX_TOKENS_PER_SKILL * len(chunk)
+            )
+            bullets = _parse_batch_response(response, chunk)
+            done.update(bullets)
+            if bullets:
+                yield bullets
+
+    for skill in skills:
+        if skill not in done:
+            response = MODEL_MANAGER.generate(
+                _single_prompt(skill, job_description),
+                max_tokens=MAX_TOKENS_PER_SKILL
+            )
+            yield {skill: response.strip()}
+
+
+def _template_suggestions(skills: List[str]) -> List[Dict[str, str]]:
+    suggestions = generate_rewrite_suggestions(skills)
+    # Add source field for consistency
+    for s in suggestions:
+        s["source"] = "template"
+    return suggestions
+
+
+def _llm_suggestion(skill: str, bullet: str) -> Dict[str, str]:
+    return {
+        "skill": skill,
+        "suggested_rewrite": bullet,
+        "recommended_section": "Experience / Projects",
+        "source": "gpt4all"
+    }
+
+
+def stream_rewrite_skills(
+    skills: List[str],
+    job_description: str,
+    batched: bool = True
+) -> Iterator[Dict[str, str]]:
+    """
+    Incremental form of llm_rewrite_skills: yields each suggestion as soon
+    as it exists (cache hits first, then one group per generation).
+    Skills left over after a model failure are yielded as templates.
+    """
+    if not skills:
+        return
+
+    # Fallback to templates if GPT4All unavailable or model file missing
+    if not MODEL_MANAGER.available():
+        yield from _template_suggestions(skills)
+        return
+
+    pending = list(skills)
+
+    try:
+        model_id = _model_identity()
+        jd_fp = jd_fingerprint(job_description)
+
+        for skill in skills:
+            cached = REWRITE_CACHE.get(_rewrite_cache_key(model_id, jd_fp, skill))
+            if cached is not None:
+                pending.remove(skill)
+                yield _llm_suggestion(skill, cached)
+
+        # Shared, already-resident model (loaded once per process)
+        for bullets in _generate_rewrites(list(pending), job_description, batched=batched):
+            for skill, bullet in bullets.items():
+                if bullet:
+                    REWRITE_CACHE.set(_rewrite_cache_key(model_id, jd_fp, skill), bullet)
+                pending.remove(skill)
+                yield _llm_suggestion(skill, bullet)
+
+    except Exception as e:
+        logging.warning(f"GPT4All generation failed: {e}")
+        # Fallback to static templates in case of error
+        yield from _template_suggestions(pending)
+
+
+def llm_rewrite_skills(
+    skills: List[str],
+    job_description: str,
+    batched: bool = True
+) -> List[Dict[str, str]]:
     """
     Generate ATS-optimized rewrite suggestions using GPT4All if available.
     Falls back to static templates otherwise.
@@ -36,6 +336,8 @@ def llm_rewrite_skills(skills: List[str], job_description: str) -> List[Dict[str
     Args:
         skills (List[str]): List of skills to rewrite.
         job_description (str): Context of job description for tailoring.
+        batched (bool): Rewrite several skills per generation, falling back
+            to per-skill prompts only for skills the answer didn't cover.
 
     Returns:
         List[Dict[str, str]]: Each dict contains:
@@ -44,40 +346,82 @@ def llm_rewrite_skills(skills: List[str], job_description: str) -> List[Dict[str
             - recommended_section: str
             - source: "gpt4all" or "template"
     """
-    if not skills:
-        return []
+    order = {
+        skill.strip().lower(): i
+        for i, skill in enumerate(skills or []) if isinstance(skill, str)
+    }
+    suggestions = list(stream_rewrite_skills(skills, job_description, batched=batched))
+    suggestions.sort(key=lambda s: order.get(s["skill"].strip().lower(), len(order)))
+    return suggestions
 
-    # Fallback to templates if GPT4All unavailable or model file missing
-    if not GPT4ALL_AVAILABLE or not os.path.exists(MODEL_PATH):
-        suggestions = generate_rewrite_suggestions(skills)
-        # Add source field for consistency
-        for s in suggestions:
-            s["source"] = "template"
-        return suggestions
 
-    try:
-        # Instantiate GPT4All model
-        model = GPT4All(model_name=MODEL_PATH)
-        results: List[Dict[str, str]] = []
+# ---------------------------
+# Background rewrites
+# ---------------------------
+_REWRITE_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="rewrite")
 
-        for skill in skills:
-            prompt = (
-                f"{SYSTEM_PROMPT}\nSkill: {skill}\nJob Description Context: {job_description}\n"
-            )
-            response = model.generate(prompt, max_tokens=100)
-            results.append({
-                "skill": skill,
-                "suggested_rewrite": response.strip(),
-                "recommended_section": "Experience / Projects",
-                "source": "gpt4all"
-            })
 
-        return results
+class RewriteStream:
+    """
+    Rewrite suggestions generated on a background thread.
 
-    except Exception as e:
-        logging.warning(f"GPT4All generation failed: {e}")
-        # Fallback to static templates in case of error
-        suggestions = generate_rewrite_suggestions(skills)
-        for s in suggestions:
-            s["source"] = "template"
-        return suggestions
+    Iterate to receive suggestions as they arrive (safe to iterate again,
+    e.g. on a Streamlit rerun; earlier items are replayed), or use
+    ``future`` / ``result()`` to wait for the full list.
+    """
+
+    def __init__(
+        self,
+        skills: List[str],
+        job_description: str,
+        on_complete: Optional[Callable[[List[Dict[str, str]]], None]] = None
+    ):
+        self._items: List[Dict[str, str]] = []
+        self._done = False
+        self._cond = threading.Condition()
+        self._on_complete = on_complete
+        self.future: Future = _REWRITE_EXECUTOR.submit(self._run, skills, job_description)
+
+    def _run(self, skills: List[str], job_description: str) -> List[Dict[str, str]]:
+        try:
+            for suggestion in stream_rewrite_skills(skills, job_description):
+                with self._cond:
+                    self._items.append(suggestion)
+                    self._cond.notify_all()
+        finally:
+            with self._cond:
+                self._done = True
+                self._cond.notify_all()
+
+        items = list(self._items)
+        if self._on_complete is not None:
+            self._on_complete(items)
+        return items
+
+    @property
+    def done(self) -> bool:
+        return self._done
+
+    def __iter__(self) -> Iterator[Dict[str, str]]:
+        index = 0
+        while True:
+            with self._cond:
+                while index >= len(self._items) and not self._done:
+                    self._cond.wait()
+                if index >= len(self._items):
+                    return
+                item = self._items[index]
+            index += 1
+            yield item
+
+    def result(self, timeout: Optional[float] = None) -> List[Dict[str, str]]:
+        return self.future.result(timeout)
+
+
+def start_rewrite_stream(
+    skills: List[str],
+    job_description: str,
+    on_complete: Optional[Callable[[List[Dict[str, str]]], None]] = None
+) -> RewriteStream:
+    """Kick off rewrite generation in the background and return immediately."""
+    return RewriteStream(skills, job_description, on_complete)
@@ -2,53 +2,16 @@
 import re
 from typing import List
 
+from .taxonomy import get_taxonomy
+
 # =====================================================
-# ATS-Grade Skill Dictionary (expandable)
+# ATS-Grade Skill Dictionary (data/skill_taxonomy.json)
 # =====================================================
-SKILL_MAP = {
-    # Programming Languages
-    "python": ["python"],
-    "java": ["java"],
-    "javascript": ["javascript", "js"],
-    "c++": ["c++", "cpp"],
-    "c#": ["c#", "c sharp"],
-    "sql": ["sql", "mysql", "postgresql", "sqlite"],
-
-    # Data / Analytics
-    "data analysis": ["data analysis"],
-    "machine learning": ["machine learning", "ml"],
-    "deep learning": ["deep learning", "dl"],
-    "nlp": ["nlp", "natural language processing"],
-    "statistics": ["statistics"],
-    "pandas": ["pandas"],
-    "numpy": ["numpy"],
-
-    # Visualization
-    "tableau": ["tableau"],
-    "power bi": ["power bi"],
-    "excel": ["excel"],
-
-    # Web / Backend
-    "html": ["html"],
-    "css": ["css"],
-    "react": ["react", "reactjs"],
-    "node.js": ["node.js", "nodejs", "node"],
-    "flask": ["flask"],
-    "django": ["django"],
-    "rest api": ["rest api", "restful api"],
+_TAXONOMY = get_taxonomy()
+SKILL_MAP = _TAXONOMY.skill_map
 
-    # DevOps / Cloud
-    "aws": ["aws", "amazon web services"],
-    "docker": ["docker"],
-    "kubernetes": ["kubernetes", "k8s"],
-    "git": ["git", "github", "gitlab"],
-    "ci/cd": ["ci/cd", "continuous integration"],
-
-    # Soft / Business Skills
-    "communication": ["communication"],
-    "teamwork": ["teamwork", "collaboration"],
-    "problem solving": ["problem solving"],
-}
+# Compiled once: one scan per text instead of one regex per variant
+SKILL_MATCHER = _TAXONOMY.matcher
 
 # =====================================================
 # Text Cleaning
@@ -81,16 +44,7 @@ def extract_skills(text: str) -> List[str]:
         return []
 
     text_clean = clean_text(text)
-    found_skills = set()
-
-    for canonical_skill, variants in SKILL_MAP.items():
-        for variant in variants:
-            pattern = r"\b" + re.escape(variant) + r"\b"
-            if re.search(pattern, text_clean):
-                found_skills.add(canonical_skill)
-                break
-
-    return sorted(found_skills)
+    return SKILL_MATCHER.extract(text_clean)
 
 # =====================================================
 # Frequency-Based Keyword Extraction (ATS-safe, no ML)
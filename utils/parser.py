@@ -1,28 +1,89 @@
 # utils/parser.py
 
-from typing import Optional, Dict, Union, List, IO
+from typing import Any, Optional, Dict, Union, List, IO, Tuple
+from concurrent.futures import ThreadPoolExecutor
+import copy
+import hashlib
 import io
+import os
+import time
 
-import pdfplumber
-from docx import Document
+from .cache import CACHE_DIR, LRUCache, SQLiteCache, TieredCache
+from .lazy import lazy_import
+from .text_extract import extract_pdf_pages, image_coverage
+from .tracing import span, start_trace
+
+# Imported on first use: importing them costs more than most parses
+pdfplumber = lazy_import("pdfplumber")
+docx = lazy_import("docx")
 
 # OCR
-import pytesseract
-from pdf2image import convert_from_bytes
+pytesseract = lazy_import("pytesseract")
+pdf2image = lazy_import("pdf2image")
+
+# Bump whenever extraction logic changes so stale cache entries are ignored
+PARSER_VERSION = "5"
+
+# PDF extraction engines, tried in order (fastest first, OCR last)
+PDF_ENGINES = ("pymupdf", "pdfplumber", "ocr")
+
+# Below this many characters a PDF is treated as having no usable text layer
+MIN_PDF_TEXT = 100
+
+# Per-page routing: a page with less text than this but images covering at
+# least MIN_IMAGE_COVERAGE of it is a scan and gets OCR'd on its own
+MIN_PAGE_TEXT = 20
+MIN_IMAGE_COVERAGE = 0.3
+
+# OCR tuning: fast low-DPI pass, high-DPI retry only for low-confidence pages
+OCR_LOW_DPI = 150
+OCR_HIGH_DPI = 300
+OCR_MIN_CONFIDENCE = 60.0
+OCR_PAGE_BUDGET = 20.0  # seconds per page, rasterize + recognize
+OCR_CONFIG = "--oem 3 --psm 6"
 
+# Concurrent Tesseract pages per document (0 = one per CPU). Set to 1 when
+# documents are already parsed in parallel processes (batch_parser does).
+OCR_THREADS = int(os.environ.get("RESUME_ANALYZER_OCR_THREADS", "0"))
 
-def parse_resume(uploaded_file: Union[str, IO]) -> Optional[Dict[str, Union[str, List[str]]]]:
+# Parsed output keyed by file content, so OCR/pdfplumber run once per document
+PARSE_CACHE = TieredCache(
+    memory=LRUCache(max_items=64),
+    disk=SQLiteCache(CACHE_DIR / "parse_cache.db", max_bytes=256 * 1024 * 1024)
+)
+
+
+def parse_resume(
+    uploaded_file: Union[str, os.PathLike, IO],
+    use_cache: bool = True,
+    engines: Optional[Tuple[str, ...]] = None
+) -> Optional[Dict[str, Any]]:
     """
     Robust resume parser:
-    - Supports PDF (text + scanned via OCR)
+    - Supports PDF (PyMuPDF -> pdfplumber -> OCR, see PDF_ENGINES)
     - Supports DOCX
-    """
+    - Caches results by SHA-256 of the file bytes + PARSER_VERSION
 
+    Result keys: raw_text, experience, engine (which extractor produced
+    the text), cached and timings_ms (milliseconds per engine tried; on a
+    cache hit, cached is True and timings_ms only has the lookup time).
+
+    With tracing enabled the cache lookup, each engine, OCR and DOCX
+    extraction are recorded as "parse.*" spans.
+    """
+    trace = start_trace("parse_resume")
     try:
-        filename = getattr(uploaded_file, "name", None)
+        # File paths: open once and parse the handle like an upload
+        if isinstance(uploaded_file, (str, os.PathLike)):
+            with open(uploaded_file, "rb") as f:
+                return parse_resume(f, use_cache=use_cache, engines=engines)
+
+        engines = tuple(engines or PDF_ENGINES)
+        unknown = [e for e in engines if e not in PDF_EXTRACTORS]
+        if unknown:
+            raise ValueError(f"Unknown PDF engine(s): {', '.join(unknown)}")
 
-        if not filename and isinstance(uploaded_file, str):
-            filename = uploaded_file
+        filename = getattr(uploaded_file, "name", None)
 
         if not filename:
             raise ValueError("Unable to determine file type")
@@ -30,84 +91,307 @@ def parse_resume(uploaded_file: Union[str, IO]) -> Optional[Dict[str, Union[str,
         filename = filename.lower()
 
         if filename.endswith(".pdf"):
-            text = _parse_pdf_with_ocr(uploaded_file)
+            kind = "pdf"
         elif filename.endswith(".docx"):
-            text = _parse_docx(uploaded_file)
+            kind = "docx"
         else:
             raise ValueError("Unsupported file format")
 
+        uploaded_file.seek(0)
+        file_bytes = uploaded_file.read()
+        digest = hashlib.sha256(file_bytes).hexdigest()
+        cache_key = f"{PARSER_VERSION}:{kind}:{','.join(engines)}:{digest}"
+
+        if use_cache:
+            start = time.perf_counter()
+            with span("parse.cache"):
+                cached = PARSE_CACHE.get(cache_key)
+            if cached is not None:
+                # The stored timings belong to the original parse, not this call
+                return dict(
+                    copy.deepcopy(cached),
+                    cached=True,
+                    timings_ms={"cache": _elapsed_ms(start)}
+                )
+
+        if kind == "pdf":
+            text, engine, timings = _parse_pdf(io.BytesIO(file_bytes), engines)
+        else:
+            start = time.perf_counter()
+            with span("parse.docx"):
+                text = _parse_docx(io.BytesIO(file_bytes))
+            engine = "python-docx"
+            timings = {engine: _elapsed_ms(start)}
+
         # Validation
         if not text or len(text.strip()) < 200:
             return None
 
-        return {
+        result = {
             "raw_text": text,
-            "experience": []
+            "experience": [],
+            "engine": engine,
+            "cached": False,
+            "timings_ms": timings
         }
 
+        if use_cache:
+            PARSE_CACHE.set(cache_key, copy.deepcopy(result))
+
+        return result
+
     except Exception as e:
         print(f"[ERROR] Resume parsing failed: {e}")
         return None
 
+    finally:
+        trace.finish()
+
 
 # ==================================================
 # PDF Parsing
 # ==================================================
-def _parse_pdf_with_ocr(file: IO) -> str:
-    text = _parse_pdf_text(file)
+def _parse_pdf(
+    file: IO,
+    engines: Tuple[str, ...] = PDF_ENGINES
+) -> Tuple[str, str, Dict[str, float]]:
+    """
+    Run extraction engines in order until one yields a usable text layer.
 
-    # OCR fallback only if needed
-    if len(text.strip()) < 100:
-        print("[INFO] Falling back to OCR")
-        file.seek(0)
-        text = _parse_pdf_ocr(file)
+    Each text engine reports per-page text plus the pages that are
+    image-only scans; when "ocr" is enabled only those pages are OCR'd
+    and merged back in page order (engine name gets a "+ocr" suffix).
 
-    return text
+    An engine may accept the text but flag the layout as risky
+    (e.g. PyMuPDF on multi-column pages); the next engine is then tried,
+    but whole-document OCR is skipped because a text layer already exists.
+
+    Returns:
+        (text, engine name, {engine: milliseconds})
+    """
+    timings: Dict[str, float] = {}
+    ocr_enabled = "ocr" in engines
+    ocr_done: Dict[int, str] = {}
+    fallback_text, fallback_engine = "", ""
+    best_text, best_engine = "", ""
+
+    file.seek(0)
+    pdf_bytes = file.read()
+
+    for name in engines:
+        if name == "ocr":
+            if fallback_text or ocr_done:
+                break
+            print("[INFO] Falling back to OCR")
+
+        start = time.perf_counter()
+        with span(f"parse.{name}"):
+            extraction = PDF_EXTRACTORS[name](io.BytesIO(pdf_bytes))
+        timings[name] = _elapsed_ms(start)
+
+        page_texts = list(extraction["pages"])
+        engine = name
+
+        scanned = [n for n in extraction["ocr_pages"] if n not in ocr_done]
+        if ocr_enabled and scanned:
+            start = time.perf_counter()
+            with span("parse.ocr"):
+                ocr_done.update(zip(scanned, _ocr_pdf_pages(pdf_bytes, scanned)))
+            timings["ocr"] = round(timings.get("ocr", 0.0) + _elapsed_ms(start), 3)
+
+        if ocr_enabled and extraction["ocr_pages"]:
+            for n in extraction["ocr_pages"]:
+                if n <= len(page_texts):
+                    page_texts[n - 1] = ocr_done.get(n, "")
+            engine = f"{name}+ocr"
+
+        text = "\n".join(t for t in page_texts if t.strip()).strip()
+
+        if len(text) >= MIN_PDF_TEXT:
+            if not extraction["needs_fallback"]:
+                return text, engine, timings
+            if not fallback_text:
+                fallback_text, fallback_engine = text, engine
+        elif len(text) > len(best_text) or not best_engine:
+            best_text, best_engine = text, engine
+
+    if fallback_text:
+        return fallback_text, fallback_engine, timings
+    return best_text, best_engine, timings
+
+
+def _elapsed_ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000, 3)
+
+
+def _route_page(text: str, coverage: float) -> bool:
+    """True when a page has no real text layer but is mostly image (a scan)."""
+    return len(text.strip()) < MIN_PAGE_TEXT and coverage >= MIN_IMAGE_COVERAGE
+
+
+def _pymupdf_engine(file: IO) -> Dict[str, Any]:
+    pages = extract_pdf_pages(file.read())
+    return {
+        "pages": [p["text"] for p in pages],
+        "ocr_pages": [
+            i for i, p in enumerate(pages, 1)
+            if _route_page(p["text"], p["image_coverage"])
+        ],
+        "needs_fallback": any(p["multi_column"] for p in pages)
+    }
 
 
-def _parse_pdf_text(file: IO) -> str:
+def _pdfplumber_engine(file: IO) -> Dict[str, Any]:
     pages: List[str] = []
+    ocr_pages: List[int] = []
 
     try:
         file.seek(0)
-        pdf_bytes = file.read()
-
-        with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
-            for page in pdf.pages:
-                t = page.extract_text()
-                if t:
-                    pages.append(t)
+        with pdfplumber.open(io.BytesIO(file.read())) as pdf:
+            for i, page in enumerate(pdf.pages, 1):
+                text = page.extract_text() or ""
+                coverage = image_coverage(
+                    [(im["x0"], im["top"], im["x1"], im["bottom"]) for im in page.images],
+                    float(page.width),
+                    float(page.height)
+                )
+                pages.append(text)
+                if _route_page(text, coverage):
+                    ocr_pages.append(i)
 
     except Exception as e:
         print(f"[ERROR] PDF text extraction failed: {e}")
 
-    return "\n".join(pages).strip()
+    return {"pages": pages, "ocr_pages": ocr_pages, "needs_fallback": False}
+
+
+def _ocr_engine(file: IO) -> Dict[str, Any]:
+    return {"pages": [_parse_pdf_ocr(file)], "ocr_pages": [], "needs_fallback": False}
 
 
 def _parse_pdf_ocr(file: IO) -> str:
+    """OCR every page of the document."""
     pages: List[str] = []
 
     try:
         file.seek(0)
-        images = convert_from_bytes(
-            file.read(),
-            dpi=200,
-            first_page=1,
-            last_page=3  # ⚡ speed boost
-        )
-
-        for img in images:
-            text = pytesseract.image_to_string(
-                img,
-                config="--oem 3 --psm 6"
-            )
-            if text.strip():
-                pages.append(text)
+        pdf_bytes = file.read()
+        page_count = int(pdf2image.pdfinfo_from_bytes(pdf_bytes)["Pages"])
+        pages = _ocr_pdf_pages(pdf_bytes, list(range(1, page_count + 1)))
 
     except Exception as e:
         print(f"[ERROR] OCR failed: {e}")
 
-    return "\n".join(pages).strip()
+    return "\n".join(text for text in pages if text.strip()).strip()
+
+
+def _ocr_pdf_pages(
+    pdf_bytes: bytes,
+    page_numbers: List[int],
+    threads: Optional[int] = None
+) -> List[str]:
+    """
+    OCR the given 1-based pages concurrently (tesseract/pdftoppm run as
+    subprocesses, so threads give real parallelism). Returns texts in order.
+
+    threads: concurrent pages; defaults to OCR_THREADS (0 = CPU count).
+    """
+    if not page_numbers:
+        return []
+
+    threads = threads if threads is not None else OCR_THREADS
+    workers = max(1, min(len(page_numbers), threads or os.cpu_count() or 1))
+    if workers == 1:
+        return [_ocr_page(pdf_bytes, n) for n in page_numbers]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(lambda n: _ocr_page(pdf_bytes, n), page_numbers))
+
+
+def _ocr_page(pdf_bytes: bytes, page_number: int) -> str:
+    """
+    Adaptive-DPI OCR for one page within OCR_PAGE_BUDGET seconds.
+    """
+    deadline = time.monotonic() + OCR_PAGE_BUDGET
+
+    try:
+        text, confidence = _ocr_page_at(pdf_bytes, page_number, OCR_LOW_DPI, deadline)
+    except Exception as e:
+        print(f"[ERROR] OCR failed on page {page_number}: {e}")
+        return ""
+
+    if confidence >= OCR_MIN_CONFIDENCE:
+        return text
+
+    try:
+        retry_text, retry_confidence = _ocr_page_at(
+            pdf_bytes, page_number, OCR_HIGH_DPI, deadline
+        )
+        if retry_confidence > confidence:
+            return retry_text
+    except Exception as e:
+        print(f"[INFO] High-DPI OCR skipped on page {page_number}: {e}")
+
+    return text
+
+
+def _ocr_page_at(
+    pdf_bytes: bytes,
+    page_number: int,
+    dpi: int,
+    deadline: float
+) -> Tuple[str, float]:
+    """Rasterize + OCR one page; returns (text, mean word confidence)."""
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise TimeoutError("page OCR budget exhausted")
+
+    images = pdf2image.convert_from_bytes(
+        pdf_bytes,
+        dpi=dpi,
+        first_page=page_number,
+        last_page=page_number,
+        timeout=max(1, int(remaining))
+    )
+    if not images:
+        return "", 0.0
+
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise TimeoutError("page OCR budget exhausted")
+
+    data = pytesseract.image_to_data(
+        images[0],
+        config=OCR_CONFIG,
+        output_type=pytesseract.Output.DICT,
+        timeout=remaining
+    )
+
+    # Rebuild text line by line; keep confidences of real words only
+    lines: Dict[Tuple[int, int, int], List[str]] = {}
+    confidences: List[float] = []
+
+    for i, word in enumerate(data["text"]):
+        conf = float(data["conf"][i])
+        if conf < 0 or not word.strip():
+            continue
+        key = (data["block_num"][i], data["par_num"][i], data["line_num"][i])
+        lines.setdefault(key, []).append(word)
+        confidences.append(conf)
+
+    text = "\n".join(" ".join(words) for _, words in sorted(lines.items()))
+    confidence = sum(confidences) / len(confidences) if confidences else 0.0
+    return text, confidence
+
+
+# name -> extractor(file) returning a dict with
+#   pages:          per-page text, in page order
+#   ocr_pages:      1-based numbers of image-only pages to OCR (_route_page)
+#   needs_fallback: text is usable but the layout is risky; try the next engine
+PDF_EXTRACTORS = {
+    "pymupdf": _pymupdf_engine,
+    "pdfplumber": _pdfplumber_engine,
+    "ocr": _ocr_engine,
+}
 
 
 # ==================================================
@@ -115,7 +399,7 @@ def _parse_pdf_ocr(file: IO) -> str:
 # ==================================================
 def _parse_docx(file: IO) -> str:
     try:
-        doc = Document(file)
+        doc = docx.Document(file)
         return "\n".join(
             p.text.strip()
             for p in doc.paragraphs
@@ -0,0 +1,94 @@
+# utils/ranking.py
+"""
+Rank stored candidates for one job description.
+
+Candidates are streamed from the database in batches, scored with the
+bulk scorer (same numbers as calculate_match_score) and pushed through a
+bounded min-heap, so memory stays O(k + batch_size) however many results
+are stored.
+
+Each resume is ranked once, on its most recent stored result (resumes
+are identified by content hash, not by candidate name).
+Ordering: match score, then resume strength (calculate_resume_strength,
+stored at analysis time), then core-skill coverage, then most recent.
+"""
+
+import heapq
+from typing import Any, Dict, List, Optional
+
+from .analyzer import prepare_job_description
+from .bulk_scoring import bulk_match_scores
+from .database import iter_candidates
+from .scoring import calculate_match_score
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def rank_candidates(
+    job_description: str = "",
+    k: int = 10,
+    jd_profile: Optional[Dict[str, Any]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> List[Dict[str, Any]]:
+    """
+    Top-k stored candidates for a job description.
+
+    Args:
+        job_description (str): JD text (ignored when jd_profile is given).
+        k (int): Number of candidates to return.
+        jd_profile (dict): Precomputed profile, e.g. JD_PROFILES[role].
+        batch_size (int): Results read and scored per batch.
+
+    Returns:
+        List[Dict]: Best first, one per resume, each with result_id,
+        candidate, timestamp, match_score, resume_strength, core_coverage,
+        matched_skills, missing_skills.
+    """
+    if k <= 0:
+        return []
+
+    if jd_profile is None:
+        jd_profile = prepare_job_description(job_description)
+
+    jd_skills = jd_profile["skills"]
+    core_required = set(jd_profile["core_required"])
+
+    # Min-heap of the k best (key, candidate); heap[0] is the weakest kept
+    heap: List[tuple] = []
+
+    for batch in iter_candidates(batch_size, latest_per_resume=True):
+        scores = bulk_match_scores([c["skills"] for c in batch], [jd_skills]).scores
+
+        for row, candidate in enumerate(batch):
+            if core_required:
+                covered = len(core_required.intersection(candidate["skills"]))
+                core_coverage = covered / len(core_required)
+            else:
+                core_coverage = 0.0
+
+            key = (
+                int(scores[row][0]),
+                candidate["resume_strength"],
+                core_coverage,
+                candidate["id"]
+            )
+            if len(heap) < k:
+                heapq.heappush(heap, (key, candidate))
+            elif key > heap[0][0]:
+                heapq.heapreplace(heap, (key, candidate))
+
+    ranked = []
+    for (score, strength, core_coverage, _), candidate in sorted(heap, key=lambda e: e[0], reverse=True):
+        _, matched, missing = calculate_match_score(candidate["skills"], jd_skills)
+        ranked.append({
+            "result_id": candidate["id"],
+            "candidate": candidate["candidate"],
+            "timestamp": candidate["timestamp"],
+            "match_score": score,
+            "resume_strength": strength,
+            "core_coverage": round(core_coverage, 4),
+            "matched_skills": matched,
+            "missing_skills": missing
+        })
+
+    return ranked
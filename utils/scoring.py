@@ -1,5 +1,5 @@
 # utils/scoring.py
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 
 def calculate_match_score(
@@ -63,3 +63,21 @@ def calculate_resume_strength(
     strength = (0.6 * length_score) + (0.4 * skill_score)
 
     return int(round(strength * 100))
+
+
+def calculate_weighted_score(
+    resume_skills: List[str],
+    weights: Dict[str, float]
+) -> int:
+    """
+    Weighted ATS score (0–100): share of the JD's skill weight covered
+    by the resume, so core and required skills count more than preferred.
+    """
+    total = sum(weights.values())
+    if not total:
+        return 0
+
+    resume_set = set(map(str.lower, resume_skills or []))
+    covered = sum(w for skill, w in weights.items() if skill in resume_set)
+
+    return int(round((covered / total) * 100))
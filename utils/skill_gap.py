@@ -1,21 +1,14 @@
 # utils/skill_gap.py
 from typing import Dict, List
 
+from .taxonomy import get_taxonomy
+
 
 # --------------------------------------------------
 # ATS Skill Priority Buckets (canonical lowercase)
 # --------------------------------------------------
-CORE_SKILLS = {
-    "python", "java", "javascript", "sql",
-    "data analysis", "machine learning",
-    "oop", "git", "rest api"
-}
-
-SECONDARY_SKILLS = {
-    "pandas", "numpy", "excel",
-    "docker", "aws", "flask", "django",
-    "react", "nlp"
-}
+CORE_SKILLS = get_taxonomy().core_skills
+SECONDARY_SKILLS = get_taxonomy().secondary_skills
 
 
 def generate_skill_gap_roadmap(
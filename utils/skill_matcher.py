@@ -0,0 +1,94 @@
+# utils/skill_matcher.py
+"""
+Compiled single-pass skill matcher.
+
+Builds one flat variant -> canonical skills table up front, then scans
+text once: every word-boundary position is a candidate start, and only
+spans that also end on a word boundary (and fit the longest variant) are
+looked up. Semantics are identical to running
+``re.search(r"\\b" + re.escape(variant) + r"\\b")`` for each variant,
+but the cost no longer grows with dictionary size.
+"""
+
+import re
+from typing import Dict, FrozenSet, Iterable, List, Set, Tuple
+
+# Zero-width matches at every \b position (same definition as re's \b)
+_BOUNDARY = re.compile(r"\b")
+
+# Leading characters used to skip start positions no variant can begin at
+_PREFIX_LEN = 2
+
+
+class SkillMatcher:
+    """
+    Precompiled variant -> canonical skill matcher.
+
+    State is a plain dict/set/int so the matcher pickles and loads fast.
+    """
+
+    def __init__(self, skill_map: Dict[str, Iterable[str]]):
+        variants: Dict[str, Tuple[str, ...]] = {}
+
+        for canonical_skill, skill_variants in skill_map.items():
+            for variant in skill_variants:
+                variant = variant.lower()
+                if not variant:
+                    continue
+                hits = variants.get(variant, ())
+                if canonical_skill not in hits:
+                    variants[variant] = hits + (canonical_skill,)
+
+        self.variants = variants
+        self.prefixes: FrozenSet[str] = frozenset(v[:_PREFIX_LEN] for v in variants)
+        self.max_len = max(map(len, variants), default=0)
+
+    @classmethod
+    def from_state(
+        cls,
+        variants: Dict[str, Tuple[str, ...]],
+        prefixes: FrozenSet[str],
+        max_len: int
+    ) -> "SkillMatcher":
+        """Rebuild a matcher from previously compiled state."""
+        matcher = cls.__new__(cls)
+        matcher.variants = variants
+        matcher.prefixes = prefixes
+        matcher.max_len = max_len
+        return matcher
+
+    def find(self, text: str) -> Set[str]:
+        """
+        Return canonical skills whose variants occur in ``text``
+        with a word boundary on both sides.
+        """
+        found: Set[str] = set()
+        if not text or not self.variants:
+            return found
+
+        variants = self.variants
+        prefixes = self.prefixes
+        bounds = [m.start() for m in _BOUNDARY.finditer(text)]
+        count = len(bounds)
+
+        for i, start in enumerate(bounds):
+            if (
+                text[start:start + _PREFIX_LEN] not in prefixes
+                and text[start:start + 1] not in prefixes
+            ):
+                continue
+
+            limit = start + self.max_len
+            for j in range(i + 1, count):
+                end = bounds[j]
+                if end > limit:
+                    break
+                hits = variants.get(text[start:end])
+                if hits:
+                    found.update(hits)
+
+        return found
+
+    def extract(self, text: str) -> List[str]:
+        """Sorted list of canonical skills found in ``text``."""
+        return sorted(self.find(text))
@@ -1,23 +1,12 @@
 # utils/skill_extractor.py
-from typing import List, Set
-import re
+from typing import List
 from .nlp_processing import clean_text
+from .taxonomy import get_taxonomy
 
 # ---------------------------
-# Canonical skills and synonyms
+# Canonical skills and synonyms (shared taxonomy)
 # ---------------------------
-SKILL_SYNONYMS = {
-    "python": ["python"],
-    "java": ["java"],
-    "sql": ["sql", "mysql", "postgresql", "postgres"],
-    "excel": ["excel", "spreadsheets", "ms excel"],
-    "machine learning": ["machine learning", "ml"],
-    "data analysis": ["data analysis", "data analytics", "data analyst"],
-    "deep learning": ["deep learning", "dl"],
-    "nlp": ["nlp", "natural language processing"],
-    "communication": ["communication", "presentations", "verbal communication"],
-    "teamwork": ["teamwork", "collaboration", "cross functional"]
-}
+SKILL_SYNONYMS = get_taxonomy().skill_map
 
 
 def extract_skills(text: str) -> List[str]:
@@ -38,14 +27,5 @@ def extract_skills(text: str) -> List[str]:
     # Clean & normalize text
     text_clean = clean_text(text)
 
-    found_skills: Set[str] = set()
-
-    for canonical_skill, variants in SKILL_SYNONYMS.items():
-        for variant in variants:
-            # Strict word-boundary match (prevents false positives)
-            pattern = rf"\b{re.escape(variant.lower())}\b"
-            if re.search(pattern, text_clean):
-                found_skills.add(canonical_skill)
-                break  # Stop after first match per skill
-
-    return sorted(found_skills)
+    # Strict word-boundary match (prevents false positives)
+    return get_taxonomy().matcher.extract(text_clean)
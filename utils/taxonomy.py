@@ -0,0 +1,182 @@
+# utils/taxonomy.py
+"""
+Skill taxonomy loader.
+
+A single JSON file (canonical skill -> tier + synonyms) is the one source
+for SKILL_MAP, SKILL_SYNONYMS and the CORE/SECONDARY skill buckets.
+
+The compiled form (variant table + tier sets) is pickled to an on-disk
+index keyed by the SHA-256 of the taxonomy file, so only the first process
+after an edit pays the compile cost; every other process just unpickles.
+
+File format:
+    {
+      "version": 1,
+      "skills": {
+        "python": {"tier": "core", "synonyms": ["python"]},
+        ...
+      }
+    }
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional, Union
+
+from .cache import CACHE_DIR
+from .skill_matcher import SkillMatcher
+
+TAXONOMY_PATH = Path(
+    os.environ.get(
+        "RESUME_ANALYZER_TAXONOMY",
+        Path(__file__).resolve().parent.parent / "data" / "skill_taxonomy.json"
+    )
+)
+INDEX_DIR = CACHE_DIR / "taxonomy"
+
+# Bump when the pickled index layout changes
+INDEX_FORMAT = 1
+
+TIERS = ("core", "secondary", "general")
+
+
+class SkillTaxonomy:
+    """Compiled skill taxonomy shared by extraction, scoring and roadmaps."""
+
+    def __init__(
+        self,
+        skill_map: Dict[str, List[str]],
+        tiers: Dict[str, str],
+        matcher: SkillMatcher,
+        digest: str = ""
+    ):
+        self.skill_map = skill_map
+        self.tiers = tiers
+        self.matcher = matcher
+        self.digest = digest
+
+        self.core_skills: FrozenSet[str] = frozenset(
+            s for s, t in tiers.items() if t == "core"
+        )
+        self.secondary_skills: FrozenSet[str] = frozenset(
+            s for s, t in tiers.items() if t == "secondary"
+        )
+
+    @property
+    def vocabulary(self) -> List[str]:
+        """Canonical skills in file order."""
+        return list(self.skill_map)
+
+
+# --------------------------------------------------
+# Compile
+# --------------------------------------------------
+def compile_taxonomy(data: Dict, digest: str = "") -> SkillTaxonomy:
+    """Build a SkillTaxonomy from the parsed JSON document."""
+    skill_map: Dict[str, List[str]] = {}
+    tiers: Dict[str, str] = {}
+
+    for skill, entry in (data.get("skills") or {}).items():
+        canonical = skill.strip().lower()
+        if not canonical:
+            continue
+
+        tier = (entry.get("tier") or "general").lower()
+        if tier not in TIERS:
+            raise ValueError(f"Unknown tier '{tier}' for skill '{canonical}'")
+
+        variants = [canonical]
+        for synonym in entry.get("synonyms") or []:
+            synonym = synonym.strip().lower()
+            if synonym and synonym not in variants:
+                variants.append(synonym)
+
+        skill_map[canonical] = variants
+        tiers[canonical] = tier
+
+    return SkillTaxonomy(skill_map, tiers, SkillMatcher(skill_map), digest)
+
+
+def _index_path(taxonomy_path: Path, digest: str) -> Path:
+    return INDEX_DIR / f"{taxonomy_path.stem}-{digest[:16]}.pkl"
+
+
+def _read_index(index_path: Path, digest: str) -> Optional[SkillTaxonomy]:
+    try:
+        with open(index_path, "rb") as f:
+            payload = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logging.warning(f"Ignoring unreadable taxonomy index {index_path}: {e}")
+        return None
+
+    if payload.get("format") != INDEX_FORMAT or payload.get("digest") != digest:
+        return None
+
+    return SkillTaxonomy(
+        payload["skill_map"],
+        payload["tiers"],
+        SkillMatcher.from_state(
+            payload["variants"], payload["prefixes"], payload["max_len"]
+        ),
+        digest
+    )
+
+
+def _write_index(index_path: Path, taxonomy: SkillTaxonomy) -> None:
+    payload = {
+        "format": INDEX_FORMAT,
+        "digest": taxonomy.digest,
+        "skill_map": taxonomy.skill_map,
+        "tiers": taxonomy.tiers,
+        "variants": taxonomy.matcher.variants,
+        "prefixes": taxonomy.matcher.prefixes,
+        "max_len": taxonomy.matcher.max_len,
+    }
+
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = index_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, index_path)  # atomic: concurrent readers never see partial files
+    except OSError as e:
+        logging.warning(f"Could not write taxonomy index {index_path}: {e}")
+
+
+# --------------------------------------------------
+# Load
+# --------------------------------------------------
+def load_taxonomy(path: Union[str, Path, None] = None) -> SkillTaxonomy:
+    """
+    Load a taxonomy file, using the prebuilt index when it matches
+    the file's content hash and rebuilding it otherwise.
+    """
+    path = Path(path or TAXONOMY_PATH)
+    raw = path.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    index_path = _index_path(path, digest)
+
+    taxonomy = _read_index(index_path, digest)
+    if taxonomy is not None:
+        return taxonomy
+
+    taxonomy = compile_taxonomy(json.loads(raw), digest)
+    _write_index(index_path, taxonomy)
+    return taxonomy
+
+
+_TAXONOMY: Optional[SkillTaxonomy] = None
+
+
+def get_taxonomy() -> SkillTaxonomy:
+    """Process-wide taxonomy (loaded on first use)."""
+    global _TAXONOMY
+    if _TAXONOMY is None:
+        _TAXONOMY = load_taxonomy()
+    return _TAXONOMY
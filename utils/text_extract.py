@@ -1,8 +1,31 @@
 # utils/pdf_parser.py
-import fitz  # PyMuPDF
-from typing import Union, IO
+from typing import Any, Dict, List, Union, IO
 import logging
 
+from .lazy import lazy_import, module_available
+
+# ---------------------------
+# Check PyMuPDF availability
+# ---------------------------
+# Checked without importing: PyMuPDF is loaded on the first PDF opened
+PYMUPDF_AVAILABLE = module_available("fitz")
+fitz = lazy_import("fitz") if PYMUPDF_AVAILABLE else None
+
+
+def _open_pdf(file: Union[str, bytes, IO]):
+    """Open a path, raw bytes or file-like object with PyMuPDF."""
+    if isinstance(file, bytes):
+        return fitz.open(stream=file, filetype="pdf")
+
+    if hasattr(file, "read"):
+        file.seek(0)
+        pdf_bytes = file.read()
+        if not pdf_bytes:
+            return None
+        return fitz.open(stream=pdf_bytes, filetype="pdf")
+
+    return fitz.open(file)
+
 
 def extract_text_from_pdf(file: Union[str, IO]) -> str:
     """
@@ -19,22 +42,16 @@ def extract_text_from_pdf(file: Union[str, IO]) -> str:
     if not file:
         return ""
 
+    if not PYMUPDF_AVAILABLE:
+        logging.warning("PyMuPDF not installed. Cannot extract PDF text.")
+        return ""
+
     text_pages = []
 
     try:
-        # Case 1: File-like object (Streamlit / BytesIO)
-        if hasattr(file, "read"):
-            file.seek(0)
-            pdf_bytes = file.read()
-
-            if not pdf_bytes:
-                return ""
-
-            pdf = fitz.open(stream=pdf_bytes, filetype="pdf")
-
-        # Case 2: File path
-        else:
-            pdf = fitz.open(file)
+        pdf = _open_pdf(file)
+        if pdf is None:
+            return ""
 
         # Extract text page-by-page
         for page in pdf:
@@ -51,3 +68,92 @@ def extract_text_from_pdf(file: Union[str, IO]) -> str:
         return ""
 
     return "\n\n".join(text_pages)
+
+
+def extract_pdf_pages(file: Union[str, bytes, IO]) -> List[Dict[str, Any]]:
+    """
+    Page-by-page PyMuPDF extraction with layout hints.
+
+    Returns:
+        List[Dict]: One entry per page with
+            - text: str
+            - multi_column: bool (side-by-side text blocks detected)
+            - image_coverage: float (0-1, share of the page covered by images)
+    """
+    if not file or not PYMUPDF_AVAILABLE:
+        return []
+
+    pages: List[Dict[str, Any]] = []
+
+    try:
+        pdf = _open_pdf(file)
+        if pdf is None:
+            return []
+
+        for page in pdf:
+            layout = page.get_text("dict")
+            lines = [
+                line["bbox"]
+                for block in layout["blocks"] if block.get("type") == 0
+                for line in block["lines"]
+                if any(span["text"].strip() for span in line["spans"])
+            ]
+            pages.append({
+                "text": page.get_text("text").strip(),
+                "multi_column": _is_multi_column(lines, page.rect.width),
+                "image_coverage": image_coverage(
+                    [info["bbox"] for info in page.get_image_info()],
+                    page.rect.width,
+                    page.rect.height
+                )
+            })
+
+        pdf.close()
+
+    except Exception as e:
+        logging.error(f"PDF parsing failed: {e}")
+        return []
+
+    return pages
+
+
+def _is_multi_column(lines: List[tuple], page_width: float) -> bool:
+    """
+    True when most left-half text lines have a right-half line on the same
+    row, i.e. the page is laid out in columns that plain extraction may
+    interleave. A few shared rows (right-aligned dates) do not count.
+    """
+    if not page_width:
+        return False
+
+    # bbox = (x0, y0, x1, y1)
+    left = [b for b in lines if b[2] <= page_width * 0.6]
+    right = [b for b in lines if b[0] >= page_width * 0.4]
+    if len(left) < 3 or not right:
+        return False
+
+    side_by_side = sum(
+        1 for lb in left
+        if any(rb is not lb and lb[1] < rb[3] and rb[1] < lb[3] for rb in right)
+    )
+
+    return side_by_side >= 3 and side_by_side / len(left) >= 0.3
+
+
+def image_coverage(bboxes: List[tuple], page_width: float, page_height: float) -> float:
+    """
+    Fraction of the page area covered by image bboxes (x0, y0, x1, y1),
+    clipped to the page. Overlaps are not de-duplicated; result is capped at 1.
+    """
+    page_area = page_width * page_height
+    if page_area <= 0:
+        return 0.0
+
+    covered = 0.0
+    for x0, y0, x1, y1 in bboxes:
+        w = min(x1, page_width) - max(x0, 0)
+        h = min(y1, page_height) - max(y0, 0)
+        if w > 0 and h > 0:
+            covered += w * h
+
+    return min(covered / page_area, 1.0)
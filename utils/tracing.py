@@ -0,0 +1,243 @@
+# utils/tracing.py
+"""
+Lightweight stage timing for the analysis pipeline.
+
+    trace = start_trace("analyze_resume", candidate=name)
+    ...                      # stage 1
+    trace.lap("parse")       # time since the previous lap
+    with span("parse.ocr"):  # explicit span, attaches to the active trace
+        ...
+    record = trace.finish()  # {"name", "attrs", "total_ms", "spans"}, sent to sinks
+
+Disabled (the default) start_trace() returns a shared no-op trace and
+span() a shared no-op context manager, so instrumented code pays one
+attribute lookup and an empty call per stage.
+
+Enable with RESUME_ANALYZER_TRACE=1 (log sink) and/or
+RESUME_ANALYZER_TRACE_PROM=<path> (Prometheus textfile sink), or in code
+with configure(enabled=True, sinks=[...]). A sink is any callable taking
+the finished record, so a plain function works as a callback sink.
+"""
+
+import atexit
+import logging
+import os
+import threading
+import time
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+Sink = Callable[[Dict[str, Any]], None]
+
+ENABLED = False
+_SINKS: List[Sink] = []
+_CURRENT: ContextVar[Optional["Trace"]] = ContextVar("resume_analyzer_trace", default=None)
+
+
+# --------------------------------------------------
+# Traces and Spans
+# --------------------------------------------------
+class Trace:
+    """Accumulates named durations (seconds) for one pipeline run."""
+
+    __slots__ = ("name", "attrs", "spans", "_start", "_last", "_token")
+
+    def __init__(self, name: str, attrs: Dict[str, Any]):
+        self.name = name
+        self.attrs = attrs
+        self.spans: Dict[str, float] = {}
+        self._start = self._last = time.perf_counter()
+        self._token = _CURRENT.set(self)
+
+    def lap(self, name: str) -> None:
+        """Record the time since the previous lap (or the trace start)."""
+        now = time.perf_counter()
+        self.spans[name] = self.spans.get(name, 0.0) + now - self._last
+        self._last = now
+
+    def span(self, name: str) -> "_Span":
+        return _Span(self, name)
+
+    def timings_ms(self) -> Dict[str, float]:
+        return {name: round(seconds * 1000, 3) for name, seconds in self.spans.items()}
+
+    def finish(self) -> Dict[str, Any]:
+        if self._token is None:
+            return {}
+        _CURRENT.reset(self._token)
+        self._token = None
+
+        record = {
+            "name": self.name,
+            "attrs": self.attrs,
+            "total_ms": round((time.perf_counter() - self._start) * 1000, 3),
+            "spans": self.timings_ms(),
+        }
+        for sink in list(_SINKS):
+            try:
+                sink(record)
+            except Exception as e:
+                logging.warning(f"Trace sink {sink!r} failed: {e}")
+        return record
+
+
+class _Span:
+    __slots__ = ("trace", "name", "start")
+
+    def __init__(self, trace: Trace, name: str):
+        self.trace = trace
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        spans = self.trace.spans
+        spans[self.name] = spans.get(self.name, 0.0) + time.perf_counter() - self.start
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class _NullTrace:
+    """Stand-in when tracing is off, or when nested inside another trace."""
+
+    __slots__ = ()
+
+    def lap(self, name: str) -> None:
+        pass
+
+    def span(self, name: str) -> _NullSpan:
+        return NULL_SPAN
+
+    def timings_ms(self) -> Dict[str, float]:
+        return {}
+
+    def finish(self) -> Dict[str, Any]:
+        return {}
+
+
+NULL_SPAN = _NullSpan()
+NULL_TRACE = _NullTrace()
+
+
+def start_trace(name: str, **attrs) -> Union[Trace, _NullTrace]:
+    """
+    Begin a trace, or return the no-op trace when tracing is disabled or
+    another trace is already active (its spans then land in the outer one).
+    """
+    if not ENABLED or _CURRENT.get() is not None:
+        return NULL_TRACE
+    return Trace(name, attrs)
+
+
+def span(name: str) -> Union[_Span, _NullSpan]:
+    """Time a block under the active trace (no-op if there is none)."""
+    if not ENABLED:
+        return NULL_SPAN
+    trace = _CURRENT.get()
+    if trace is None:
+        return NULL_SPAN
+    return _Span(trace, name)
+
+
+# --------------------------------------------------
+# Sinks
+# --------------------------------------------------
+class LogSink:
+    """One log line per trace: name, attrs, total and every span in ms."""
+
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.INFO):
+        self.logger = logger or logging.getLogger("resume_analyzer.trace")
+        self.level = level
+
+    def __call__(self, record: Dict[str, Any]) -> None:
+        fields = [f"trace={record['name']}"]
+        fields += [f"{k}={v}" for k, v in record["attrs"].items()]
+        fields.append(f"total_ms={record['total_ms']}")
+        fields += [f"{k}_ms={v}" for k, v in record["spans"].items()]
+        self.logger.log(self.level, " ".join(fields))
+
+
+class PrometheusTextfileSink:
+    """
+    Cumulative per-span duration sums and counts in Prometheus text format,
+    for node_exporter's textfile collector. The file is rewritten atomically
+    at most once per `interval` seconds (and at exit).
+    """
+
+    def __init__(self, path: Union[str, Path], interval: float = 5.0,
+                 prefix: str = "resume_analyzer"):
+        self.path = Path(path)
+        self.interval = interval
+        self.prefix = prefix
+        self._sums: Dict[Tuple[str, str], float] = {}
+        self._counts: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+        self._written = 0.0
+        atexit.register(self.write)
+
+    def __call__(self, record: Dict[str, Any]) -> None:
+        with self._lock:
+            spans = dict(record["spans"], total=record["total_ms"])
+            for stage, ms in spans.items():
+                key = (record["name"], stage)
+                self._sums[key] = self._sums.get(key, 0.0) + ms / 1000
+                self._counts[key] = self._counts.get(key, 0) + 1
+            due = time.monotonic() - self._written >= self.interval
+        if due:
+            self.write()
+
+    def write(self) -> None:
+        with self._lock:
+            metric = f"{self.prefix}_stage_seconds"
+            lines = [
+                f"# HELP {metric} Time spent per pipeline stage.",
+                f"# TYPE {metric} summary",
+            ]
+            for (trace, stage), total in sorted(self._sums.items()):
+                labels = f'trace="{trace}",stage="{stage}"'
+                lines.append(f"{metric}_sum{{{labels}}} {total:.6f}")
+                lines.append(f"{metric}_count{{{labels}}} {self._counts[(trace, stage)]}")
+            self._written = time.monotonic()
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text("\n".join(lines) + "\n")
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logging.warning(f"Could not write trace metrics {self.path}: {e}")
+
+
+def configure(enabled: bool = True, sinks: Optional[List[Sink]] = None) -> None:
+    """Turn tracing on/off; `sinks` (if given) replaces the current sinks."""
+    global ENABLED
+    ENABLED = enabled
+    if sinks is not None:
+        _SINKS[:] = sinks
+
+
+def add_sink(sink: Sink) -> None:
+    _SINKS.append(sink)
+
+
+# --------------------------------------------------
+# Environment Configuration
+# --------------------------------------------------
+if os.environ.get("RESUME_ANALYZER_TRACE", "").lower() in ("1", "true", "yes"):
+    configure(True, [LogSink()])
+
+if os.environ.get("RESUME_ANALYZER_TRACE_PROM"):
+    configure(True)
+    add_sink(PrometheusTextfileSink(os.environ["RESUME_ANALYZER_TRACE_PROM"]))